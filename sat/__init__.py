@@ -1,7 +1,16 @@
 # Shape Animation Tool - Updated for Maya 2025 / Python 3
-from . import main
+# Only open the window in an interactive Maya session, so batch workers
+# (python -m sat.batch) can import the package
+try:
+    import maya.cmds as cmds
+    interactive = not cmds.about(batch=True)
+except Exception:
+    interactive = False
 
-sat_win = main.MainWindow()
-sat_win.show()
-sat_win.connectSignals()
-sat_win.start()
+if interactive:
+    from . import main
+
+    sat_win = main.MainWindow()
+    sat_win.show()
+    sat_win.connectSignals()
+    sat_win.start()
@@ -0,0 +1,299 @@
+# Shape Animation Tool - Updated for Maya 2025 / Python 3
+"""
+Apply SAT operations to many scene files with a pool of mayapy workers.
+
+    python -m sat.batch validate shot010.ma shot020.ma --workers 4
+    python -m sat.batch freeze --scene-list shots.txt --arg save=1 --output results.jsonl
+    python -m sat.batch quantize shot010.ma --arg bits=8 --arg save=1
+    python -m sat.batch validate a.ma b.ma --standin
+
+Every worker is one long-lived interpreter that opens scene after scene;
+jobs and results travel as JSON lines over its stdin/stdout.  --standin runs
+the workers with the current Python and stand-in maya modules, to exercise
+the scheduler without Maya.
+"""
+import argparse
+import json
+import os
+import queue
+import subprocess
+import sys
+import threading
+import time
+import traceback
+
+OPERATIONS = {}
+# Marks result lines, anything else mayapy or a scene prints on stdout is skipped
+resultPrefix = '@@satResult '
+
+
+def operation(name):
+    """Register a batch operation: fn(args) -> JSON serialisable result."""
+    def register(fn):
+        OPERATIONS[name] = fn
+        return fn
+
+    return register
+
+
+@operation('validate')
+def validateScene(args):
+    from . import integrity
+    report = integrity.scan()
+    return {'issues': integrity.issueCount(report), 'report': report}
+
+
+@operation('repair')
+def repairScene(args):
+    from . import integrity
+    from . import storage
+    report = integrity.scan()
+    storage.setLayers(integrity.repair(report, storage.listLayers()))
+    return {'issues': integrity.issueCount(report)}
+
+
+@operation('report')
+def reportScene(args):
+    from . import report
+    return {'layers': report.layerReport(frames=int(args.get('frames', 8)))}
+
+
+@operation('freeze')
+def freezeScene(args):
+    from . import freeze
+    from . import storage
+    results = {}
+    for layer in storage.listLayers():
+        if freeze.isFrozen(layer):
+            results[layer] = {'skipped': 'already frozen'}
+            continue
+        results[layer] = freeze.freezeLayer(layer)
+
+    return {'layers': results}
+
+
+@operation('quantize')
+def quantizeScene(args):
+    from . import quantize
+    from . import storage
+    quantize.installCallbacks()
+    bits = int(args.get('bits', 16))
+    return {'layers': dict((layer, quantize.setQuantized(layer, bits)) for layer in storage.listLayers())}
+
+
+@operation('export')
+def exportScene(args):
+    import numpy as np
+    import maya.cmds as cmds
+    from . import freeze
+    from . import layers
+    from . import storage
+    folder = args.get('folder') or os.path.dirname(cmds.file(query=True, sceneName=True))
+    files = []
+    for layer in storage.listLayers():
+        if freeze.isFrozen(layer):
+            keys = freeze.frozenKeys(layer)
+        else:
+            bs = layers.bsName(layer)
+            pairs = layers.getKeyTargets(bs)
+            count = layers.vertexCount(layers.meshName(layer))
+            keys = dict((t, layers.sparsify(layers.getKeyDelta(bs, pair, count))) for t, pair in pairs.items())
+        if len(keys) == 0:
+            continue
+        times = sorted(keys.keys())
+        arrays = {'times': np.array(times)}
+        for i, t in enumerate(times):
+            indices, values = keys[t]
+            arrays['indices_%d' % i] = indices
+            arrays['values_%d' % i] = values
+
+        path = os.path.join(folder, layer.replace(':', '_') + '.npz')
+        np.savez_compressed(path, **arrays)
+        files.append(path)
+
+    return {'files': files}
+
+
+def _jsonSafe(value):
+    return json.loads(json.dumps(value, default=str))
+
+
+def runWorker(operationName, standin=False):
+    """Worker loop: read job lines from stdin, answer one result line per job."""
+    if standin:
+        from . import standin as standinModule
+        standinModule.install()
+    import maya.standalone
+    maya.standalone.initialize(name='python')
+    import maya.cmds as cmds
+    from . import quantize
+    fn = OPERATIONS[operationName]
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        job = json.loads(line)
+        start = time.time()
+        result = {'scene': job['scene'], 'operation': operationName, 'ok': True}
+        try:
+            cmds.file(job['scene'], open=True, force=True, prompt=False)
+            # operations see quantized layers at full precision
+            quantize.decodeScene()
+            result['result'] = _jsonSafe(fn(job.get('args', {})))
+            if str(job.get('args', {}).get('save', '0')) not in ('0', '', 'false', 'False'):
+                cmds.file(save=True, force=True)
+        except Exception as e:
+            result['ok'] = False
+            result['error'] = '%s: %s' % (type(e).__name__, e)
+            result['traceback'] = traceback.format_exc()
+        result['seconds'] = time.time() - start
+        sys.stdout.write(resultPrefix + json.dumps(result) + '\n')
+        sys.stdout.flush()
+
+    return
+
+
+class Worker(object):
+    """One mayapy process of the pool, restarted when it dies."""
+
+    def __init__(self, command, env):
+        self.command = command
+        self.env = env
+        self.process = None
+
+    def start(self):
+        self.process = subprocess.Popen(self.command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, env=self.env, universal_newlines=True, bufsize=1)
+
+    def run(self, job):
+        if self.process is None or self.process.poll() is not None:
+            self.start()
+        try:
+            self.process.stdin.write(json.dumps(job) + '\n')
+            self.process.stdin.flush()
+            while True:
+                line = self.process.stdout.readline()
+                if not line or line.startswith(resultPrefix):
+                    break
+                sys.stderr.write(line)
+        except (IOError, OSError):
+            line = ''
+        if not line:
+            code = self.process.poll()
+            self.process = None
+            return {'scene': job['scene'], 'ok': False, 'error': 'worker exited with code %s' % code}
+        try:
+            return json.loads(line[len(resultPrefix):])
+        except ValueError as e:
+            return {'scene': job['scene'], 'ok': False, 'error': 'unreadable worker result: %s' % e}
+
+    def stop(self):
+        if self.process is not None and self.process.poll() is None:
+            self.process.stdin.close()
+            self.process.wait()
+        self.process = None
+
+
+def runBatch(scenes, operationName, workers=4, mayapy=None, args=None, standin=False, onResult=None):
+    """
+    Run an operation on every scene with a pool of worker processes and
+    return the result dicts in scene order.
+
+    Arguments:
+    scenes : list : scene file paths.
+    operationName : string : a key of OPERATIONS.
+    workers : int : number of worker processes.
+    mayapy : string : interpreter of the workers, mayapy next to the running
+            Python by default.  Ignored with standin.
+    args : dict : arguments passed to the operation of every scene.
+    standin : bool : run the workers without Maya, on stand-in modules.
+    onResult : callable : called with every result as soon as it arrives.
+    """
+    if operationName not in OPERATIONS:
+        raise ValueError("Unknown operation '%s', use one of %s" % (operationName, ', '.join(sorted(OPERATIONS))))
+    if standin or mayapy is None:
+        mayapy = sys.executable
+    command = [mayapy, '-m', 'sat.batch', '--worker', operationName]
+    if standin:
+        command.append('--standin')
+    env = dict(os.environ)
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env['PYTHONPATH'] = os.pathsep.join([root] + [p for p in [env.get('PYTHONPATH')] if p])
+    jobs = queue.Queue()
+    for index, scene in enumerate(scenes):
+        jobs.put((index, {'scene': scene, 'args': args or {}}))
+
+    results = [None] * len(scenes)
+    lock = threading.Lock()
+
+    def feed():
+        worker = Worker(command, env)
+        try:
+            while True:
+                try:
+                    index, job = jobs.get_nowait()
+                except queue.Empty:
+                    return
+                try:
+                    result = worker.run(job)
+                except Exception as e:
+                    result = {'scene': job['scene'], 'ok': False, 'error': '%s: %s' % (type(e).__name__, e)}
+                with lock:
+                    results[index] = result
+                    if onResult is not None:
+                        onResult(result)
+
+        finally:
+            worker.stop()
+
+    threads = [threading.Thread(target=feed) for _ in range(max(1, min(workers, len(scenes))))]
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    for index, scene in enumerate(scenes):
+        if results[index] is None:
+            results[index] = {'scene': scene, 'ok': False, 'error': 'no result'}
+
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m sat.batch', description='Apply a SAT operation to many Maya scenes.')
+    parser.add_argument('operation', choices=sorted(OPERATIONS))
+    parser.add_argument('scenes', nargs='*', help='scene files')
+    parser.add_argument('--scene-list', help='text file with one scene path per line')
+    parser.add_argument('--workers', type=int, default=max(1, (os.cpu_count() or 2) // 2))
+    parser.add_argument('--mayapy', help='mayapy executable of the workers')
+    parser.add_argument('--arg', action='append', default=[], metavar='KEY=VALUE', help='operation argument, can be repeated')
+    parser.add_argument('--output', help='write JSON lines results to this file instead of stdout')
+    parser.add_argument('--standin', action='store_true', help='run without Maya on stand-in maya modules')
+    parser.add_argument('--worker', action='store_true', help=argparse.SUPPRESS)
+    options = parser.parse_args(argv)
+    if options.worker:
+        runWorker(options.operation, options.standin)
+        return 0
+    scenes = list(options.scenes)
+    if options.scene_list:
+        with open(options.scene_list) as f:
+            scenes.extend(line.strip() for line in f if line.strip())
+    args = dict(a.split('=', 1) for a in options.arg)
+    out = open(options.output, 'w') if options.output else sys.stdout
+    start = time.time()
+
+    def write(result):
+        out.write(json.dumps(result) + '\n')
+        out.flush()
+
+    try:
+        results = runBatch(scenes, options.operation, options.workers, options.mayapy, args, options.standin, write)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    failed = [r for r in results if not r.get('ok')]
+    sys.stderr.write('%d scenes, %d failed, %.1f s\n' % (len(results), len(failed), time.time() - start))
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
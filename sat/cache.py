@@ -0,0 +1,127 @@
+# Shape Animation Tool - Updated for Maya 2025 / Python 3
+from collections import OrderedDict
+
+from . import layers
+
+
+class LRUCache(object):
+    """
+    Size-bounded least-recently-used cache for point arrays.
+
+    Entries are evicted oldest-first as soon as the summed byte size of the
+    stored values goes over maxBytes.  Hit and miss counters are kept so the
+    UI can show how effective the cache is.
+
+    Arguments:
+    maxBytes : int : memory budget for all stored values, in bytes.
+    sizeOf : callable : returns the byte size of a value.  Defaults to the
+            value's nbytes attribute, which covers numpy arrays.
+    """
+
+    def __init__(self, maxBytes=256 * 1024 * 1024, sizeOf=None):
+        self.maxBytes = maxBytes
+        if sizeOf is not None:
+            self._sizeOf = sizeOf
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def keys(self):
+        return list(self._data.keys())
+
+    def get(self, key, default=None):
+        if key in self._data:
+            self._data.move_to_end(key)
+            self.hits += 1
+            return self._data[key]
+        self.misses += 1
+        return default
+
+    def put(self, key, value):
+        if key in self._data:
+            self.nbytes -= self._sizeOf(self._data.pop(key))
+        size = self._sizeOf(value)
+        if size > self.maxBytes:
+            return
+        self._data[key] = value
+        self.nbytes += size
+        while self.nbytes > self.maxBytes and self._data:
+            _, old = self._data.popitem(last=False)
+            self.nbytes -= self._sizeOf(old)
+
+    def pop(self, key):
+        if key in self._data:
+            self.nbytes -= self._sizeOf(self._data.pop(key))
+
+    def invalidate(self, predicate):
+        """
+        Drop every entry whose key matches predicate(key).  Returns the number
+        of removed entries.
+        """
+        stale = [key for key in self._data if predicate(key)]
+        for key in stale:
+            self.pop(key)
+        return len(stale)
+
+    def resize(self, maxBytes):
+        self.maxBytes = maxBytes
+        while self.nbytes > self.maxBytes and self._data:
+            _, old = self._data.popitem(last=False)
+            self.nbytes -= self._sizeOf(old)
+
+    def clear(self):
+        self._data.clear()
+        self.nbytes = 0
+
+    def resetStats(self):
+        self.hits = 0
+        self.misses = 0
+
+    def hitRate(self):
+        total = self.hits + self.misses
+        if total == 0:
+            return 0.0
+        return float(self.hits) / total
+
+    def _sizeOf(self, value):
+        return getattr(value, 'nbytes', 0)
+
+
+class KeyPointCache(LRUCache):
+    """
+    Bounded cache of mesh points evaluated at SAT key times, shared by every
+    feature that displays key shapes.  Entries are keyed by (mesh, time).
+
+    The weight curves of a layer are keyed to fixed values on every key time,
+    so editing, adding or removing one key of a mesh's only layer never
+    changes the evaluated shape at its other key times, and only that key
+    has to be invalidated.  When several layers deform the mesh, the cached
+    times of one layer fall between the keys of the others, so every time of
+    the mesh has to be invalidated.
+    """
+
+    def key(self, mesh, time):
+        return (mesh, round(time, 3))
+
+    def points(self, mesh, time):
+        """Return the (n, 3) points of mesh at time, evaluating them on a miss."""
+        key = self.key(mesh, time)
+        points = self.get(key)
+        if points is None:
+            points = layers.getPoints(mesh, time)
+            self.put(key, points)
+        return points
+
+    def invalidateKeys(self, mesh, times=None):
+        """Drop the cached shapes of mesh at times, or all of them if times is None."""
+        if times is None:
+            return self.invalidate(lambda key: key[0] == mesh)
+        stale = set(self.key(mesh, time) for time in times)
+        return self.invalidate(lambda key: key in stale)
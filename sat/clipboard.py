@@ -0,0 +1,87 @@
+# Shape Animation Tool - Updated for Maya 2025 / Python 3
+import maya.cmds as cmds
+import numpy as np
+
+from . import freeze
+from . import layers
+from . import retarget
+from . import utils
+from . import workers
+from .cache import LRUCache
+
+clipboard = {}
+correspondences = LRUCache(512 * 1024 * 1024, sizeOf=lambda value: value[0].nbytes + value[1].nbytes)
+
+
+def copyKeys(layer, times):
+    """
+    Copy the SAT keys of layer at times to the clipboard as sparse deltas.
+    The rest shape and triangles of the mesh are kept with them, so keys can
+    be pasted after the source mesh is gone.  Returns the copied times.
+    """
+    global clipboard
+    mesh = layers.meshName(layer)
+    bs = layers.bsName(layer)
+    count = layers.vertexCount(mesh)
+    if freeze.isFrozen(layer):
+        frozen = freeze.frozenKeys(layer)
+        keys = [(time,) + frozen[time] for time in sorted(times) if time in frozen]
+    else:
+        pairs = layers.getKeyTargets(bs)
+        keys = []
+        for time in sorted(times):
+            if time in pairs:
+                indices, values = layers.sparsify(layers.getKeyDelta(bs, pairs[time], count))
+                keys.append((time, indices, values))
+
+    if len(keys) == 0:
+        return []
+    clipboard = {'layer': layer, 'mesh': mesh, 'topology': layers.topologyHash(mesh), 'vertexCount': count, 'rest': layers.getRestPoints(mesh), 'triangles': layers.getTriangles(mesh), 'keys': keys}
+    return [time for time, _, _ in keys]
+
+
+def getCorrespondence(mesh, topology):
+    """
+    Return the (indices, weights) correspondence from the clipboard mesh to
+    mesh, computed once per mesh pair.
+    """
+    key = (clipboard['mesh'], clipboard['topology'], mesh, topology)
+    correspondence = correspondences.get(key)
+    if correspondence is None:
+        indices, weights, _ = retarget.buildCorrespondence(clipboard['rest'], clipboard['triangles'], layers.getRestPoints(mesh))
+        correspondence = (indices, weights)
+        correspondences.put(key, correspondence)
+    return correspondence
+
+
+def pasteKeys(layer, time=None):
+    """
+    Paste the clipboard keys into layer in one batched write and one undo step.
+
+    Same topology pastes copy the deltas as they are, other meshes go through
+    a cached vertex correspondence.  The first copied key lands on time and
+    the spacing of the keys is kept; by default keys keep their own times.
+    Returns the pasted key times.
+    """
+    if len(clipboard) == 0:
+        return []
+    if freeze.isFrozen(layer):
+        cmds.warning('Unfreeze ' + layer + ' before pasting keys into it')
+        return []
+    mesh = layers.meshName(layer)
+    topology = layers.topologyHash(mesh)
+    keys = clipboard['keys']
+    if topology != clipboard['topology']:
+        indices, weights = getCorrespondence(mesh, topology)
+        def transfer(key):
+            keyTime, keyIndices, keyValues = key
+            delta = np.zeros((clipboard['vertexCount'], 3))
+            delta[keyIndices] = keyValues
+            return (keyTime,) + layers.sparsify(retarget.transferDelta(delta, indices, weights))
+
+        keys = workers.map(transfer, keys, 'Paste')
+    shift = 0.0 if time is None else time - keys[0][0]
+    with utils.undoChunk('satPaste'):
+        written = layers.createKeys(layer, [(keyTime + shift, keyIndices, keyValues) for keyTime, keyIndices, keyValues in keys])
+
+    return sorted(written.keys())
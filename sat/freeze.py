@@ -0,0 +1,161 @@
+# Shape Animation Tool - Updated for Maya 2025 / Python 3
+import base64
+import zlib
+
+import maya.cmds as cmds
+import numpy as np
+
+from . import layers
+from . import storage
+from . import utils
+
+
+def isFrozen(layer):
+    bs = layers.bsName(layer)
+    return cmds.objExists(bs) and cmds.attributeQuery('satFrozen', node=bs, exists=True) and cmds.getAttr(bs + '.satFrozen')
+
+
+def encodeTargets(targets):
+    """
+    Pack a dict of target index -> sparse (indices, values) to an ASCII
+    string: the ids, vertex counts, indices and float64 values as four
+    flat arrays, zlib compressed together.
+    """
+    ids = sorted(targets.keys())
+    counts = np.array([len(targets[i][0]) for i in ids], dtype=np.int64)
+    indices = np.concatenate([np.asarray(targets[i][0], dtype=np.int32) for i in ids] + [np.zeros(0, dtype=np.int32)])
+    values = np.concatenate([np.asarray(targets[i][1], dtype=np.float64).reshape(-1, 3) for i in ids] + [np.zeros((0, 3))])
+    data = np.array(ids, dtype=np.int64).tobytes() + counts.tobytes() + indices.tobytes() + values.tobytes()
+    header = np.array([len(ids), len(indices)], dtype=np.int64).tobytes()
+    return base64.b64encode(zlib.compress(header + data, 6)).decode('ascii')
+
+
+def decodeTargets(data):
+    raw = zlib.decompress(base64.b64decode(data))
+    targetCount, total = np.frombuffer(raw, dtype=np.int64, count=2)
+    offset = 16
+    ids = np.frombuffer(raw, dtype=np.int64, count=targetCount, offset=offset)
+    offset += 8 * targetCount
+    counts = np.frombuffer(raw, dtype=np.int64, count=targetCount, offset=offset)
+    offset += 8 * targetCount
+    indices = np.frombuffer(raw, dtype=np.int32, count=total, offset=offset).astype(np.int64)
+    offset += 4 * total
+    values = np.frombuffer(raw, dtype=np.float64, count=3 * total, offset=offset).reshape(-1, 3)
+    targets = {}
+    start = 0
+    for i, count in zip(ids, counts):
+        targets[int(i)] = (indices[start:start + count], values[start:start + count].copy())
+        start += count
+
+    return targets
+
+
+def snapshotTargets(snapshot):
+    # Layers frozen before the targets were packed keep them as a plain dict
+    return decodeTargets(snapshot['packed']) if 'packed' in snapshot else snapshot['targets']
+
+
+def snapshotKeys(snapshot, count):
+    """Return the sparse key deltas of a freeze snapshot as a dict of time -> (indices, values)."""
+    targets = snapshotTargets(snapshot)
+    keys = {}
+    for time, (id0, id1) in snapshot['pairs'].items():
+        delta = np.zeros((count, 3))
+        delta[targets[id1][0]] += targets[id1][1]
+        delta[targets[id0][0]] -= targets[id0][1]
+        keys[time] = layers.sparsify(delta)
+
+    return keys
+
+
+def frozenKeys(layer):
+    """
+    Return the key deltas of a frozen layer, read from its snapshot since the
+    frozen blendShape has no key pairs left, as a dict of
+    time -> sparse (indices, values).
+    """
+    snapshot = storage.layerDataToPy(layer, 'frozen')
+    if snapshot is None:
+        return {}
+    return snapshotKeys(snapshot, layers.vertexCount(layers.meshName(layer)))
+
+
+def keyRange(bs):
+    times = []
+    for curve in layers.getWeightCurves(bs):
+        times.extend(cmds.keyframe(curve, query=True, tc=True) or [])
+
+    if len(times) == 0:
+        return []
+    return list(range(int(min(times)), int(max(times)) + 1))
+
+
+def freezeLayer(layer):
+    """
+    Bake a layer to its cheapest playback form.
+
+    The compensation targets and their mult nodes are removed and every key
+    target keeps the net delta it adds to the mesh, so the frozen blendShape
+    evaluates one sparse target per key, driven straight by the original
+    weight curves.  The editable network (target deltas and pairs) is kept
+    off-graph on the sat node, so unfreezeLayer() restores it exactly.
+
+    Return : dict : 'before' and 'after' playback fps over the key range.
+    """
+    mesh = layers.meshName(layer)
+    bs = layers.bsName(layer)
+    if not cmds.objExists(bs) or isFrozen(layer):
+        return None
+    pairs = layers.getKeyTargets(bs)
+    frames = keyRange(bs)
+    before = layers.timeEvaluation(mesh, frames)
+    targets = {}
+    for id0, id1 in pairs.values():
+        for i in (id0, id1):
+            targets[i] = layers.getSparseTarget(bs, i)
+
+    snapshot = {'pairs': pairs, 'packed': encodeTargets(targets)}
+
+    count = layers.vertexCount(mesh)
+    with utils.undoChunk('satFreeze'):
+        storage.pyToLayerData(layer, 'frozen', snapshot)
+        for id0, id1 in pairs.values():
+            delta = layers.getKeyDelta(bs, (id0, id1), count)
+            mults = cmds.listConnections('%s.w[%d]' % (bs, id0), type='multDoubleLinear', source=True, destination=False) or []
+            if len(mults) > 0:
+                cmds.delete(mults)
+            layers.removeTarget(bs, id0)
+            layers.setTargetDelta(bs, id1, delta)
+
+        if not cmds.attributeQuery('satFrozen', node=bs, exists=True):
+            cmds.addAttr(bs, longName='satFrozen', attributeType='bool')
+        cmds.setAttr(bs + '.satFrozen', True)
+
+    after = layers.timeEvaluation(mesh, frames)
+    return {'before': 1.0 / before if before > 0 else 0.0, 'after': 1.0 / after if after > 0 else 0.0}
+
+
+def unfreezeLayer(layer):
+    """Rebuild the editable network of a frozen layer from its stored snapshot."""
+    bs = layers.bsName(layer)
+    snapshot = storage.layerDataToPy(layer, 'frozen')
+    if snapshot is None or not cmds.objExists(bs):
+        return False
+    targets = snapshotTargets(snapshot)
+    with utils.undoChunk('satFreeze'):
+        for id0, id1 in snapshot['pairs'].values():
+            cmds.setAttr('%s.weight[%d]' % (bs, id0), 0)
+            cmds.aliasAttr('shape_%d' % id0, '%s.weight[%d]' % (bs, id0))
+            for i in (id0, id1):
+                indices, values = targets[i]
+                layers.setSparseTarget(bs, i, indices, values)
+
+            multNode = cmds.createNode('multDoubleLinear', n='shape_%d_mult' % id1)
+            cmds.setAttr(multNode + '.input2', -1)
+            cmds.connectAttr('%s.shape_%d' % (bs, id1), multNode + '.input1')
+            cmds.connectAttr(multNode + '.output', '%s.shape_%d' % (bs, id0))
+
+        cmds.setAttr(bs + '.satFrozen', False)
+        storage.pyToLayerData(layer, 'frozen', None)
+
+    return True
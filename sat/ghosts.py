@@ -0,0 +1,72 @@
+# Shape Animation Tool - Updated for Maya 2025 / Python 3
+import maya.cmds as cmds
+
+from . import layers
+
+prevColor = 13
+nextColor = 14
+
+
+class Ghosts(object):
+    """
+    Onion-skin display of the SAT keys around the current time.
+
+    Every ghost is a display-only mesh without history, so it costs nothing
+    during playback.  Ghost points come from a shared KeyPointCache and a
+    ghost is only rewritten when the key it shows changes.
+
+    Arguments:
+    keyCache : KeyPointCache : cache the key shapes are read from.
+    count : int : number of keys shown before and after the current time.
+    """
+
+    def __init__(self, keyCache, count=1):
+        self.keyCache = keyCache
+        self.count = count
+        self.layer = None
+        self.slots = {}
+
+    def slotName(self, side, index):
+        return '%s_satGhost_%s%d' % (self.layer, side, index)
+
+    def update(self, layer, keyTimes, time):
+        if layer != self.layer:
+            self.clear()
+            self.layer = layer
+        mesh = layers.meshName(layer)
+        prevKeys = sorted(t for t in keyTimes if t < time)
+        nextKeys = sorted(t for t in keyTimes if t > time)
+        wanted = {}
+        for i, t in enumerate(reversed(prevKeys[-self.count:] if self.count > 0 else [])):
+            wanted[self.slotName('prev', i + 1)] = (t, prevColor)
+        for i, t in enumerate(nextKeys[:self.count]):
+            wanted[self.slotName('next', i + 1)] = (t, nextColor)
+
+        for name in list(self.slots.keys()):
+            if name not in wanted:
+                self.removeSlot(name)
+
+        for name, (t, color) in wanted.items():
+            if self.slots.get(name) == t and cmds.objExists(name):
+                continue
+            if not cmds.objExists(name):
+                layers.createDisplayMesh(mesh, name, displayType=2, shaded=False, color=color)
+            layers.setPoints(name, self.keyCache.points(mesh, t))
+            self.slots[name] = t
+
+    def invalidate(self, times=None):
+        """Force the ghosts showing times (or every ghost) to be rewritten on the next update."""
+        for name, t in self.slots.items():
+            if times is None or t in times:
+                self.slots[name] = None
+
+    def removeSlot(self, name):
+        if cmds.objExists(name):
+            cmds.delete(name)
+        self.slots.pop(name, None)
+
+    def clear(self):
+        for name in list(self.slots.keys()):
+            self.removeSlot(name)
+
+        self.layer = None
@@ -0,0 +1,162 @@
+# Shape Animation Tool - Updated for Maya 2025 / Python 3
+import maya.cmds as cmds
+import maya.api.OpenMaya as om2
+import numpy as np
+
+from . import layers
+from . import utils
+from .cache import LRUCache
+
+colorSet = 'satHeatmap'
+levels = 32
+modes = ('neighbours', 'previous', 'next', 'rest')
+
+
+def ramp(count=levels):
+    """Return a (count, 4) blue -> green -> yellow -> red RGBA palette."""
+    x = np.linspace(0.0, 1.0, count)
+    r = np.clip(2.0 * x - 0.5, 0.0, 1.0)
+    g = np.clip(2.0 - np.abs(4.0 * x - 2.0), 0.0, 1.0)
+    b = np.clip(1.0 - 3.0 * x, 0.0, 1.0)
+    return np.stack([r, g, b, np.ones(count)], axis=1)
+
+
+def displacement(points, others):
+    """Return the largest per-vertex distance between points and any of others."""
+    result = np.zeros(len(points))
+    for other in others:
+        result = np.maximum(result, np.linalg.norm(points - other, axis=1))
+
+    return result
+
+
+def colorCodes(magnitude, scale=None):
+    """Map magnitudes to palette indices, scale defaults to the largest magnitude."""
+    if scale is None:
+        scale = float(magnitude.max()) if len(magnitude) else 0.0
+    if scale <= 0.0:
+        return np.zeros(len(magnitude), dtype=np.int64)
+    return np.minimum((magnitude * (levels / scale)).astype(np.int64), levels - 1)
+
+
+class Heatmap(object):
+    """
+    Per-vertex displacement heatmap of the SAT key at the current time.
+
+    The key at or before the current time is compared with its neighbouring
+    keys or with the rest shape.  Key points come from the shared
+    KeyPointCache and magnitudes are cached per compared key set, so
+    stepping through keys only evaluates what changed.  The colours live in
+    a palette colour set on a display copy of the mesh and only face-vertex
+    colour ids are rewritten, which keeps 500k vertex meshes interactive.
+
+    Arguments:
+    keyCache : KeyPointCache : cache the key shapes are read from.
+    mode : string : one of heatmap.modes.
+    """
+
+    def __init__(self, keyCache, mode='neighbours'):
+        self.keyCache = keyCache
+        self.mode = mode
+        self.scale = None
+        self.layer = None
+        self.name = None
+        self.shown = None
+        self.codes = None
+        self.faceVertices = None
+        self.rest = None
+        self.magnitudes = LRUCache(128 * 1024 * 1024)
+
+    def compared(self, keyTimes, time):
+        """Return (key time, times it is compared with) for time, or None without keys."""
+        keys = sorted(keyTimes)
+        if len(keys) == 0:
+            return None
+        index = max(0, int(np.searchsorted(keys, time, side='right')) - 1)
+        others = []
+        if self.mode in ('neighbours', 'previous') and index > 0:
+            others.append(keys[index - 1])
+        if self.mode in ('neighbours', 'next') and index + 1 < len(keys):
+            others.append(keys[index + 1])
+        return (keys[index], tuple(others))
+
+    def magnitude(self, mesh, keyTime, others):
+        key = (mesh, self.mode, keyTime, others)
+        result = self.magnitudes.get(key)
+        if result is None:
+            points = self.keyCache.points(mesh, keyTime)
+            if self.mode == 'rest':
+                if self.rest is None:
+                    self.rest = layers.getRestPoints(mesh)
+                targets = [self.rest]
+            else:
+                targets = [self.keyCache.points(mesh, t) for t in others]
+            result = displacement(points, targets)
+            self.magnitudes.put(key, result)
+        return result
+
+    def update(self, layer, keyTimes, time):
+        if layer != self.layer:
+            self.clear()
+            self.layer = layer
+            self.name = layer + '_satHeat'
+        mesh = layers.meshName(layer)
+        compared = self.compared(keyTimes, time)
+        if compared is None:
+            self.hide()
+            return
+        keyTime, others = compared
+        signature = (self.mode, self.scale, keyTime, others)
+        if signature == self.shown and cmds.objExists(self.name):
+            return
+        if not cmds.objExists(self.name):
+            self.create(mesh)
+        layers.setPoints(self.name, self.keyCache.points(mesh, keyTime))
+        codes = colorCodes(self.magnitude(mesh, keyTime, others), self.scale)
+        if self.codes is None or not np.array_equal(codes, self.codes):
+            fn = layers.getMeshFn(self.name)
+            fn.assignColors(om2.MIntArray(codes[self.faceVertices].tolist()), colorSet)
+            self.codes = codes
+        self.shown = signature
+        cmds.setAttr(self.name + '.visibility', True)
+        utils.hideMesh(mesh, self)
+
+    def create(self, mesh):
+        layers.createDisplayMesh(mesh, self.name, displayType=2, shaded=True)
+        shape = layers.getShape(self.name)
+        fn = layers.getMeshFn(self.name)
+        fn.createColorSet(colorSet, False)
+        fn.setCurrentColorSetName(colorSet)
+        fn.setColors(om2.MColorArray([om2.MColor(c) for c in ramp().tolist()]), colorSet)
+        counts, vertices = fn.getVertices()
+        self.faceVertices = np.array(vertices, dtype=np.int64)
+        cmds.setAttr(shape + '.displayColors', True)
+        cmds.setAttr(shape + '.displayColorChannel', 'Diffuse', type='string')
+        self.codes = None
+
+    def invalidate(self, times=None):
+        """Forget the magnitudes involving times (or all of them) after keys changed."""
+        if times is None:
+            self.magnitudes.clear()
+        else:
+            times = set(round(t, 3) for t in times)
+            self.magnitudes.invalidate(lambda key: round(key[2], 3) in times or any(round(t, 3) in times for t in key[3]))
+        self.shown = None
+
+    def hide(self):
+        if self.name is not None and cmds.objExists(self.name):
+            cmds.setAttr(self.name + '.visibility', False)
+        if self.layer is not None:
+            utils.showMesh(layers.meshName(self.layer), self)
+        self.shown = None
+
+    def clear(self):
+        self.hide()
+        if self.name is not None and cmds.objExists(self.name):
+            cmds.delete(self.name)
+        self.layer = None
+        self.name = None
+        self.codes = None
+        self.faceVertices = None
+        self.rest = None
+        self.magnitudes.clear()
@@ -0,0 +1,116 @@
+# Shape Animation Tool - Updated for Maya 2025 / Python 3
+import time as timer
+
+import maya.cmds as cmds
+import numpy as np
+
+from . import layers
+from . import storage
+from . import utils
+from . import workers
+
+
+def basePoints(layer, time):
+    """Return the points a layer adds its keys to at time: its input geometry."""
+    bs = layers.bsName(layer)
+    if cmds.objExists(bs):
+        return layers.getPlugPoints(bs + '.input[0].inputGeometry', time)
+    return layers.getPoints(layers.meshName(layer), time)
+
+
+def isSparse(shape):
+    """
+    Tell an (indices, values) sparse delta from an (n, 3) array of points by
+    its structure, whatever sequence types hold it: a pair whose first item
+    is integer data, or a single index, with one (x, y, z) value per index in
+    the second, given as rows or flat.
+    """
+    if isinstance(shape, np.ndarray) or len(shape) != 2:
+        return False
+    indices = np.asarray(shape[0]).reshape(-1) if np.ndim(shape[0]) == 0 else np.asarray(shape[0])
+    values = np.asarray(shape[1])
+    if indices.ndim != 1 or (indices.dtype.kind not in 'iu' and len(indices) > 0):
+        return False
+    if values.size != 3 * len(indices) or values.ndim > 2:
+        return False
+    return values.ndim == 1 or values.shape[1] == 3
+
+
+def setKeysFromPoints(layer, keys, tolerance=1e-5):
+    """
+    Create or replace many SAT keys from shapes computed outside Maya, in one
+    batched and undoable operation.  The current time never changes and no
+    mesh is duplicated.
+
+    Arguments:
+    layer : string : SAT layer, its blendShape is created and the layer
+            registered when missing.
+    keys : list : (time, shape) pairs, where shape is either an (n, 3) array
+            of the points the mesh should have at time, or an (indices,
+            values) sparse delta to add to the layer's input geometry,
+            see isSparse().
+    tolerance : float : vertices that move less are not stored.
+
+    Return : list : the written key times.
+    """
+    kinds = [isSparse(shape) for _, shape in keys]
+    full = [(t, shape) for (t, shape), sparse in zip(keys, kinds) if not sparse]
+    sparse = [(t, np.asarray(shape[0], dtype=np.int64).reshape(-1), np.asarray(shape[1], dtype=np.float64).reshape(-1, 3)) for (t, shape), sparse in zip(keys, kinds) if sparse]
+    if len(full) > 0:
+        # Input geometry is read on the main thread, differencing runs in the pool
+        bases = [basePoints(layer, t) for t, _ in full]
+
+        def diff(item):
+            (t, points), base = item
+            return (t,) + layers.sparsify(np.asarray(points, dtype=np.float64)[:, :3] - base, tolerance)
+
+        sparse.extend(workers.map(diff, zip(full, bases), 'Ingest'))
+    with utils.undoChunk('satIngest'):
+        written = layers.createKeys(layer, sparse)
+        # Unregistered layers look like leftovers to integrity.scan()
+        storage.addLayer(layer)
+
+    return sorted(written.keys())
+
+
+def benchmark(keyCount=500, subdivisions=223, movedFraction=0.1):
+    """
+    Time setKeysFromPoints() on a fresh polyPlane of (subdivisions + 1)^2
+    vertices, about 50k by default.  Every key moves a random movedFraction
+    of the vertices.  Returns a dict of timings in seconds.
+    """
+    plane = cmds.polyPlane(n='satIngestBenchmark', sx=subdivisions, sy=subdivisions, ch=False)[0]
+    layer = plane + '_LR1'
+    count = layers.vertexCount(plane)
+    rng = np.random.default_rng(0)
+    keys = []
+    for k in range(keyCount):
+        indices = np.sort(rng.choice(count, int(count * movedFraction), replace=False))
+        keys.append((float(k + 1), (indices, rng.normal(scale=0.1, size=(len(indices), 3)))))
+
+    result = {'vertices': count, 'keys': keyCount}
+    start = timer.perf_counter()
+    setKeysFromPoints(layer, keys)
+    result['sparseSeconds'] = timer.perf_counter() - start
+    cmds.delete(layers.bsName(layer))
+    rest = layers.getPoints(plane)
+    fullKeys = []
+    for t, (indices, values) in keys[:min(50, keyCount)]:
+        points = rest.copy()
+        points[indices] += values
+        fullKeys.append((t, points))
+
+    start = timer.perf_counter()
+    setKeysFromPoints(layer, fullKeys)
+    result['fullPointsSeconds(%d keys)' % len(fullKeys)] = timer.perf_counter() - start
+    cmds.delete(plane)
+    storage.setLayers([l for l in storage.listLayers() if l != layer])
+    return result
+
+
+if __name__ == '__main__':
+    # mayapy -m sat.ingest
+    import maya.standalone
+    maya.standalone.initialize(name='python')
+    for name, value in benchmark().items():
+        print('%s: %s' % (name, value))
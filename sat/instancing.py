@@ -0,0 +1,156 @@
+# Shape Animation Tool - Updated for Maya 2025 / Python 3
+import maya.cmds as cmds
+
+from . import layers
+from . import storage
+from . import utils
+
+
+def instanceBsName(mesh):
+    return mesh.replace(':', '_') + '_satInst'
+
+
+def networkName(layer, speed):
+    """Prefix of the node network shared by the instances of layer playing at speed."""
+    return '%s_satInst_%s' % (layers.bsName(layer).replace(':', '_'), ('%g' % speed).replace('.', 'p'))
+
+
+def getInstances(layer):
+    """Return the instances of a master layer as a list of {'mesh', 'offset', 'speed'} dicts."""
+    return storage.layerDataToPy(layer, 'instances', [])
+
+
+def sharedNetwork(layer, speed=1.0):
+    """
+    Return {(id0, id1): (weight, negated weight)} frameCache nodes of every
+    key of a master layer, built the first time an instance plays it at
+    speed.  Each cache reads the master weight curve, played at speed, so an
+    instance only connects to cache.past[offset] and is never given nodes of
+    its own.  The network costs a fixed number of nodes per key, however
+    many instances use it.
+    """
+    master = layers.bsName(layer)
+    prefix = networkName(layer, speed)
+    timeCurve = prefix + '_time'
+    if speed != 1.0 and not cmds.objExists(timeCurve):
+        cmds.createNode('animCurveTT', n=timeCurve)
+        cmds.setKeyframe(timeCurve, time=0.0, value=0.0)
+        cmds.setKeyframe(timeCurve, time=100.0, value=100.0 * speed)
+        cmds.keyTangent(timeCurve, edit=True, itt='linear', ott='linear')
+        cmds.setInfinity(timeCurve, preInfinite='linear', postInfinite='linear')
+    network = {}
+    for keyTime, (id0, id1) in sorted(layers.getKeyTargets(master).items()):
+        cache = '%s_shape_%d_cache' % (prefix, id1)
+        negated = '%s_shape_%d_negCache' % (prefix, id1)
+        if not cmds.objExists(cache):
+            weightCurve = cmds.listConnections('%s.w[%d]' % (master, id1), type='animCurve', source=True, destination=False)
+            if not weightCurve:
+                continue
+            source = weightCurve[0] + '.output'
+            if speed != 1.0:
+                scaled = cmds.createNode('frameCache', n='%s_shape_%d_speed' % (prefix, id1))
+                cmds.connectAttr(source, scaled + '.stream')
+                cmds.connectAttr(timeCurve + '.output', scaled + '.varyTime')
+                source = scaled + '.varying'
+            cmds.createNode('frameCache', n=cache)
+            cmds.connectAttr(source, cache + '.stream')
+            multNode = cmds.createNode('multDoubleLinear', n='%s_shape_%d_mult' % (prefix, id1))
+            cmds.setAttr(multNode + '.input2', -1)
+            cmds.connectAttr(source, multNode + '.input1')
+            cmds.createNode('frameCache', n=negated)
+            cmds.connectAttr(multNode + '.output', negated + '.stream')
+        network[(id0, id1)] = (cache, negated)
+
+    return network
+
+
+def removeNetworks(layer, speeds=None):
+    """Delete the shared networks of layer at speeds, all of them by default."""
+    if speeds is None:
+        speeds = set(i['speed'] for i in getInstances(layer))
+    nodes = []
+    for speed in speeds:
+        nodes += cmds.ls(networkName(layer, speed) + '_*') or []
+
+    if len(nodes) > 0:
+        cmds.delete(nodes)
+
+
+def buildInstance(layer, mesh, offset=0.0, speed=1.0):
+    """
+    Drive mesh with the key data of a master layer, playing it at
+    (time - offset) * speed.
+
+    The instance blendShape takes its target data by connection from the
+    master _satBS, so point data is shared by reference and never copied.
+    Its weights are the outputs of the shared network of the master at
+    offset, rounded to whole frames, so an instance only owns its
+    blendShape.
+    """
+    master = layers.bsName(layer)
+    if layers.vertexCount(mesh) != layers.vertexCount(layers.meshName(layer)):
+        raise ValueError("'%s' does not have the vertex count of '%s'" % (mesh, layers.meshName(layer)))
+    removeInstance(layer, mesh, forget=False)
+    bs = cmds.blendShape(mesh, n=instanceBsName(mesh))[0]
+    cmds.addAttr(bs, longName='satMaster', dataType='string')
+    cmds.setAttr(bs + '.satMaster', layer, type='string')
+    frames = int(round(offset))
+    plug = 'past[%d]' % frames if frames >= 0 else 'future[%d]' % -frames
+    for (id0, id1), (cache, negated) in sharedNetwork(layer, speed).items():
+        for i in (id0, id1):
+            for attr in ('inputPointsTarget', 'inputComponentsTarget'):
+                cmds.connectAttr(layers.targetItem(master, i) + '.' + attr, layers.targetItem(bs, i) + '.' + attr)
+
+        cmds.connectAttr(cache + '.' + plug, '%s.w[%d]' % (bs, id1))
+        cmds.connectAttr(negated + '.' + plug, '%s.w[%d]' % (bs, id0))
+
+    instances = [i for i in getInstances(layer) if i['mesh'] != mesh]
+    instances.append({'mesh': mesh, 'offset': offset, 'speed': speed})
+    storage.pyToLayerData(layer, 'instances', instances)
+    return bs
+
+
+def removeInstance(layer, mesh, forget=True):
+    bs = instanceBsName(mesh)
+    if cmds.objExists(bs):
+        # Instances built before the shared network own a cache and a mult per key
+        nodes = cmds.listConnections(bs, type='frameCache') or []
+        nodes += cmds.listConnections(bs, type='multDoubleLinear') or []
+        cmds.delete([bs] + [n for n in set(nodes) if n.startswith(bs + '_')])
+    legacyCurve = mesh.replace(':', '_') + '_satInstTime'
+    if cmds.objExists(legacyCurve):
+        cmds.delete(legacyCurve)
+    if forget:
+        instances = getInstances(layer)
+        remaining = [i for i in instances if i['mesh'] != mesh]
+        removeNetworks(layer, set(i['speed'] for i in instances) - set(i['speed'] for i in remaining))
+        storage.pyToLayerData(layer, 'instances', remaining or None)
+
+
+def instanceLayer(layer, meshes, offsetStep=0.0, speed=1.0):
+    """Instance a master layer on many meshes, offsetting each one by offsetStep frames."""
+    built = []
+    with utils.undoChunk('satInstance'):
+        for i, mesh in enumerate(meshes):
+            buildInstance(layer, mesh, i * offsetStep, speed)
+            built.append(mesh)
+
+    return built
+
+
+def refreshInstances(layer):
+    """Rebuild every instance of layer, picking up keys added to the master since."""
+    with utils.undoChunk('satInstance'):
+        removeNetworks(layer)
+        for instance in getInstances(layer):
+            if cmds.objExists(instance['mesh']):
+                buildInstance(layer, instance['mesh'], instance['offset'], instance['speed'])
+            else:
+                removeInstance(layer, instance['mesh'])
+
+
+def removeInstances(layer):
+    with utils.undoChunk('satInstance'):
+        removeNetworks(layer)
+        for instance in getInstances(layer):
+            removeInstance(layer, instance['mesh'])
@@ -0,0 +1,550 @@
+# Shape Animation Tool - Updated for Maya 2025 / Python 3
+import hashlib
+import re
+from time import perf_counter
+
+import maya.cmds as cmds
+import maya.api.OpenMaya as om2
+import maya.api.OpenMayaAnim as oma
+import numpy as np
+
+
+def bsName(layer):
+    """Return the name of the blendShape node that holds a SAT layer."""
+    return layer + '_satBS'
+
+
+def meshName(layer):
+    """Return the mesh transform a SAT layer (<mesh>_LR<n>) deforms."""
+    return layer.split('_LR')[0]
+
+
+def getShape(mesh):
+    """
+    Return the visible (non intermediate) mesh shape under a transform.  If
+    mesh already is a shape it is returned as is.
+    """
+    if cmds.nodeType(mesh) == 'mesh':
+        return mesh
+    shapes = cmds.listRelatives(mesh, shapes=True, noIntermediate=True, fullPath=True, type='mesh') or []
+    if len(shapes) == 0:
+        raise RuntimeError("'%s' has no mesh shape" % mesh)
+    return shapes[0]
+
+
+def _plug(node, attr):
+    sel = om2.MSelectionList()
+    sel.add(node)
+    return om2.MFnDependencyNode(sel.getDependNode(0)).findPlug(attr, False)
+
+
+def getPointArray(mesh, time=None):
+    """
+    Return the evaluated object space points of a mesh as an MPointArray.
+
+    Arguments:
+    mesh : string : mesh transform or shape.
+    time : float : frame to evaluate the mesh at.  The mesh is pulled through a
+            DG context, so the current time of the scene does not change.  If
+            None the mesh is read at the current time.
+    """
+    shape = getShape(mesh)
+    if time is None:
+        sel = om2.MSelectionList()
+        sel.add(shape)
+        return om2.MFnMesh(sel.getDagPath(0)).getPoints(om2.MSpace.kObject)
+    plug = _plug(shape, 'outMesh')
+    context = om2.MDGContext(om2.MTime(time, om2.MTime.uiUnit()))
+    with om2.MDGContextGuard(context):
+        data = plug.asMObject()
+    return om2.MFnMesh(data).getPoints(om2.MSpace.kObject)
+
+
+def getPlugPoints(plugName, time=None):
+    """
+    Return the points of a mesh data plug (for example the input geometry of
+    a deformer) as an (n, 3) numpy array, evaluated at time through a DG
+    context.
+    """
+    sel = om2.MSelectionList()
+    sel.add(plugName)
+    plug = sel.getPlug(0)
+    if time is None:
+        data = plug.asMObject()
+    else:
+        with om2.MDGContextGuard(om2.MDGContext(om2.MTime(time, om2.MTime.uiUnit()))):
+            data = plug.asMObject()
+    return pointArrayToNumpy(om2.MFnMesh(data).getPoints(om2.MSpace.kObject))
+
+
+def getPoints(mesh, time=None):
+    """Same as getPointArray(), but returns an (n, 3) float64 numpy array."""
+    return pointArrayToNumpy(getPointArray(mesh, time))
+
+
+def setPoints(mesh, points):
+    """
+    Write object space points to a mesh without history.  points can be an
+    MPointArray or an (n, 3) numpy array.
+    """
+    if not isinstance(points, om2.MPointArray):
+        points = om2.MPointArray(np.asarray(points, dtype=np.float64).tolist())
+    sel = om2.MSelectionList()
+    sel.add(getShape(mesh))
+    om2.MFnMesh(sel.getDagPath(0)).setPoints(points, om2.MSpace.kObject)
+
+
+def timePlug(plug, times):
+    """
+    Return the average seconds it takes to pull plug (an MPlug or a
+    'node.attr' string) at each of times through a DG context.  Nothing is
+    cached across contexts, so upstream nodes are evaluated every time too.
+    """
+    if len(times) == 0:
+        return 0.0
+    if not isinstance(plug, om2.MPlug):
+        sel = om2.MSelectionList()
+        sel.add(plug)
+        plug = sel.getPlug(0)
+    start = perf_counter()
+    for time in times:
+        with om2.MDGContextGuard(om2.MDGContext(om2.MTime(time, om2.MTime.uiUnit()))):
+            plug.asMObject()
+
+    return (perf_counter() - start) / len(times)
+
+
+def timeEvaluation(mesh, times):
+    """Return the average seconds it takes to evaluate mesh at each of times."""
+    return timePlug(_plug(getShape(mesh), 'outMesh'), times)
+
+
+def pointArrayToNumpy(points):
+    if len(points) == 0:
+        return np.zeros((0, 3))
+    return np.array(points, dtype=np.float64)[:, :3]
+
+
+def pointArrayBytes(points):
+    """Memory used by an MPointArray (four doubles per point)."""
+    return len(points) * 32
+
+
+def createDisplayMesh(mesh, name, displayType=2, shaded=True, color=None):
+    """
+    Create a display-only copy of mesh with no construction history.  The
+    copy is unselectable, hidden from the outliner and can be updated cheaply
+    with setPoints().  An existing node called name is replaced.
+
+    Arguments:
+    mesh : string : mesh to copy.
+    name : string : name of the new transform.
+    displayType : int : drawing override display type (1 template, 2 reference).
+    shaded : bool : draw the copy shaded or as wireframe only.
+    color : int : drawing override color index, or None to keep the material.
+    """
+    if cmds.objExists(name):
+        cmds.delete(name)
+    copy = cmds.duplicate(mesh, n=name)[0]
+    for child in cmds.listRelatives(copy, fullPath=True) or []:
+        if cmds.nodeType(child) != 'mesh' or cmds.getAttr(child + '.intermediateObject'):
+            cmds.delete(child)
+    for attr in ('tx', 'ty', 'tz', 'rx', 'ry', 'rz', 'sx', 'sy', 'sz', 'v'):
+        cmds.setAttr(copy + '.' + attr, lock=0)
+    if cmds.listRelatives(copy, p=True) is not None:
+        copy = cmds.parent(copy, w=True)[0]
+    shape = getShape(copy)
+    cmds.setAttr(shape + '.overrideEnabled', 1)
+    cmds.setAttr(shape + '.overrideDisplayType', displayType)
+    cmds.setAttr(shape + '.overrideShading', int(shaded))
+    if color is not None:
+        cmds.setAttr(shape + '.overrideColor', color)
+    if cmds.attributeQuery('hiddenInOutliner', node=copy, exists=True):
+        cmds.setAttr(copy + '.hiddenInOutliner', True)
+    return copy
+
+
+def keySegment(keyTimes, time, spread=1):
+    """
+    Return the (start, end) open time range whose evaluation depends on the
+    key at time.  spread is the number of neighbouring keys on each side that
+    bound the range: 1 when only the shape of a key changed, 2 when a key was
+    added or removed, since that also changes the tangents of its neighbours.
+    Missing neighbours extend the range to infinity.
+    """
+    prevKeys = sorted(t for t in keyTimes if t < time)
+    nextKeys = sorted(t for t in keyTimes if t > time)
+    if len(prevKeys) >= spread:
+        start = prevKeys[-spread]
+    else:
+        start = float('-inf')
+    if len(nextKeys) >= spread:
+        end = nextKeys[spread - 1]
+    else:
+        end = float('inf')
+    return (start, end)
+
+
+def getMeshFn(mesh):
+    sel = om2.MSelectionList()
+    sel.add(getShape(mesh))
+    return om2.MFnMesh(sel.getDagPath(0))
+
+
+def vertexCount(mesh):
+    return getMeshFn(mesh).numVertices
+
+
+def topologyHash(mesh):
+    """
+    Return a hash of the vertex count and face-vertex connectivity of a mesh.
+    Meshes with the same hash have the same vertex order and can share
+    per-vertex maps.
+    """
+    counts, connects = getMeshFn(mesh).getVertices()
+    digest = hashlib.sha1()
+    digest.update(np.array(counts, dtype=np.int32).tobytes())
+    digest.update(np.array(connects, dtype=np.int32).tobytes())
+    return digest.hexdigest()
+
+
+def getOrigShape(mesh):
+    """Return the intermediate shape that feeds the deformer stack of mesh, or None."""
+    shapes = cmds.listRelatives(mesh, shapes=True, fullPath=True, type='mesh') or []
+    origs = [s for s in shapes if cmds.getAttr(s + '.intermediateObject')]
+    for shape in origs:
+        if not cmds.listConnections(shape + '.inMesh', source=True, destination=False):
+            return shape
+    if len(origs) > 0:
+        return origs[0]
+    return None
+
+
+def getRestPoints(mesh):
+    """Return the undeformed points of mesh, read from its orig shape."""
+    orig = getOrigShape(mesh)
+    if orig is None:
+        return getPoints(mesh)
+    sel = om2.MSelectionList()
+    sel.add(orig)
+    return pointArrayToNumpy(om2.MFnMesh(sel.getDagPath(0)).getPoints(om2.MSpace.kObject))
+
+
+def weightIndices(bs):
+    """Return a dict of weight alias (shape_N) -> target index of a blendShape."""
+    aliases = cmds.aliasAttr(bs, query=True) or []
+    indices = {}
+    for i in range(0, len(aliases), 2):
+        match = re.match(r'(?:weight|w)\[(\d+)\]', aliases[i + 1])
+        if match:
+            indices[aliases[i]] = int(match.group(1))
+
+    return indices
+
+
+def _weightIndex(attr, indices):
+    match = re.match(r'(?:weight|w)\[(\d+)\]$', attr)
+    if match:
+        return int(match.group(1))
+    return indices.get(attr)
+
+
+def getKeyTargets(bs):
+    """
+    Return a dict of key time -> (id0, id1) target index pair of a SAT layer.
+
+    setKey creates two targets per key: id1 holds the key shape and is keyed
+    to 1 on its own key time, id0 compensates the shape the layer already had
+    and is driven to -weight(id1) by a shape_<id1>_mult node.  The pair is
+    recovered from the mult connections, the time from the id1 curve.
+    """
+    if not cmds.objExists(bs):
+        return {}
+    indices = weightIndices(bs)
+    pairs = {}
+    for mult in set(cmds.listConnections(bs, type='multDoubleLinear') or []):
+        src = cmds.listConnections(mult + '.input1', source=True, destination=False, plugs=True) or []
+        dst = cmds.listConnections(mult + '.output', source=False, destination=True, plugs=True) or []
+        if len(src) == 0 or len(dst) == 0:
+            continue
+        id1 = _weightIndex(src[0].split('.')[-1], indices)
+        id0 = _weightIndex(dst[0].split('.')[-1], indices)
+        if id0 is None or id1 is None:
+            continue
+        times = cmds.keyframe('%s.w[%d]' % (bs, id1), query=True, tc=True) or []
+        values = cmds.keyframe('%s.w[%d]' % (bs, id1), query=True, vc=True) or []
+        if len(times) == 0:
+            continue
+        pairs[times[int(np.argmax(values))]] = (id0, id1)
+
+    return pairs
+
+
+def targetItem(bs, index):
+    return '%s.inputTarget[0].inputTargetGroup[%d].inputTargetItem[6000]' % (bs, index)
+
+
+def getSparseTarget(bs, index):
+    """
+    Return the stored delta of a blendShape target as (indices, values), an
+    int array of vertex ids and an (m, 3) float64 array of offsets.
+    """
+    item = targetItem(bs, index)
+    sel = om2.MSelectionList()
+    try:
+        sel.add(item + '.inputPointsTarget')
+        sel.add(item + '.inputComponentsTarget')
+        pointsData = sel.getPlug(0).asMObject()
+        componentsData = sel.getPlug(1).asMObject()
+    except (RuntimeError, TypeError):
+        return (np.zeros(0, dtype=np.int64), np.zeros((0, 3)))
+    values = pointArrayToNumpy(om2.MFnPointArrayData(pointsData).array())
+    components = om2.MFnComponentListData(componentsData)
+    indices = []
+    for i in range(components.length()):
+        indices.extend(om2.MFnSingleIndexedComponent(components.get(i)).getElements())
+
+    indices = np.array(indices, dtype=np.int64)
+    count = min(len(indices), len(values))
+    return (indices[:count], values[:count])
+
+
+def getTargetDelta(bs, index, count):
+    """Return the delta of a blendShape target as a dense (count, 3) array."""
+    indices, values = getSparseTarget(bs, index)
+    delta = np.zeros((count, 3))
+    valid = indices < count
+    delta[indices[valid]] = values[valid]
+    return delta
+
+
+def indicesToComponents(indices):
+    """Compress sorted vertex ids to a list of 'vtx[a:b]' component strings."""
+    indices = np.asarray(indices, dtype=np.int64)
+    if len(indices) == 0:
+        return []
+    breaks = np.flatnonzero(np.diff(indices) != 1) + 1
+    starts = np.concatenate(([0], breaks))
+    ends = np.concatenate((breaks, [len(indices)])) - 1
+    components = []
+    for s, e in zip(indices[starts], indices[ends]):
+        if s == e:
+            components.append('vtx[%d]' % s)
+        else:
+            components.append('vtx[%d:%d]' % (s, e))
+
+    return components
+
+
+def sparsify(delta, tolerance=1e-5):
+    """Return (indices, values) of the rows of a dense delta above tolerance."""
+    indices = np.flatnonzero(np.abs(delta).max(axis=1) > tolerance)
+    return (indices, delta[indices])
+
+
+def setSparseTarget(bs, index, indices, values):
+    """Write (indices, values) as the stored delta of a blendShape target."""
+    order = np.argsort(indices, kind='stable')
+    indices = np.asarray(indices, dtype=np.int64)[order]
+    values = np.asarray(values, dtype=np.float64)[order]
+    item = targetItem(bs, index)
+    points = [(x, y, z, 1.0) for x, y, z in values.tolist()]
+    components = indicesToComponents(indices)
+    cmds.setAttr(item + '.inputPointsTarget', len(points), *points, type='pointArray')
+    cmds.setAttr(item + '.inputComponentsTarget', len(components), *components, type='componentList')
+
+
+def setTargetDelta(bs, index, delta, tolerance=1e-5):
+    """Write a dense (n, 3) delta to a blendShape target, storing only moved vertices."""
+    indices, values = sparsify(delta, tolerance)
+    setSparseTarget(bs, index, indices, values)
+
+
+def getKeyDelta(bs, pair, count):
+    """Return the shape a key adds to the mesh: delta(id1) - delta(id0)."""
+    id0, id1 = pair
+    return getTargetDelta(bs, id1, count) - getTargetDelta(bs, id0, count)
+
+
+def setKeyDelta(bs, pair, delta):
+    """Make a key add delta to the mesh, keeping its id0 compensation target."""
+    id0, id1 = pair
+    setTargetDelta(bs, id1, delta + getTargetDelta(bs, id0, len(delta)))
+
+
+def getKeyWeights(bs, pairs, times):
+    """
+    Return a (len(times), len(pairs)) array of the id1 weight of every key
+    pair evaluated at times, read from the weight curves with the API.  The
+    layer delta at a time is then weights @ keyDeltas.
+    """
+    weights = np.zeros((len(times), len(pairs)))
+    fn = oma.MFnAnimCurve()
+    unit = om2.MTime.uiUnit()
+    for k, (id0, id1) in enumerate(pairs):
+        curves = cmds.listConnections('%s.w[%d]' % (bs, id1), type='animCurve', source=True, destination=False) or []
+        if len(curves) == 0:
+            weights[:, k] = cmds.getAttr('%s.w[%d]' % (bs, id1))
+            continue
+        sel = om2.MSelectionList()
+        sel.add(curves[0])
+        fn.setObject(sel.getDependNode(0))
+        weights[:, k] = [fn.evaluate(om2.MTime(t, unit)) for t in times]
+
+    return weights
+
+
+def getBaseWeights(bs, count):
+    """Return the painted base weights of a blendShape as a (count,) array, unpainted vertices are 1."""
+    weights = np.ones(count)
+    indices = cmds.getAttr(bs + '.inputTarget[0].baseWeights', multiIndices=True) or []
+    if len(indices) == 0:
+        return weights
+    # A multi attribute returns the values of its existing elements in index order
+    values = np.ravel(cmds.getAttr(bs + '.inputTarget[0].baseWeights'))
+    indices = np.asarray(indices, dtype=np.int64)
+    valid = indices < count
+    weights[indices[valid]] = values[:len(indices)][valid]
+    return weights
+
+
+def componentIndices(components, mesh=None):
+    """
+    Return the sorted vertex ids of a list of mesh components (vertices,
+    edges or faces).  With mesh, components of other meshes are ignored.
+    """
+    vertices = cmds.polyListComponentConversion(components, toVertex=True) or []
+    if len(vertices) == 0:
+        return np.zeros(0, dtype=np.int64)
+    sel = om2.MSelectionList()
+    for v in vertices:
+        sel.add(v)
+
+    target = None
+    if mesh is not None:
+        target = (cmds.ls(mesh, long=True) or [mesh])[0]
+    indices = []
+    for i in range(sel.length()):
+        path, component = sel.getComponent(i)
+        if target is not None and om2.MFnDagNode(path.transform()).fullPathName() != target:
+            continue
+        if not component.isNull():
+            indices.extend(om2.MFnSingleIndexedComponent(component).getElements())
+
+    return np.unique(np.array(indices, dtype=np.int64))
+
+
+def getTriangles(mesh):
+    """Return the triangulation of mesh as an (m, 3) array of vertex ids."""
+    _, vertices = getMeshFn(mesh).getTriangles()
+    return np.array(vertices, dtype=np.int64).reshape(-1, 3)
+
+
+def getWeightCurves(bs):
+    """Return the animCurves driving the weights of a SAT blendShape."""
+    if not cmds.objExists(bs):
+        return []
+    return sorted(set(cmds.listConnections(bs, type='animCurve', source=True, destination=False) or []))
+
+
+def removeTarget(bs, index):
+    """Remove a target, its weight and its shape_N alias from a blendShape."""
+    try:
+        cmds.aliasAttr('%s.shape_%d' % (bs, index), remove=True)
+    except:
+        pass
+    cmds.removeMultiInstance('%s.weight[%d]' % (bs, index), b=True)
+    cmds.removeMultiInstance('%s.inputTarget[0].inputTargetGroup[%d]' % (bs, index), b=True)
+
+
+def deleteLayerNodes(layer):
+    """Delete the blendShape of a layer with its mult nodes; its weight curves go with it."""
+    bs = bsName(layer)
+    if not cmds.objExists(bs):
+        return
+    mults = cmds.listConnections(bs, type='multDoubleLinear') or []
+    cmds.delete([bs] + list(set(mults)))
+
+
+def freeTargetIndices(bs, count):
+    """Return the count lowest target indices not used by a blendShape."""
+    used = set(cmds.getAttr(bs + '.weight', multiIndices=True) or [])
+    used.update(weightIndices(bs).values())
+    indices = []
+    i = 0
+    while len(indices) < count:
+        if i not in used:
+            indices.append(i)
+        i += 1
+
+    return indices
+
+
+def createKeys(layer, keys):
+    """
+    Create or replace many SAT keys of a layer in one batched pass.
+
+    Targets are written straight to the blendShape target data, so there is
+    no mesh duplication and the current time is never changed.  New keys get
+    the same network setKey builds: a shape/compensation target pair, a
+    shape_<id1>_mult node and a weight curve keyed 1 on its own time and 0 on
+    every other key time.  Run it inside utils.undoChunk() to make it a single
+    undo step.
+
+    Arguments:
+    layer : string : SAT layer, its blendShape is created when missing.
+    keys : list : (time, indices, values) tuples, the sparse delta each key
+            adds to the mesh.  Keys on existing key times replace their delta.
+
+    Return : dict : time -> (id0, id1) target pair of every written key.
+    """
+    mesh = meshName(layer)
+    bs = bsName(layer)
+    if not cmds.objExists(bs):
+        cmds.blendShape(mesh, n=bs)
+    existing = getKeyTargets(bs)
+    count = vertexCount(mesh)
+    written = {}
+    newKeys = []
+    for time, indices, values in keys:
+        if time in existing:
+            id0, id1 = existing[time]
+            delta = getTargetDelta(bs, id0, count)
+            delta[np.asarray(indices, dtype=np.int64)] += values
+            setTargetDelta(bs, id1, delta)
+            written[time] = existing[time]
+        else:
+            newKeys.append((time, indices, values))
+
+    if len(newKeys) == 0:
+        return written
+    ids = freeTargetIndices(bs, 2 * len(newKeys))
+    newAttrs = []
+    for k, (time, indices, values) in enumerate(newKeys):
+        id0, id1 = ids[2 * k], ids[2 * k + 1]
+        for i in (id0, id1):
+            cmds.setAttr('%s.weight[%d]' % (bs, i), 0)
+            cmds.aliasAttr('shape_%d' % i, '%s.weight[%d]' % (bs, i))
+
+        setSparseTarget(bs, id0, np.zeros(0, dtype=np.int64), np.zeros((0, 3)))
+        setSparseTarget(bs, id1, indices, values)
+        multNode = cmds.createNode('multDoubleLinear', n='shape_%d_mult' % id1)
+        cmds.setAttr(multNode + '.input2', -1)
+        cmds.connectAttr('%s.shape_%d' % (bs, id1), multNode + '.input1')
+        cmds.connectAttr(multNode + '.output', '%s.shape_%d' % (bs, id0))
+        newAttrs.append('%s.shape_%d' % (bs, id1))
+        written[time] = (id0, id1)
+
+    newTimes = [time for time, _, _ in newKeys]
+    allTimes = sorted(set(existing.keys()) | set(newTimes))
+    oldAttrs = ['%s.w[%d]' % (bs, id1) for id0, id1 in existing.values()]
+    if len(oldAttrs) > 0:
+        cmds.setKeyframe(oldAttrs, t=newTimes, v=0)
+    cmds.setKeyframe(newAttrs, t=allTimes, v=0)
+    for attr, time in zip(newAttrs, newTimes):
+        cmds.setKeyframe(attr, t=time, v=1)
+
+    curves = getWeightCurves(bs)
+    cmds.keyTangent(curves, edit=True, weightedTangents=True)
+    cmds.keyTangent(curves, edit=True, weightedTangents=False)
+    return written
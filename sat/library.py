@@ -0,0 +1,320 @@
+# Shape Animation Tool - Updated for Maya 2025 / Python 3
+"""
+On-disk library of key shapes.
+
+    <root>/index.json          one entry per shape, read when the library opens
+    <root>/shapes/<id>.npz     sparse delta of a shape (indices, values)
+    <root>/meshes/<hash>.npz   rest points and triangles, shared by every
+                               shape saved from the same topology
+    <root>/thumbnails/<id>.png thumbnail cache, least recently used first out
+
+Opening a library only reads the index.  Thumbnails are drawn with numpy in
+the worker pool the first time a shape is shown and kept on disk.
+"""
+import io
+import json
+import os
+import struct
+import threading
+import time as clock
+import uuid
+import zlib
+
+import maya.cmds as cmds
+import numpy as np
+
+from . import freeze
+from . import heatmap
+from . import layers
+from . import retarget
+from . import utils
+from . import workers
+from .cache import LRUCache
+
+thumbnailSize = 96
+correspondences = LRUCache(512 * 1024 * 1024, sizeOf=lambda value: value[0].nbytes + value[1].nbytes)
+
+
+def defaultRoot():
+    return os.environ.get('SAT_LIBRARY') or os.path.join(cmds.internalVar(userAppDir=True), 'satLibrary')
+
+
+def _replace(path, data):
+    """Write data to path through a temporary file, so readers never see half a file."""
+    temp = '%s.%s.tmp' % (path, uuid.uuid4().hex[:8])
+    with open(temp, 'wb') as f:
+        f.write(data)
+    os.replace(temp, path)
+
+
+def pngBytes(rgb):
+    """Encode a (h, w, 3) uint8 image as PNG."""
+    h, w, _ = rgb.shape
+    rows = np.concatenate([np.zeros((h, 1), dtype=np.uint8), rgb.reshape(h, w * 3)], axis=1)
+
+    def chunk(tag, data):
+        return struct.pack('>I', len(data)) + tag + data + struct.pack('>I', zlib.crc32(tag + data) & 0xffffffff)
+
+    return b'\x89PNG\r\n\x1a\n' + chunk(b'IHDR', struct.pack('>IIBBBBB', w, h, 8, 2, 0, 0, 0)) + chunk(b'IDAT', zlib.compress(rows.tobytes(), 6)) + chunk(b'IEND', b'')
+
+
+def renderThumbnail(rest, indices, values, size=thumbnailSize):
+    """
+    Draw a shape seen from the front as a (size, size, 3) uint8 image: the
+    mesh as a grey point cloud and the moved vertices coloured by how far
+    they move.
+    """
+    points = np.array(rest, dtype=np.float64)
+    points[indices] += values
+    xy = points[:, :2]
+    lo = xy.min(axis=0)
+    extent = max(float(np.ptp(xy, axis=0).max()), 1e-9)
+    margin = 4
+    scale = (size - 2 * margin - 1) / extent
+    offset = (size - np.ptp(xy, axis=0) * scale) / 2.0
+    pixels = ((xy - lo) * scale + offset).astype(np.int64)
+    px = np.clip(pixels[:, 0], 0, size - 1)
+    py = np.clip(size - 1 - pixels[:, 1], 0, size - 1)
+    image = np.full((size, size, 3), 0.16)
+    counts = np.bincount(py * size + px, minlength=size * size).reshape(size, size).astype(np.float64)
+    if counts.max() > 0:
+        image += 0.5 * np.sqrt(counts / counts.max())[:, :, None]
+    if len(indices) > 0:
+        magnitude = np.linalg.norm(values, axis=1)
+        order = np.argsort(magnitude)
+        palette = heatmap.ramp()[:, :3]
+        codes = (magnitude[order] / max(float(magnitude.max()), 1e-12) * (len(palette) - 1)).astype(np.int64)
+        image[py[indices[order]], px[indices[order]]] = palette[codes]
+    return (np.clip(image, 0.0, 1.0) * 255).astype(np.uint8)
+
+
+class Library(object):
+    """
+    A folder of saved shapes.  Index and file operations are thread safe, so
+    thumbnails can be rendered from the worker pool while the panel is used.
+
+    Arguments:
+    root : string : library folder, created when missing.
+    thumbnailBytes : int : disk budget of the thumbnail cache.
+    """
+
+    def __init__(self, root, thumbnailBytes=64 * 1024 * 1024):
+        self.root = root
+        self.thumbnailBytes = thumbnailBytes
+        self.lock = threading.RLock()
+        self.meshes = LRUCache(256 * 1024 * 1024, sizeOf=lambda value: value[0].nbytes + value[1].nbytes)
+        for folder in ('shapes', 'meshes', 'thumbnails'):
+            os.makedirs(os.path.join(root, folder), exist_ok=True)
+        self.entries = []
+        indexPath = os.path.join(root, 'index.json')
+        if os.path.exists(indexPath):
+            with open(indexPath) as f:
+                self.entries = json.load(f)
+        self.byId = dict((entry['id'], entry) for entry in self.entries)
+        self.thumbnailUsage = sum(e.stat().st_size for e in os.scandir(os.path.join(root, 'thumbnails')) if e.name.endswith('.png'))
+
+    def _path(self, folder, name, ext):
+        return os.path.join(self.root, folder, name + ext)
+
+    def saveIndex(self):
+        with self.lock:
+            _replace(os.path.join(self.root, 'index.json'), json.dumps(self.entries, indent=1).encode('utf-8'))
+
+    def entry(self, shapeId):
+        return self.byId.get(shapeId)
+
+    def hasMesh(self, topology):
+        return os.path.exists(self._path('meshes', topology, '.npz'))
+
+    def addShape(self, name, indices, values, topology, rest=None, triangles=None, source=''):
+        """
+        Store a sparse delta under name and return its index entry.  The rest
+        points and triangles of the topology are only written the first time.
+        """
+        shapeId = uuid.uuid4().hex[:12]
+        if not self.hasMesh(topology):
+            self._savez(self._path('meshes', topology, '.npz'), rest=np.asarray(rest, dtype=np.float64), triangles=np.asarray(triangles, dtype=np.int32))
+        self._savez(self._path('shapes', shapeId, '.npz'), indices=np.asarray(indices, dtype=np.int32), values=np.asarray(values, dtype=np.float32))
+        entry = {'id': shapeId, 'name': name, 'topology': topology, 'moved': int(len(indices)), 'source': source, 'created': clock.time()}
+        with self.lock:
+            self.entries.insert(0, entry)
+            self.byId[shapeId] = entry
+            self.saveIndex()
+        return entry
+
+    def _savez(self, path, **arrays):
+        buffer = io.BytesIO()
+        np.savez_compressed(buffer, **arrays)
+        _replace(path, buffer.getvalue())
+
+    def removeShape(self, shapeId):
+        with self.lock:
+            entry = self.byId.pop(shapeId, None)
+            if entry is None:
+                return
+            self.entries.remove(entry)
+            self.saveIndex()
+        for path in (self._path('shapes', shapeId, '.npz'), self.thumbnailPath(shapeId)):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def renameShape(self, shapeId, name):
+        with self.lock:
+            self.byId[shapeId]['name'] = name
+            self.saveIndex()
+
+    def loadShape(self, shapeId):
+        with np.load(self._path('shapes', shapeId, '.npz')) as data:
+            return (data['indices'].astype(np.int64), data['values'].astype(np.float64))
+
+    def loadMesh(self, topology):
+        with self.lock:
+            mesh = self.meshes.get(topology)
+        if mesh is None:
+            with np.load(self._path('meshes', topology, '.npz')) as data:
+                mesh = (data['rest'], data['triangles'].astype(np.int64))
+            with self.lock:
+                self.meshes.put(topology, mesh)
+        return mesh
+
+    def thumbnailPath(self, shapeId):
+        return self._path('thumbnails', shapeId, '.png')
+
+    def cachedThumbnail(self, shapeId):
+        """Return the cached thumbnail of a shape, marking it recently used, or None."""
+        path = self.thumbnailPath(shapeId)
+        try:
+            os.utime(path)
+        except OSError:
+            return None
+        return path
+
+    def makeThumbnail(self, shapeId):
+        """Render, store and return the thumbnail of a shape.  Safe to run in the worker pool."""
+        entry = self.byId.get(shapeId)
+        if entry is None:
+            return None
+        rest, _ = self.loadMesh(entry['topology'])
+        indices, values = self.loadShape(shapeId)
+        data = pngBytes(renderThumbnail(rest, indices, values))
+        path = self.thumbnailPath(shapeId)
+        with self.lock:
+            try:
+                previous = os.path.getsize(path)
+            except OSError:
+                previous = 0
+            _replace(path, data)
+            self.thumbnailUsage += len(data) - previous
+            if self.thumbnailUsage > self.thumbnailBytes:
+                self.evictThumbnails(keep=path)
+        return path
+
+    def evictThumbnails(self, keep=None):
+        """Delete least recently used thumbnails until the cache is within three quarters of its budget."""
+        files = [e for e in os.scandir(os.path.join(self.root, 'thumbnails')) if e.name.endswith('.png') and e.path != keep]
+        files.sort(key=lambda e: e.stat().st_mtime)
+        usage = sum(e.stat().st_size for e in files)
+        target = 0.75 * self.thumbnailBytes
+        for e in files:
+            if usage <= target:
+                break
+            try:
+                size = e.stat().st_size
+                os.remove(e.path)
+                usage -= size
+            except OSError:
+                pass
+
+        self.thumbnailUsage = usage + (os.path.getsize(keep) if keep and os.path.exists(keep) else 0)
+
+
+class ThumbnailQueue(object):
+    """
+    Render missing thumbnails in the worker pool, collected with ready() on
+    the main thread.  A shape whose thumbnail failed is not requested again.
+    """
+
+    def __init__(self, library):
+        self.library = library
+        self.futures = {}
+        self.failed = set()
+
+    def request(self, shapeIds):
+        for shapeId in shapeIds:
+            if shapeId not in self.futures and shapeId not in self.failed:
+                self.futures[shapeId] = workers.pool().submit(self.library.makeThumbnail, shapeId)
+
+    def ready(self):
+        """Return (id, path) of the thumbnails finished since the last call, path is None on failure."""
+        done = []
+        for shapeId, future in list(self.futures.items()):
+            if future.done():
+                self.futures.pop(shapeId)
+                try:
+                    path = future.result()
+                except Exception:
+                    path = None
+                if path is None:
+                    self.failed.add(shapeId)
+                done.append((shapeId, path))
+
+        return done
+
+    def cancel(self):
+        for future in self.futures.values():
+            future.cancel()
+
+        self.futures = {}
+
+
+def saveKey(library, layer, time, name):
+    """Add the key of layer at time to the library, returns its entry or None when there is no key."""
+    mesh = layers.meshName(layer)
+    bs = layers.bsName(layer)
+    if freeze.isFrozen(layer):
+        keys = freeze.frozenKeys(layer)
+        if time not in keys:
+            return None
+        indices, values = keys[time]
+    else:
+        pairs = layers.getKeyTargets(bs) if cmds.objExists(bs) else {}
+        if time not in pairs:
+            return None
+        indices, values = layers.sparsify(layers.getKeyDelta(bs, pairs[time], layers.vertexCount(mesh)))
+    topology = layers.topologyHash(mesh)
+    rest = triangles = None
+    if not library.hasMesh(topology):
+        rest = layers.getRestPoints(mesh)
+        triangles = layers.getTriangles(mesh)
+    return library.addShape(name, indices, values, topology, rest, triangles, layer)
+
+
+def applyShape(library, shapeId, layer, time):
+    """
+    Key a library shape on layer at time through createKeys(), replacing the
+    key already there.  Shapes saved from another topology go through a
+    cached vertex correspondence, like pasted keys.  Returns the written
+    key times.
+    """
+    if freeze.isFrozen(layer):
+        cmds.warning('Unfreeze ' + layer + ' before applying library shapes to it')
+        return []
+    entry = library.entry(shapeId)
+    indices, values = library.loadShape(shapeId)
+    mesh = layers.meshName(layer)
+    topology = layers.topologyHash(mesh)
+    if topology != entry['topology']:
+        key = (library.root, entry['topology'], mesh, topology)
+        correspondence = correspondences.get(key)
+        rest, triangles = library.loadMesh(entry['topology'])
+        if correspondence is None:
+            vertexIndices, weights, _ = retarget.buildCorrespondence(rest, triangles, layers.getRestPoints(mesh))
+            correspondence = (vertexIndices, weights)
+            correspondences.put(key, correspondence)
+        delta = np.zeros((len(rest), 3))
+        delta[indices] = values
+        indices, values = layers.sparsify(retarget.transferDelta(delta, correspondence[0], correspondence[1]))
+    with utils.undoChunk('satLibrary'):
+        written = layers.createKeys(layer, [(time, indices, values)])
+
+    return sorted(written.keys())
@@ -0,0 +1,68 @@
+# Shape Animation Tool - Updated for Maya 2025 / Python 3
+from .Qt import QtCore, QtWidgets, QtGui
+
+class Ui_Dialog(object):
+
+    def setupUi(self, Dialog):
+        Dialog.setObjectName('Dialog')
+        Dialog.resize(560, 480)
+        self.verticalLayout = QtWidgets.QVBoxLayout(Dialog)
+        self.verticalLayout.setObjectName('verticalLayout')
+        self.topLayout = QtWidgets.QHBoxLayout()
+        self.topLayout.setObjectName('topLayout')
+        self.filter_lineEdit = QtWidgets.QLineEdit(Dialog)
+        self.filter_lineEdit.setClearButtonEnabled(True)
+        self.filter_lineEdit.setObjectName('filter_lineEdit')
+        self.topLayout.addWidget(self.filter_lineEdit)
+        self.folder_btn = QtWidgets.QPushButton(Dialog)
+        self.folder_btn.setObjectName('folder_btn')
+        self.topLayout.addWidget(self.folder_btn)
+        self.verticalLayout.addLayout(self.topLayout)
+        self.shapes_listWidget = QtWidgets.QListWidget(Dialog)
+        self.shapes_listWidget.setViewMode(QtWidgets.QListView.IconMode)
+        self.shapes_listWidget.setMovement(QtWidgets.QListView.Static)
+        self.shapes_listWidget.setResizeMode(QtWidgets.QListView.Adjust)
+        self.shapes_listWidget.setUniformItemSizes(True)
+        self.shapes_listWidget.setIconSize(QtCore.QSize(96, 96))
+        self.shapes_listWidget.setGridSize(QtCore.QSize(112, 124))
+        self.shapes_listWidget.setWordWrap(True)
+        self.shapes_listWidget.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
+        self.shapes_listWidget.setEditTriggers(QtWidgets.QAbstractItemView.EditKeyPressed)
+        self.shapes_listWidget.setObjectName('shapes_listWidget')
+        self.verticalLayout.addWidget(self.shapes_listWidget)
+        self.horizontalLayout = QtWidgets.QHBoxLayout()
+        self.horizontalLayout.setObjectName('horizontalLayout')
+        self.save_btn = QtWidgets.QPushButton(Dialog)
+        self.save_btn.setObjectName('save_btn')
+        self.horizontalLayout.addWidget(self.save_btn)
+        self.apply_btn = QtWidgets.QPushButton(Dialog)
+        self.apply_btn.setObjectName('apply_btn')
+        self.horizontalLayout.addWidget(self.apply_btn)
+        self.delete_btn = QtWidgets.QPushButton(Dialog)
+        self.delete_btn.setObjectName('delete_btn')
+        self.horizontalLayout.addWidget(self.delete_btn)
+        spacerItem = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout.addItem(spacerItem)
+        self.buttonBox = QtWidgets.QDialogButtonBox(Dialog)
+        self.buttonBox.setStandardButtons(QtWidgets.QDialogButtonBox.Close)
+        self.buttonBox.setObjectName('buttonBox')
+        self.horizontalLayout.addWidget(self.buttonBox)
+        self.verticalLayout.addLayout(self.horizontalLayout)
+        self.status_label = QtWidgets.QLabel(Dialog)
+        self.status_label.setObjectName('status_label')
+        self.verticalLayout.addWidget(self.status_label)
+        self.retranslateUi(Dialog)
+        self.buttonBox.rejected.connect(Dialog.reject)
+        QtCore.QMetaObject.connectSlotsByName(Dialog)
+        return
+
+    def retranslateUi(self, Dialog):
+        Dialog.setWindowTitle(QtWidgets.QApplication.translate('Dialog', 'Shape Library', None))
+        self.filter_lineEdit.setPlaceholderText(QtWidgets.QApplication.translate('Dialog', 'Filter', None))
+        self.folder_btn.setText(QtWidgets.QApplication.translate('Dialog', 'Folder ..', None))
+        self.folder_btn.setToolTip(QtWidgets.QApplication.translate('Dialog', 'Open another library folder', None))
+        self.save_btn.setText(QtWidgets.QApplication.translate('Dialog', 'Save Current Key', None))
+        self.save_btn.setToolTip(QtWidgets.QApplication.translate('Dialog', 'Add the key of the current layer at the current frame', None))
+        self.apply_btn.setText(QtWidgets.QApplication.translate('Dialog', 'Apply', None))
+        self.apply_btn.setToolTip(QtWidgets.QApplication.translate('Dialog', 'Key the selected shape on the current layer at the current frame', None))
+        self.delete_btn.setText(QtWidgets.QApplication.translate('Dialog', 'Delete', None))
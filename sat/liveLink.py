@@ -0,0 +1,313 @@
+# Shape Animation Tool - Updated for Maya 2025 / Python 3
+import logging
+import socket
+import threading
+import time as clock
+
+import maya.cmds as cmds
+import numpy as np
+
+from . import freeze
+from . import layers
+from . import utils
+from .liveLinkProtocol import FrameReader, ProtocolError, defaultPort
+
+logger = logging.getLogger(__name__)
+
+
+class Coalescer(object):
+    """
+    Collect the messages received between two writes, one entry per
+    (layer, time).  A replacing message drops what came before it on the same
+    key and adding messages are summed, so a burst of any length turns into
+    a single write per key.
+    """
+
+    def __init__(self):
+        self.pending = {}
+
+    def __len__(self):
+        return len(self.pending)
+
+    def add(self, message):
+        indices = np.frombuffer(message.indices, dtype=np.int32)
+        values = np.frombuffer(message.values, dtype=np.float32 if message.values.typecode == 'f' else np.float64).reshape(-1, 3)
+        self.queue((message.layer, message.time), message.add, indices, values, [message.sent])
+
+    def queue(self, key, add, indices, values, stamps):
+        entry = self.pending.get(key)
+        if entry is None or not add:
+            entry = {'add': add, 'chunks': [], 'stamps': entry['stamps'] if entry is not None else []}
+            self.pending[key] = entry
+        entry['chunks'].append((indices, values))
+        entry['stamps'].extend(stamps)
+
+    def extend(self, newer):
+        """Queue everything pending in the Coalescer newer after what is pending here."""
+        for key, entry in newer.pending.items():
+            for i, (indices, values) in enumerate(entry['chunks']):
+                self.queue(key, entry['add'] or i > 0, indices, values, entry['stamps'] if i == 0 else [])
+
+    def split(self, layer):
+        """Move the entries of layer to a new Coalescer and return it."""
+        result = Coalescer()
+        for key in [key for key in self.pending if key[0] == layer]:
+            result.pending[key] = self.pending.pop(key)
+
+        return result
+
+    def take(self):
+        """Return {(layer, time): (add, indices, values, send times)} and start over."""
+        pending = self.pending
+        self.pending = {}
+        updates = {}
+        for key, entry in pending.items():
+            chunks = entry['chunks']
+            if len(chunks) == 1:
+                indices, values = chunks[0]
+                indices = indices.astype(np.int64)
+                values = values.astype(np.float64)
+            else:
+                indices, inverse = np.unique(np.concatenate([c[0] for c in chunks]), return_inverse=True)
+                values = np.zeros((len(indices), 3))
+                np.add.at(values, inverse, np.concatenate([c[1] for c in chunks]))
+            updates[key] = (entry['add'], indices, values, entry['stamps'])
+
+        return updates
+
+
+def applyUpdates(updates):
+    """
+    Write coalesced updates to their layers, one createKeys() call and one
+    undo step per layer.  Returns ({layer: written key times}, errors).
+    """
+    byLayer = {}
+    for (layer, time), update in updates.items():
+        byLayer.setdefault(layer, []).append((time,) + update[:3])
+
+    written = {}
+    errors = []
+    for layer, items in byLayer.items():
+        mesh = layers.meshName(layer)
+        if '_LR' not in layer or not cmds.objExists(mesh):
+            errors.append('%s is not a SAT layer of an existing mesh' % layer)
+            continue
+        if freeze.isFrozen(layer):
+            errors.append(layer + ' is frozen')
+            continue
+        bs = layers.bsName(layer)
+        count = layers.vertexCount(mesh)
+        pairs = layers.getKeyTargets(bs) if cmds.objExists(bs) else {}
+        keys = []
+        for time, add, indices, values in items:
+            outside = indices[(indices < 0) | (indices >= count)]
+            if len(outside) > 0:
+                errors.append('%s has no vertex %d' % (mesh, outside[0]))
+                continue
+            if add and time in pairs:
+                delta = layers.getKeyDelta(bs, pairs[time], count)
+                delta[indices] += values
+                indices, values = layers.sparsify(delta)
+            keys.append((time, indices, values))
+
+        if len(keys) == 0:
+            continue
+        with utils.undoChunk('satLiveLink'):
+            written[layer] = sorted(layers.createKeys(layer, keys).keys())
+
+    return (written, errors)
+
+
+class Server(object):
+    """
+    Local socket server streaming sculpt deltas into SAT layers.
+
+    Connections are read on background threads, which only decode frames and
+    hand them to a Coalescer.  The first message after a write schedules one
+    flush on the main thread when Maya is idle, so however fast a client
+    sends, every key is written at most once per idle tick.  Only localhost
+    connections are accepted.
+
+    Messages for a layer put on hold, the one being sculpted, are kept aside
+    and written when it is released.
+
+    Arguments:
+    port : int : port to listen on, 0 picks a free one.
+    apply : function : fn(updates) -> (written, errors), applyUpdates() by default.
+    schedule : function : fn(callback) running callback on the main thread
+            when idle, maya.utils.executeDeferred by default.
+    onApplied : function : fn(written) called on the main thread after a write.
+    """
+
+    def __init__(self, port=defaultPort, apply=None, schedule=None, onApplied=None):
+        if schedule is None:
+            import maya.utils
+            schedule = maya.utils.executeDeferred
+        self.port = port
+        self.apply = apply or applyUpdates
+        self.schedule = schedule
+        self.onApplied = onApplied
+        self.lock = threading.Lock()
+        self.coalescer = Coalescer()
+        self.held = Coalescer()
+        self.heldLayers = set()
+        self.scheduled = False
+        self.socket = None
+        self.connections = []
+        self.resetStats()
+
+    def resetStats(self):
+        self.started = clock.time()
+        self.messages = 0
+        self.bytes = 0
+        self.writes = 0
+        self.keys = 0
+        self.errors = []
+        self.latencies = []
+        self.writeSeconds = 0.0
+
+    def isRunning(self):
+        return self.socket is not None
+
+    def start(self):
+        if self.socket is not None:
+            return self.port
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.socket.bind(('127.0.0.1', self.port))
+        self.socket.listen(4)
+        self.port = self.socket.getsockname()[1]
+        self.resetStats()
+        threading.Thread(target=self._accept, args=(self.socket,), name='satLiveLink', daemon=True).start()
+        return self.port
+
+    def stop(self):
+        if self.socket is None:
+            return
+        server, self.socket = self.socket, None
+        try:
+            server.close()
+        except OSError:
+            pass
+        for connection in self.connections:
+            try:
+                connection.shutdown(socket.SHUT_RDWR)
+                connection.close()
+            except OSError:
+                pass
+
+        self.connections = []
+
+    def _accept(self, server):
+        while self.socket is server:
+            try:
+                connection, address = server.accept()
+            except OSError:
+                break
+            connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self.connections.append(connection)
+            threading.Thread(target=self._read, args=(connection,), name='satLiveLinkClient', daemon=True).start()
+
+    def _read(self, connection):
+        reader = FrameReader()
+        try:
+            while True:
+                data = connection.recv(1 << 20)
+                if not data:
+                    break
+                self.receive(reader.feed(data))
+        except ProtocolError as e:
+            self.errors.append(str(e))
+            logger.warning('SAT live link: %s, closing the connection', e)
+        except OSError:
+            pass
+        finally:
+            connection.close()
+            if connection in self.connections:
+                self.connections.remove(connection)
+
+    def receive(self, messages):
+        if len(messages) == 0:
+            return
+        with self.lock:
+            for message in messages:
+                if message.layer in self.heldLayers:
+                    self.held.add(message)
+                else:
+                    self.coalescer.add(message)
+                self.messages += 1
+                self.bytes += message.size
+
+            if self.scheduled or len(self.coalescer) == 0:
+                return
+            self.scheduled = True
+        self.schedule(self.flush)
+
+    def hold(self, layer):
+        """Keep the messages of layer, and those not written yet, until release()."""
+        with self.lock:
+            self.heldLayers.add(layer)
+            self.held.extend(self.coalescer.split(layer))
+
+    def release(self, layer, write=True):
+        """Write the messages kept for layer since hold(), or drop them."""
+        with self.lock:
+            self.heldLayers.discard(layer)
+            released = self.held.split(layer)
+            if not write or len(released) == 0:
+                return
+            released.extend(self.coalescer)
+            self.coalescer = released
+            if self.scheduled:
+                return
+            self.scheduled = True
+        self.schedule(self.flush)
+
+    def flush(self):
+        with self.lock:
+            updates = self.coalescer.take()
+            self.scheduled = False
+        if len(updates) == 0:
+            return {}
+        start = clock.time()
+        try:
+            written, errors = self.apply(updates)
+        except Exception as e:
+            logger.warning('SAT live link write failed', exc_info=True)
+            written, errors = {}, [str(e)]
+        now = clock.time()
+        self.writeSeconds += now - start
+        self.writes += 1
+        self.keys += len(updates)
+        self.errors.extend(errors)
+        for update in updates.values():
+            self.latencies.extend(now - sent for sent in update[3] if sent > 0.0)
+
+        # Recent latencies are enough for the report
+        self.latencies = self.latencies[-10000:]
+        if self.onApplied is not None:
+            self.onApplied(written)
+        return written
+
+    def stats(self):
+        """Return throughput and latency figures since the server started."""
+        seconds = max(clock.time() - self.started, 1e-6)
+        latencies = np.array(self.latencies) * 1000.0
+        return {'port': self.port,
+                'messages': self.messages,
+                'megabytes': self.bytes / 1048576.0,
+                'writes': self.writes,
+                'keysWritten': self.keys,
+                'coalesced': self.messages - self.keys,
+                'messagesPerSecond': self.messages / seconds,
+                'megabytesPerSecond': self.bytes / 1048576.0 / seconds,
+                'writeMs': 1000.0 * self.writeSeconds / max(self.writes, 1),
+                'latencyMs': float(latencies.mean()) if len(latencies) else 0.0,
+                'maxLatencyMs': float(latencies.max()) if len(latencies) else 0.0,
+                'errors': len(self.errors)}
+
+
+def summary(stats):
+    return '%d messages (%.1f MB) in %d writes, %.0f msg/s, %.2f MB/s, latency %.1f ms (max %.1f), %.1f ms per write, %d errors' % (
+        stats['messages'], stats['megabytes'], stats['writes'], stats['messagesPerSecond'], stats['megabytesPerSecond'],
+        stats['latencyMs'], stats['maxLatencyMs'], stats['writeMs'], stats['errors'])
@@ -0,0 +1,106 @@
+# Shape Animation Tool - Updated for Maya 2025 / Python 3
+"""
+Plain Python client of the SAT live link, for external sculpt tools and for
+testing without Maya.
+
+    python -m sat.liveLinkClient pCube1_LR1 --time 12 --vertices 5000 --messages 200
+    python -m sat.liveLinkClient pCube1_LR1 --loopback
+
+--loopback starts an in-process server on stand-in maya modules that only
+counts what it would write, to measure framing, coalescing and throughput
+anywhere.
+"""
+import argparse
+import math
+import random
+import socket
+import time
+
+from . import liveLinkProtocol as protocol
+
+
+class Client(object):
+
+    def __init__(self, port=protocol.defaultPort, host='127.0.0.1'):
+        self.socket = socket.create_connection((host, port))
+        self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def send(self, layer, time_, indices, values, add=False, double=False):
+        """Send the sparse delta of the key of layer at time_, see protocol.encode()."""
+        self.socket.sendall(protocol.encode(layer, time_, indices, values, add, double, time.time()))
+
+    def close(self):
+        self.socket.close()
+
+
+def wave(vertices, step):
+    """A moving sine ripple over the first vertices, as (indices, flat values)."""
+    indices = list(range(vertices))
+    values = []
+    for i in indices:
+        values.extend((0.0, 0.1 * math.sin(0.05 * i + 0.2 * step), 0.0))
+
+    return (indices, values)
+
+
+def stream(client, layer, time_, vertices, messages, rate, add):
+    interval = 1.0 / rate if rate > 0 else 0.0
+    start = time.time()
+    for step in range(messages):
+        indices, values = wave(vertices, step)
+        if add:
+            indices = random.sample(indices, max(1, vertices // 10))
+            values = [0.001] * (3 * len(indices))
+        client.send(layer, time_, indices, values, add)
+        if interval > 0.0:
+            time.sleep(max(0.0, start + (step + 1) * interval - time.time()))
+
+    return time.time() - start
+
+
+def loopback(args):
+    import threading
+    from . import standin
+    standin.install()
+    from . import liveLink
+
+    def dryRun(updates):
+        return ({layer: [t] for layer, t in updates}, [])
+
+    server = liveLink.Server(0, apply=dryRun, schedule=lambda fn: threading.Timer(args.tick, fn).start())
+    port = server.start()
+    client = Client(port)
+    seconds = stream(client, args.layer, args.time, args.vertices, args.messages, args.rate, args.add)
+    client.close()
+    deadline = time.time() + 5.0
+    while server.messages < args.messages and time.time() < deadline:
+        time.sleep(0.01)
+    time.sleep(2 * args.tick)
+    server.stop()
+    print('sent %d messages in %.3f s' % (args.messages, seconds))
+    print(liveLink.summary(server.stats()))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Stream sparse key deltas to a SAT live link server.')
+    parser.add_argument('layer', help='SAT layer, e.g. pCube1_LR1')
+    parser.add_argument('--time', type=float, default=1.0, help='key time')
+    parser.add_argument('--port', type=int, default=protocol.defaultPort)
+    parser.add_argument('--vertices', type=int, default=1000, help='vertices per message')
+    parser.add_argument('--messages', type=int, default=100)
+    parser.add_argument('--rate', type=float, default=0.0, help='messages per second, 0 sends as fast as possible')
+    parser.add_argument('--add', action='store_true', help='send small increments instead of whole deltas')
+    parser.add_argument('--loopback', action='store_true', help='test against an in-process server without Maya')
+    parser.add_argument('--tick', type=float, default=1.0 / 60.0, help='idle tick of the loopback server, in seconds')
+    args = parser.parse_args(argv)
+    if args.loopback:
+        loopback(args)
+        return
+    client = Client(args.port)
+    seconds = stream(client, args.layer, args.time, args.vertices, args.messages, args.rate, args.add)
+    client.close()
+    print('sent %d messages in %.3f s' % (args.messages, seconds))
+
+
+if __name__ == '__main__':
+    main()
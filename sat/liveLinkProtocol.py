@@ -0,0 +1,112 @@
+# Shape Animation Tool - Updated for Maya 2025 / Python 3
+"""
+Wire format of the SAT live link, plain Python so any process can speak it.
+
+Every message is one frame:
+
+    header  : '<4sBBHIdd' magic b'SATL', version, flags, layer name length,
+              vertex count, key time, send time (time.time() of the sender)
+    layer   : utf-8 layer name
+    indices : count little endian int32 vertex ids
+    values  : count * 3 little endian float32 (float64 with FLAG_DOUBLE)
+
+A message replaces the delta of the key at time with the sparse delta it
+carries, or adds to it with FLAG_ADD.  A missing key is created.
+"""
+import struct
+import sys
+from array import array
+
+magic = b'SATL'
+version = 1
+defaultPort = 7733
+header = struct.Struct('<4sBBHIdd')
+FLAG_ADD = 1
+FLAG_DOUBLE = 2
+# Keeps a corrupt header from making the reader wait for gigabytes
+maxCount = 1 << 26
+
+
+class ProtocolError(Exception):
+    pass
+
+
+def _littleEndian(values):
+    if sys.byteorder != 'little':
+        values.byteswap()
+    return values
+
+
+def encode(layer, time, indices, values, add=False, double=False, sent=0.0):
+    """
+    Return the frame of one message as bytes.
+
+    Arguments:
+    layer : string : SAT layer name.
+    time : float : key time.
+    indices : sequence of int : vertex ids.
+    values : sequence : one (x, y, z) per vertex id, or a flat x, y, z list.
+    add : bool : add to the key instead of replacing it.
+    double : bool : send values as float64.
+    sent : float : time.time() of the sender, used to measure latency.
+    """
+    name = layer.encode('utf-8')
+    indices = _littleEndian(array('i', indices))
+    flat = []
+    for v in values:
+        if isinstance(v, (int, float)):
+            flat.append(v)
+        else:
+            flat.extend(v)
+    values = _littleEndian(array('d' if double else 'f', flat))
+    if len(values) != 3 * len(indices):
+        raise ProtocolError('%d values for %d vertices' % (len(values), len(indices)))
+    flags = (FLAG_ADD if add else 0) | (FLAG_DOUBLE if double else 0)
+    return header.pack(magic, version, flags, len(name), len(indices), time, sent) + name + indices.tobytes() + values.tobytes()
+
+
+class Message(object):
+    """One decoded frame, indices and values are flat arrays."""
+    __slots__ = ('layer', 'time', 'add', 'sent', 'indices', 'values', 'size')
+
+    def __init__(self, layer, time, add, sent, indices, values, size):
+        self.layer = layer
+        self.time = time
+        self.add = add
+        self.sent = sent
+        self.indices = indices
+        self.values = values
+        self.size = size
+
+
+class FrameReader(object):
+    """Cut a byte stream into Messages, whatever the size of the chunks fed in."""
+
+    def __init__(self):
+        self.buffer = bytearray()
+
+    def feed(self, data):
+        self.buffer.extend(data)
+        messages = []
+        while len(self.buffer) >= header.size:
+            tag, ver, flags, nameLength, count, time, sent = header.unpack_from(self.buffer)
+            if tag != magic or ver != version:
+                raise ProtocolError('not a SAT live link stream')
+            if count > maxCount:
+                raise ProtocolError('%d vertices in one message' % count)
+            valueSize = 8 if flags & FLAG_DOUBLE else 4
+            size = header.size + nameLength + 4 * count + 3 * valueSize * count
+            if len(self.buffer) < size:
+                break
+            start = header.size
+            layer = bytes(self.buffer[start:start + nameLength]).decode('utf-8')
+            start += nameLength
+            indices = array('i')
+            indices.frombytes(bytes(self.buffer[start:start + 4 * count]))
+            start += 4 * count
+            values = array('d' if valueSize == 8 else 'f')
+            values.frombytes(bytes(self.buffer[start:size]))
+            del self.buffer[:size]
+            messages.append(Message(layer, time, bool(flags & FLAG_ADD), sent, _littleEndian(indices), _littleEndian(values), size))
+
+        return messages
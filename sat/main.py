@@ -22,7 +22,36 @@ import logging
 import inspect
 from . import mainWindow
 from . import aboutWindow
+from . import retimeWindow
+from . import rangeKeyWindow
+from . import libraryWindow
+from . import reportWindow
 from . import utils
+from . import layers
+from . import scrubCache
+from . import ghosts
+from . import symmetry
+from . import retarget
+from . import retime
+from . import clipboard
+from . import instancing
+from . import freeze
+from . import performance
+from . import integrity
+from . import report
+from . import storage
+from . import workers
+from . import quantize
+from . import merge
+from . import split
+from . import heatmap
+from . import temporal
+from . import masks
+from . import liveLink
+from . import sceneEvents
+from . import rangeKey
+from . import library
+from .cache import KeyPointCache
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
@@ -50,6 +79,223 @@ class AboutWindow(QtWidgets.QDialog, aboutWindow.Ui_Dialog):
         return
 
 
+class RetimeWindow(QtWidgets.QDialog, retimeWindow.Ui_Dialog):
+
+    def __init__(self, parent=mayaMainWindow()):
+        super(RetimeWindow, self).__init__(parent)
+        self.setupUi(self)
+        return
+
+
+class RangeKeyWindow(QtWidgets.QDialog, rangeKeyWindow.Ui_Dialog):
+
+    def __init__(self, parent=mayaMainWindow()):
+        super(RangeKeyWindow, self).__init__(parent)
+        self.setupUi(self)
+        return
+
+
+class LibraryWindow(QtWidgets.QDialog, libraryWindow.Ui_Dialog):
+    """
+    Shape library panel.  Shapes are saved from and applied to the current
+    layer of owner, the SAT window.  A timer fills in the thumbnails of the
+    shapes in view as the worker pool renders them.
+    """
+    shapeApplied = QtCore.Signal(float)
+
+    def __init__(self, owner, parent=mayaMainWindow()):
+        super(LibraryWindow, self).__init__(parent)
+        self.setupUi(self)
+        self.owner = owner
+        self.library = None
+        self.queue = None
+        self.items = {}
+        self.timer = QtCore.QTimer(self)
+        self.timer.setInterval(100)
+        self.filter_lineEdit.textChanged.connect(self.filterShapes)
+        self.folder_btn.clicked.connect(self.pickFolder)
+        self.save_btn.clicked.connect(self.saveShape)
+        self.apply_btn.clicked.connect(self.applyShape)
+        self.delete_btn.clicked.connect(self.deleteShapes)
+        self.shapes_listWidget.itemDoubleClicked.connect(self.applyShape)
+        self.shapes_listWidget.itemChanged.connect(self.renameShape)
+        self.finished.connect(self.closed)
+        self.timer.timeout.connect(self.fillThumbnails)
+        self.setAttribute(QtCore.Qt.WA_DeleteOnClose)
+        return
+
+    def start(self):
+        self.openLibrary(library.defaultRoot())
+        self.show()
+        self.timer.start()
+        return
+
+    def addItem(self, entry, row=None):
+        item = QtWidgets.QListWidgetItem(entry['name'])
+        item.setData(QtCore.Qt.UserRole, entry['id'])
+        item.setFlags(item.flags() | QtCore.Qt.ItemIsEditable)
+        item.setToolTip('%s\n%d vertices, from %s' % (entry['name'], entry['moved'], entry['source']))
+        if row is None:
+            self.shapes_listWidget.addItem(item)
+        else:
+            self.shapes_listWidget.insertItem(row, item)
+        self.items[entry['id']] = item
+        return item
+
+    def openLibrary(self, root):
+        if self.queue is not None:
+            self.queue.cancel()
+        try:
+            self.library = library.Library(root)
+        except (OSError, ValueError) as e:
+            cmds.warning('Could not open the shape library %s: %s' % (root, e))
+            return
+        self.queue = library.ThumbnailQueue(self.library)
+        self.items = {}
+        self.shapes_listWidget.blockSignals(True)
+        self.shapes_listWidget.clear()
+        for entry in self.library.entries:
+            self.addItem(entry)
+
+        self.shapes_listWidget.blockSignals(False)
+        self.filterShapes(self.filter_lineEdit.text())
+        self.status_label.setText('%d shapes in %s' % (len(self.library.entries), root))
+        return
+
+    def filterShapes(self, text):
+        text = text.lower()
+        for item in self.items.values():
+            item.setHidden(text not in item.text().lower())
+
+        return
+
+    def fillThumbnails(self):
+        # Only the items in view get thumbnails, cached ones straight from disk
+        if self.library is None or not self.isVisible():
+            return
+        shapeList = self.shapes_listWidget
+        for shapeId, path in self.queue.ready():
+            item = self.items.get(shapeId)
+            if item is not None and path is not None:
+                item.setIcon(QtGui.QIcon(path))
+
+        rect = shapeList.viewport().rect()
+        first = max(shapeList.indexAt(QtCore.QPoint(1, 1)).row(), 0)
+        last = shapeList.indexAt(QtCore.QPoint(rect.width() - 2, rect.height() - 2)).row()
+        if last < 0:
+            last = shapeList.count() - 1
+        missing = []
+        for row in range(first, min(last, first + 500) + 1):
+            item = shapeList.item(row)
+            if item.isHidden() or not item.icon().isNull():
+                continue
+            shapeId = item.data(QtCore.Qt.UserRole)
+            path = self.library.cachedThumbnail(shapeId)
+            if path is not None:
+                item.setIcon(QtGui.QIcon(path))
+            else:
+                missing.append(shapeId)
+
+        self.queue.request(missing)
+        return
+
+    def selectedIds(self):
+        return [item.data(QtCore.Qt.UserRole) for item in self.shapes_listWidget.selectedItems()]
+
+    def saveShape(self):
+        layer = self.owner.curLayer
+        if self.library is None or not cmds.objExists(self.owner.bs_name):
+            return
+        time = cmds.currentTime(query=True)
+        name, ok = QtWidgets.QInputDialog.getText(self, 'Save Shape', 'Name:', text='%s %g' % (storage.stripNamespace(layer), time))
+        if not ok or not name:
+            return
+        entry = library.saveKey(self.library, layer, time, name)
+        if entry is None:
+            cmds.warning('%s has no key at frame %g' % (layer, time))
+            return
+        self.shapes_listWidget.blockSignals(True)
+        item = self.addItem(entry, 0)
+        self.shapes_listWidget.blockSignals(False)
+        self.shapes_listWidget.setCurrentItem(item)
+        self.filterShapes(self.filter_lineEdit.text())
+        return
+
+    def applyShape(self, *args):
+        ids = self.selectedIds()
+        if self.library is None or len(ids) == 0 or self.owner.editMode or not self.owner.curLayer or self.owner.layerFrozen():
+            return
+        time = cmds.currentTime(query=True)
+        library.applyShape(self.library, ids[0], self.owner.curLayer, time)
+        self.shapeApplied.emit(time)
+        return
+
+    def deleteShapes(self):
+        ids = self.selectedIds()
+        if len(ids) == 0:
+            return
+        answer = QtWidgets.QMessageBox.question(self, 'Shape Library', 'Delete %d shapes from the library?' % len(ids), QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No)
+        if answer != QtWidgets.QMessageBox.Yes:
+            return
+        for shapeId in ids:
+            self.library.removeShape(shapeId)
+            item = self.items.pop(shapeId)
+            self.shapes_listWidget.takeItem(self.shapes_listWidget.row(item))
+
+        return
+
+    def renameShape(self, item):
+        # itemChanged also fires for new icons
+        if self.library is None or not item.text():
+            return
+        entry = self.library.entry(item.data(QtCore.Qt.UserRole))
+        if entry is not None and entry['name'] != item.text():
+            self.library.renameShape(entry['id'], item.text())
+        return
+
+    def pickFolder(self):
+        root = QtWidgets.QFileDialog.getExistingDirectory(self, 'Shape Library Folder', self.library.root if self.library else '')
+        if root:
+            self.openLibrary(root)
+        return
+
+    def closed(self, *args):
+        self.timer.stop()
+        if self.queue is not None:
+            self.queue.cancel()
+        return
+
+
+class ReportWindow(QtWidgets.QDialog, reportWindow.Ui_Dialog):
+
+    def __init__(self, parent=mayaMainWindow()):
+        super(ReportWindow, self).__init__(parent)
+        self.setupUi(self)
+        self.rows = []
+        return
+
+    def setRows(self, rows):
+        self.rows = rows
+        table = self.report_tableWidget
+        table.setSortingEnabled(False)
+        table.clear()
+        table.setColumnCount(len(report.columns))
+        table.setHorizontalHeaderLabels([title for _, title in report.columns])
+        table.setRowCount(len(rows))
+        for r, row in enumerate(rows):
+            for c, (key, _) in enumerate(report.columns):
+                value = row[key]
+                if key == 'targetBytes':
+                    value = round(value / 1024.0, 1)
+                item = QtWidgets.QTableWidgetItem()
+                item.setData(QtCore.Qt.DisplayRole, value)
+                table.setItem(r, c, item)
+
+        table.setSortingEnabled(True)
+        table.resizeColumnsToContents()
+        return
+
+
 try:
     if not cmds.pluginInfo('SHAPESBrush.mll', query=True, loaded=True):
         cmds.loadPlugin('SHAPESBrush.mll')
@@ -77,6 +323,28 @@ class MainWindow(QtWidgets.QMainWindow, mainWindow.Ui_MainWindow):
         self.curFrame = 0
         self.keyFrames = []
         self.brushMode = 1
+        self.scrubCaches = {}
+        self.scrubCacheBytes = 512 * 1024 * 1024
+        self.scrubIdleTime = None
+        self.scrubTimer = QtCore.QTimer(self)
+        self.scrubTimer.setInterval(50)
+        self.keyCache = KeyPointCache(256 * 1024 * 1024)
+        self.ghosts = ghosts.Ghosts(self.keyCache)
+        self.ghostsOn = False
+        self.heatmap = heatmap.Heatmap(self.keyCache)
+        self.heatmapOn = False
+        self.falloffOn = False
+        self.falloffRadius = 10.0
+        self.falloffCurve = 'smooth'
+        self.sculptBefore = None
+        self.performance = performance.PerformanceMode(lambda: self.meshes)
+        self.liveLink = None
+        self.keyTimes = {}
+        self.keyTimesDirty = False
+        self.timeJob = None
+        self.sceneDirty = False
+        self.libraryWindow = None
+        workers.setProgressHandler(self.showProgress)
         self.setWindowTitle('Shape Animation Tool ' + version)
         self.sculpt_btn.setStyleSheet('')
         return
@@ -87,6 +355,9 @@ class MainWindow(QtWidgets.QMainWindow, mainWindow.Ui_MainWindow):
             self.sculpt_btn.setChecked(False)
         try:
             if self.isVisible():
+                self.updateScrubCaches()
+                self.updateGhosts()
+                self.updateHeatmap()
                 currentKey = cmds.currentTime(query=True)
                 for i in range(len(self.keyFrames)):
                     if self.keyFrames[i] == currentKey:
@@ -102,6 +373,16 @@ class MainWindow(QtWidgets.QMainWindow, mainWindow.Ui_MainWindow):
         return
 
     def start(self):
+        logger.debug('Start ' + inspect.stack()[0][3])
+        self.loadScene()
+        self.checkIntegrity(True)
+        quantize.installCallbacks()
+        sceneEvents.installCallbacks(self.sceneEvent)
+        playBackSlider = mel.eval('$tmpVar=$gPlayBackSlider')
+        cmds.timeControl(playBackSlider, edit=True, pressCommand=partial(self.updateFrame, True), releaseCommand=partial(self.updateFrame, True))
+        return
+
+    def loadScene(self):
         logger.debug('Start ' + inspect.stack()[0][3])
         sel = cmds.ls(sl=1)
         satNode = cmds.ls('sat')
@@ -110,14 +391,17 @@ class MainWindow(QtWidgets.QMainWindow, mainWindow.Ui_MainWindow):
             cmds.addAttr('sat', longName='time', attributeType='float')
             cmds.connectAttr('time1.outTime', 'sat.time')
         cmds.select('sat', add=True)
+        try:
+            storage.migrateLegacy()
+        except:
+            logger.warning('Could not migrate SAT data of the sat node', exc_info=True)
         try:
             self.loadData()
         except:
             pass
 
-        cmds.scriptJob(attributeChange=['sat.time', partial(self.updateFrame, True)])
-        playBackSlider = mel.eval('$tmpVar=$gPlayBackSlider')
-        cmds.timeControl(playBackSlider, edit=True, pressCommand=partial(self.updateFrame, True), releaseCommand=partial(self.updateFrame, True))
+        if self.timeJob is None or not cmds.scriptJob(exists=self.timeJob):
+            self.timeJob = cmds.scriptJob(attributeChange=['sat.time', partial(self.updateFrame, True)])
         self.fillGeoList()
         self.updateUI()
         if self.editMode:
@@ -131,6 +415,84 @@ class MainWindow(QtWidgets.QMainWindow, mainWindow.Ui_MainWindow):
             cmds.select(sel)
         return
 
+    def sceneEvent(self, event):
+        """
+        Keep SAT in step with the scene.  Before a new scene replaces the
+        current one every display node and cache is dropped while its nodes
+        still exist.  Afterwards only the layer list is read back, key times
+        load per layer when it is shown, so a scene switch costs SAT a few
+        queries whatever the size of the scene.
+        """
+        logger.debug('Start ' + inspect.stack()[0][3])
+        if event in sceneEvents.beforeSwitch:
+            self.releaseScene()
+            return
+        if event in sceneEvents.keysEdited:
+            # Cached key times are dropped at once, the current layer is
+            # read again when the edit is done
+            self.keyTimes = {}
+            if not self.keyTimesDirty:
+                self.keyTimesDirty = True
+                QtCore.QTimer.singleShot(0, self.reloadKeytimes)
+            return
+        if event in sceneEvents.afterReference and sceneEvents.isReadingFile():
+            return
+        # References load one by one, rebuild once they are all in
+        if not self.sceneDirty:
+            self.sceneDirty = True
+            QtCore.QTimer.singleShot(0, self.reloadScene)
+        return
+
+    def releaseScene(self):
+        logger.debug('Start ' + inspect.stack()[0][3])
+        self.scrubTimer.stop()
+        for cache in self.scrubCaches.values():
+            cache.release()
+
+        self.scrubCaches = {}
+        self.ghosts.clear()
+        self.heatmap.clear()
+        self.performance.restore()
+        self.keyCache.clear()
+        self.keyTimes = {}
+        if self.liveLink is not None and self.editMode:
+            self.liveLink.release(self.curLayer, False)
+        self.sculptBefore = None
+        self.editMode = False
+        self.sculpt_btn.blockSignals(True)
+        self.sculpt_btn.setChecked(False)
+        self.sculpt_btn.blockSignals(False)
+        self.meshes = []
+        self.curLayer = ''
+        self.curMesh = ''
+        self.bs_name = ''
+        self.keyFrames = []
+        return
+
+    def reloadScene(self):
+        logger.debug('Start ' + inspect.stack()[0][3])
+        self.sceneDirty = False
+        layerSet = set(storage.listLayers())
+        for layer in [layer for layer in self.scrubCaches if layer not in layerSet]:
+            self.scrubCaches.pop(layer).release()
+
+        if self.curLayer not in layerSet:
+            self.ghosts.clear()
+            self.heatmap.clear()
+        self.keyCache.clear()
+        self.keyTimes = {}
+        self.loadScene()
+        self.statusbar.showMessage('%d SAT layers in the scene' % len(self.meshes), 3000)
+        return
+
+    def reloadKeytimes(self):
+        logger.debug('Start ' + inspect.stack()[0][3])
+        self.keyTimesDirty = False
+        if self.curLayer and self.bs_name:
+            self.getKeytimes()
+            self.updateFrame(False)
+        return
+
     def connectSignals(self):
         logger.debug('Start ' + inspect.stack()[0][3])
         self.add_btn.clicked.connect(self.addMesh)
@@ -156,6 +518,7 @@ class MainWindow(QtWidgets.QMainWindow, mainWindow.Ui_MainWindow):
         self.actionDelete_All_Keys.triggered.connect(self.deleteAllKeys)
         self.actionPrevious_Key.triggered.connect(partial(self.stepKey, 'prev'))
         self.actionNext_Key.triggered.connect(partial(self.stepKey, 'next'))
+        self.actionKey_Range.triggered.connect(self.keyRange)
         self.actionBrush_Tool_Window.triggered.connect(self.showBrushWindow)
         self.actionEdit_Mode_2.triggered.connect(self.scultpMenuOn)
         self.actionUse_Artisan_Tool.triggered.connect(self.brush)
@@ -164,6 +527,41 @@ class MainWindow(QtWidgets.QMainWindow, mainWindow.Ui_MainWindow):
         self.actionReset_Shape_to_Default.triggered.connect(self.resetShape)
         self.actionHome_Page.triggered.connect(self.homePage)
         self.actionAbout.triggered.connect(self.about)
+        self.actionScrub_Cache.toggled.connect(self.scrubCache)
+        self.actionScrub_Cache_Memory.triggered.connect(self.scrubCacheMemory)
+        self.actionClear_Scrub_Cache.triggered.connect(self.clearScrubCache)
+        self.scrubTimer.timeout.connect(self.fillScrubCaches)
+        self.actionCopy_Key.triggered.connect(partial(self.copyKeys, False))
+        self.actionCopy_Key_Range.triggered.connect(partial(self.copyKeys, True))
+        self.actionPaste_Keys.triggered.connect(self.pasteKeys)
+        self.actionShape_Library.triggered.connect(self.shapeLibrary)
+        self.actionMirror_Key.triggered.connect(partial(self.mirror, False))
+        self.actionMirror_Layer.triggered.connect(partial(self.mirror, True))
+        self.actionRetarget_Layer.triggered.connect(self.retargetLayer)
+        self.actionRetime_Keys.triggered.connect(self.retimeKeys)
+        self.actionInstance_Layer.triggered.connect(self.instanceLayer)
+        self.actionRefresh_Instances.triggered.connect(self.refreshInstances)
+        self.actionRemove_Instances.triggered.connect(self.removeInstances)
+        self.actionFreeze_Layer.triggered.connect(self.freezeLayer)
+        self.actionUnfreeze_Layer.triggered.connect(self.unfreezeLayer)
+        self.actionQuantize_Layer.triggered.connect(self.quantizeLayer)
+        self.actionMerge_Layers.triggered.connect(self.mergeLayers)
+        self.actionSplit_Layer.triggered.connect(self.splitLayer)
+        self.actionPaint_Mask.triggered.connect(self.paintMask)
+        self.actionApply_Mask.triggered.connect(self.applyMask)
+        self.actionClear_Mask.triggered.connect(self.clearMask)
+        self.actionGhosts.toggled.connect(self.showGhosts)
+        self.actionGhost_Keys.triggered.connect(self.ghostKeys)
+        self.actionHeatmap.toggled.connect(self.showHeatmap)
+        self.actionTemporal_Falloff.toggled.connect(self.temporalFalloff)
+        self.actionTemporal_Falloff_Settings.triggered.connect(self.temporalFalloffSettings)
+        self.actionHeatmap_Mode.triggered.connect(self.heatmapMode)
+        self.actionPerformance_Mode.toggled.connect(self.performanceMode)
+        self.actionCheck_Integrity.triggered.connect(partial(self.checkIntegrity, False))
+        self.actionLayer_Report.triggered.connect(self.layerReport)
+        self.actionLive_Link.toggled.connect(self.liveLinkServer)
+        self.actionLive_Link_Status.triggered.connect(self.liveLinkStatus)
+        self.actionCull_Distance.triggered.connect(self.cullDistance)
         return
 
     def updateUI(self):
@@ -217,7 +615,10 @@ class MainWindow(QtWidgets.QMainWindow, mainWindow.Ui_MainWindow):
             pass
 
         self.saveData()
-        self.getKeytimes()
+        self.getKeytimes(True)
+        self.actionScrub_Cache.blockSignals(True)
+        self.actionScrub_Cache.setChecked(self.curLayer in self.scrubCaches)
+        self.actionScrub_Cache.blockSignals(False)
         self.updateFrame(True)
         if cmds.objExists(self.curMesh):
             cmds.select(self.curMesh)
@@ -225,24 +626,23 @@ class MainWindow(QtWidgets.QMainWindow, mainWindow.Ui_MainWindow):
             cmds.select(self.bs_name, add=1)
         return
 
-    def addMesh(self):
-        logger.debug('Start ' + inspect.stack()[0][3])
-
-        def setLayerName(name):
-            i = 1
-            layer = name + '_LR1'
-            while layer in self.meshes:
-                i += 1
-                layer = name + '_LR' + str(i)
+    def newLayerName(self, name):
+        i = 1
+        layer = name + '_LR1'
+        while layer in self.meshes:
+            i += 1
+            layer = name + '_LR' + str(i)
 
-            return layer
+        return layer
 
+    def addMesh(self):
+        logger.debug('Start ' + inspect.stack()[0][3])
         shape = cmds.ls(sl=True, dag=True, noIntermediate=True, geometry=True)
         if len(shape) == 0:
             return
         mesh = cmds.listRelatives(shape, parent=True)[0]
         self.curMesh = mesh
-        self.curLayer = setLayerName(mesh)
+        self.curLayer = self.newLayerName(mesh)
         self.meshes.append(self.curLayer)
         self.fillGeoList()
         self.saveData()
@@ -260,6 +660,8 @@ class MainWindow(QtWidgets.QMainWindow, mainWindow.Ui_MainWindow):
         except:
             pass
 
+        if self.curLayer in self.scrubCaches:
+            self.scrubCaches.pop(self.curLayer).release()
         self.meshes.remove(self.curLayer)
         try:
             self.curLayer = self.meshes[-1]
@@ -329,7 +731,11 @@ class MainWindow(QtWidgets.QMainWindow, mainWindow.Ui_MainWindow):
         for mesh in self.meshes:
             meshItem = QtWidgets.QListWidgetItem(mesh)
             meshItem.setFlags(QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable | QtCore.Qt.ItemIsUserCheckable)
-            meshItem.setFont(QtGui.QFont('Verdana', 10))
+            font = QtGui.QFont('Verdana', 10)
+            font.setItalic(freeze.isFrozen(mesh))
+            meshItem.setFont(font)
+            if masks.hasMask(mesh):
+                meshItem.setToolTip(mesh + ' is masked')
             meshItem.setCheckState(QtCore.Qt.Checked)
             self.geo_listWidget.addItem(meshItem)
             if mesh == self.curLayer:
@@ -362,12 +768,17 @@ class MainWindow(QtWidgets.QMainWindow, mainWindow.Ui_MainWindow):
         if len(self.meshes) == 0:
             return
         for mesh in self.meshes:
-            bs_name = self.returnName(mesh) + '_satBS'
+            bs_name = layers.bsName(mesh)
             try:
                 cmds.delete(bs_name)
             except:
                 pass
 
+        for cache in self.scrubCaches.values():
+            cache.release()
+
+        self.scrubCaches = {}
+        self.scrubTimer.stop()
         self.meshes = []
         self.keyFrames = []
         self.fillGeoList()
@@ -378,11 +789,19 @@ class MainWindow(QtWidgets.QMainWindow, mainWindow.Ui_MainWindow):
 
     def sculpt(self, on, *args):
         logger.debug('Start Sculpt')
+        if on and self.layerFrozen():
+            self.sculpt_btn.blockSignals(True)
+            self.sculpt_btn.setChecked(False)
+            self.sculpt_btn.blockSignals(False)
+            return
         self.editMode = on
         self.curFrame = cmds.currentTime(query=True)
         utils.pyToAttr('sat.sculptMode', self.editMode)
         utils.pyToAttr('sat.currentFrame', self.curFrame)
         if on:
+            # Live link messages for this layer wait for sculpt off
+            if self.liveLink is not None:
+                self.liveLink.hold(self.curLayer)
             if not cmds.objExists(self.bs_name):
                 self.setKey()
             else:
@@ -396,6 +815,11 @@ class MainWindow(QtWidgets.QMainWindow, mainWindow.Ui_MainWindow):
                 if v > 0.1:
                     self.bs1 = sh
 
+            self.sculptBefore = None
+            if self.falloffOn:
+                pairs = layers.getKeyTargets(self.bs_name)
+                if self.curFrame in pairs:
+                    self.sculptBefore = (self.curFrame, layers.getKeyDelta(self.bs_name, pairs[self.curFrame], layers.vertexCount(self.curMesh)))
             self.bs1 = cmds.duplicate(self.curMesh, n=self.bs1)[0]
             cmds.setAttr(self.bs1 + '.tx', lock=0)
             cmds.setAttr(self.bs1 + '.ty', lock=0)
@@ -439,7 +863,12 @@ class MainWindow(QtWidgets.QMainWindow, mainWindow.Ui_MainWindow):
             if useShapesBrush:
                 self.shapesBrush_btn.setEnabled(True)
             self.resetShape_btn.setEnabled(True)
-            cmds.setAttr(self.curMesh + '.lodVisibility', False)
+            for cache in self.scrubCaches.values():
+                cache.hide()
+
+            self.heatmap.hide()
+            utils.hideMesh(self.curMesh, 'sculpt')
+            self.updateGhosts()
             self.actionUse_Artisan_Tool.setEnabled(True)
             self.actionUse_ShapesBrush_plugin.setEnabled(True)
             self.actionUse_Components.setEnabled(True)
@@ -456,9 +885,20 @@ class MainWindow(QtWidgets.QMainWindow, mainWindow.Ui_MainWindow):
                     if v > 0.1:
                         self.bs1 = sh
                         break
-            # Delete the temporary sculpt mesh
-            if self.bs1 and cmds.objExists(self.bs1):
-                cmds.delete(self.bs1)
+            # Deleting the temporary sculpt mesh bakes the sculpt into the
+            # key target, the falloff propagation undoes together with it
+            with utils.undoChunk('satSculpt'):
+                if self.bs1 and cmds.objExists(self.bs1):
+                    cmds.delete(self.bs1)
+                self.keysChanged(self.curFrame)
+                if self.sculptBefore is not None:
+                    keyTime, before = self.sculptBefore
+                    self.sculptBefore = None
+                    for t in temporal.propagateEdit(self.curLayer, keyTime, before, self.falloffRadius, self.falloffCurve):
+                        self.keysChanged(t)
+
+            if self.liveLink is not None:
+                self.liveLink.release(self.curLayer)
             mel.eval('SelectTool')
             cmds.select(clear=True)
             if cmds.objExists(self.curMesh):
@@ -476,7 +916,7 @@ class MainWindow(QtWidgets.QMainWindow, mainWindow.Ui_MainWindow):
             if useShapesBrush:
                 self.shapesBrush_btn.setEnabled(False)
             self.resetShape_btn.setEnabled(False)
-            cmds.setAttr(self.curMesh + '.lodVisibility', True)
+            utils.showMesh(self.curMesh, 'sculpt')
             self.actionUse_Artisan_Tool.setEnabled(False)
             self.actionUse_ShapesBrush_plugin.setEnabled(False)
             self.actionUse_Components.setEnabled(False)
@@ -555,7 +995,7 @@ class MainWindow(QtWidgets.QMainWindow, mainWindow.Ui_MainWindow):
 
     def setKey(self):
         logger.debug('Start ' + inspect.stack()[0][3])
-        if len(self.meshes) == 0:
+        if len(self.meshes) == 0 or self.layerFrozen():
             return
 
         def getFirstFreeTargetIdPair():
@@ -626,6 +1066,7 @@ class MainWindow(QtWidgets.QMainWindow, mainWindow.Ui_MainWindow):
         cmds.setAttr(multNode + '.input2', -1)
         cmds.connectAttr(self.bs_name + '.' + bs1_name, multNode + '.input1')
         cmds.connectAttr(multNode + '.output', self.bs_name + '.' + bs0_name)
+        self.keysChanged(currentTime, 2)
         self.saveData()
         cmds.select(self.curMesh)
         cmds.select(self.bs_name, add=True)
@@ -634,7 +1075,7 @@ class MainWindow(QtWidgets.QMainWindow, mainWindow.Ui_MainWindow):
 
     def deleteKey(self):
         logger.debug('Start ' + inspect.stack()[0][3])
-        if len(self.meshes) == 0:
+        if len(self.meshes) == 0 or self.layerFrozen():
             return
         currentTime = cmds.currentTime(query=True)
         if cmds.objExists(self.bs_name):
@@ -667,6 +1108,7 @@ class MainWindow(QtWidgets.QMainWindow, mainWindow.Ui_MainWindow):
                             cmds.delete(sh + '_mult')
 
                     cmds.cutKey(self.bs_name, time=(currentTime, currentTime))
+                    self.keysChanged(currentTime, 2)
                     self.keyFrames.remove(currentTime)
                     self.saveData()
                     self.updateFrame(True)
@@ -677,7 +1119,7 @@ class MainWindow(QtWidgets.QMainWindow, mainWindow.Ui_MainWindow):
 
     def deleteAllKeys(self):
         logger.debug('Start ' + inspect.stack()[0][3])
-        if len(self.meshes) == 0:
+        if len(self.meshes) == 0 or self.layerFrozen():
             return
         if cmds.objExists(self.bs_name):
             shapes = cmds.listAttr(self.curLayer + '_satBS.w', m=True)
@@ -695,6 +1137,7 @@ class MainWindow(QtWidgets.QMainWindow, mainWindow.Ui_MainWindow):
                     pass
 
             self.keyFrames = []
+            self.keysChanged()
             self.saveData()
             self.updateFrame(True)
             cmds.select(self.curMesh)
@@ -702,6 +1145,750 @@ class MainWindow(QtWidgets.QMainWindow, mainWindow.Ui_MainWindow):
             return
         return
 
+    def scrubCache(self, on):
+        logger.debug('Start ' + inspect.stack()[0][3])
+        if on:
+            if self.curLayer in self.meshes and self.curLayer not in self.scrubCaches:
+                self.scrubCaches[self.curLayer] = scrubCache.ScrubCache(self.curLayer, self.scrubCacheBytes)
+        elif self.curLayer in self.scrubCaches:
+            self.scrubCaches.pop(self.curLayer).release()
+        if len(self.scrubCaches) > 0:
+            self.scrubTimer.start()
+        else:
+            self.scrubTimer.stop()
+        self.updateScrubLabel()
+        return
+
+    def scrubCacheMemory(self):
+        logger.debug('Start ' + inspect.stack()[0][3])
+        mb, ok = QtWidgets.QInputDialog.getInt(self, 'Scrub Cache', 'Memory per layer (MB):', self.scrubCacheBytes // (1024 * 1024), 16, 65536)
+        if not ok:
+            return
+        self.scrubCacheBytes = mb * 1024 * 1024
+        for cache in self.scrubCaches.values():
+            cache.frames.resize(self.scrubCacheBytes)
+
+        self.updateScrubLabel()
+        return
+
+    def clearScrubCache(self):
+        logger.debug('Start ' + inspect.stack()[0][3])
+        for cache in self.scrubCaches.values():
+            cache.hide()
+            cache.invalidate()
+            cache.frames.resetStats()
+
+        self.updateScrubLabel()
+        return
+
+    def keysChanged(self, time=None, spread=1, mesh=None):
+        logger.debug('Start ' + inspect.stack()[0][3])
+        if mesh is None:
+            mesh = self.curMesh
+        for layer in [layer for layer in self.keyTimes if layers.meshName(layer) == mesh]:
+            self.keyTimes.pop(layer)
+
+        self.invalidateScrubCache(time, spread, mesh)
+        # The other layers of the mesh are not keyed on this time, the edit
+        # changes the mesh between their keys too
+        shared = len([layer for layer in self.meshes if layers.meshName(layer) == mesh]) > 1
+        if time is None or shared:
+            self.keyCache.invalidateKeys(mesh)
+            self.ghosts.invalidate()
+            self.heatmap.invalidate()
+        else:
+            self.keyCache.invalidateKeys(mesh, [time])
+            self.ghosts.invalidate([time])
+            self.heatmap.invalidate([time])
+        return
+
+    def showGhosts(self, on):
+        logger.debug('Start ' + inspect.stack()[0][3])
+        self.ghostsOn = on
+        if on:
+            self.updateGhosts()
+        else:
+            self.ghosts.clear()
+        return
+
+    def ghostKeys(self):
+        logger.debug('Start ' + inspect.stack()[0][3])
+        count, ok = QtWidgets.QInputDialog.getInt(self, 'Onion Skin Ghosts', 'Keys before and after:', self.ghosts.count, 1, 10)
+        if not ok:
+            return
+        self.ghosts.count = count
+        self.updateGhosts()
+        return
+
+    def updateGhosts(self):
+        if not self.ghostsOn:
+            return
+        if self.curLayer not in self.meshes or not cmds.objExists(self.curMesh):
+            self.ghosts.clear()
+            return
+        if cmds.play(query=True, state=True):
+            return
+        self.ghosts.update(self.curLayer, self.keyFrames, cmds.currentTime(query=True))
+        return
+
+    def performanceMode(self, on):
+        logger.debug('Start ' + inspect.stack()[0][3])
+        if on:
+            self.performance.enable()
+        else:
+            self.performance.disable()
+        return
+
+    def liveLinkServer(self, on):
+        logger.debug('Start ' + inspect.stack()[0][3])
+        if not on:
+            if self.liveLink is not None:
+                self.liveLink.stop()
+            return
+        if self.liveLink is None:
+            self.liveLink = liveLink.Server(onApplied=self.liveLinkApplied)
+        try:
+            port = self.liveLink.start()
+        except OSError as e:
+            cmds.warning('Could not start the SAT live link: ' + str(e))
+            self.actionLive_Link.setChecked(False)
+            return
+        if self.editMode:
+            self.liveLink.hold(self.curLayer)
+        self.statusbar.showMessage('Live link listening on port %d' % port, 5000)
+        return
+
+    def liveLinkApplied(self, written):
+        logger.debug('Start ' + inspect.stack()[0][3])
+        added = [layer for layer in written if layer not in self.meshes]
+        if len(added) > 0:
+            self.meshes.extend(added)
+            self.fillGeoList()
+            self.saveData()
+        for layer, times in written.items():
+            for t in times:
+                self.keysChanged(t, mesh=layers.meshName(layer))
+
+        if self.curLayer in written:
+            self.getKeytimes()
+            self.updateUI()
+        if not self.editMode:
+            self.updateFrame(False)
+        self.statusbar.showMessage('Live link: ' + liveLink.summary(self.liveLink.stats()), 2000)
+        return
+
+    def liveLinkStatus(self):
+        logger.debug('Start ' + inspect.stack()[0][3])
+        if self.liveLink is None or not self.liveLink.isRunning():
+            QtWidgets.QMessageBox.information(self, 'Live Link', 'The live link server is off')
+            return
+        stats = self.liveLink.stats()
+        text = 'Listening on port %d\n%s' % (stats['port'], liveLink.summary(stats))
+        if len(self.liveLink.errors) > 0:
+            text += '\n\nLast errors:\n' + '\n'.join(self.liveLink.errors[-5:])
+        QtWidgets.QMessageBox.information(self, 'Live Link', text)
+        return
+
+    def cullDistance(self):
+        logger.debug('Start ' + inspect.stack()[0][3])
+        distance = self.performance.maxDistance
+        if distance == float('inf'):
+            distance = 0.0
+        distance, ok = QtWidgets.QInputDialog.getDouble(self, 'Playback Performance Mode', 'Cull layers further from the camera than (0 = never):', distance, 0.0, 1e9, 1)
+        if not ok:
+            return
+        self.performance.maxDistance = distance if distance > 0 else float('inf')
+        return
+
+    def temporalFalloff(self, on):
+        logger.debug('Start ' + inspect.stack()[0][3])
+        self.falloffOn = on
+        return
+
+    def temporalFalloffSettings(self):
+        logger.debug('Start ' + inspect.stack()[0][3])
+        radius, ok = QtWidgets.QInputDialog.getDouble(self, 'Temporal Falloff', 'Radius (frames):', self.falloffRadius, 1.0, 10000.0, 1)
+        if not ok:
+            return
+        curve, ok = QtWidgets.QInputDialog.getItem(self, 'Temporal Falloff', 'Falloff:', list(temporal.falloffs), temporal.falloffs.index(self.falloffCurve), False)
+        if not ok:
+            return
+        self.falloffRadius = radius
+        self.falloffCurve = curve
+        return
+
+    def showHeatmap(self, on):
+        logger.debug('Start ' + inspect.stack()[0][3])
+        self.heatmapOn = on
+        if on:
+            for cache in self.scrubCaches.values():
+                cache.hide()
+
+            self.updateHeatmap()
+        else:
+            self.heatmap.clear()
+        return
+
+    def heatmapMode(self):
+        logger.debug('Start ' + inspect.stack()[0][3])
+        mode, ok = QtWidgets.QInputDialog.getItem(self, 'Displacement Heatmap', 'Compare the current key with:', list(heatmap.modes), heatmap.modes.index(self.heatmap.mode), False)
+        if not ok:
+            return
+        self.heatmap.mode = mode
+        self.heatmap.invalidate()
+        self.updateHeatmap()
+        return
+
+    def updateHeatmap(self):
+        if not self.heatmapOn:
+            return
+        if self.editMode or self.curLayer not in self.meshes or not cmds.objExists(self.curMesh):
+            self.heatmap.hide()
+            return
+        if cmds.play(query=True, state=True):
+            return
+        self.heatmap.update(self.curLayer, self.keyFrames, cmds.currentTime(query=True))
+        return
+
+    def invalidateScrubCache(self, time=None, spread=1, mesh=None):
+        logger.debug('Start ' + inspect.stack()[0][3])
+        if mesh is None:
+            mesh = self.curMesh
+        for cache in self.scrubCaches.values():
+            if cache.mesh != mesh:
+                continue
+            cache.hide()
+            if time is None:
+                cache.invalidate()
+            else:
+                cache.invalidate(*layers.keySegment(self.keyFrames, time, spread))
+
+        return
+
+    def updateScrubCaches(self):
+        if len(self.scrubCaches) == 0 or self.editMode or self.performance.isCulling() or self.heatmapOn:
+            return
+        currentTime = cmds.currentTime(query=True)
+        for cache in self.scrubCaches.values():
+            if not cmds.objExists(cache.mesh):
+                continue
+            points = cache.lookup(currentTime)
+            if points is not None:
+                cache.show(points)
+            else:
+                cache.hide()
+                cache.store(currentTime)
+
+        self.updateScrubLabel()
+        return
+
+    def fillScrubCaches(self):
+        if len(self.scrubCaches) == 0 or self.editMode or not self.isVisible():
+            return
+        if cmds.play(query=True, state=True):
+            return
+        currentTime = cmds.currentTime(query=True)
+        if currentTime != self.scrubIdleTime:
+            # The user is scrubbing, wait for the time slider to settle
+            self.scrubIdleTime = currentTime
+            return
+        start = cmds.playbackOptions(query=True, minTime=True)
+        end = cmds.playbackOptions(query=True, maxTime=True)
+        for cache in self.scrubCaches.values():
+            frames = cache.frames
+            if len(frames) > 0 and frames.nbytes + frames.nbytes // len(frames) > frames.maxBytes:
+                continue
+            if not cmds.objExists(cache.mesh):
+                continue
+            if cache.fillNext(currentTime, start, end) is not None:
+                self.updateScrubLabel()
+                return
+
+        return
+
+    def showProgress(self, done, total, label):
+        if done >= total:
+            self.progressBar.setVisible(False)
+            return
+        self.progressBar.setMaximum(total)
+        self.progressBar.setValue(done)
+        self.progressBar.setFormat(label + ' %p%')
+        self.progressBar.setVisible(True)
+        # Paint the bar directly instead of pumping the event loop: timers,
+        # live link flushes and executeDeferred callbacks would otherwise run
+        # in the middle of the read-compute-write of the caller.  No event is
+        # delivered, so nothing can re-enter SAT while map() waits.
+        self.progressBar.repaint()
+        return
+
+    def updateScrubLabel(self):
+        if len(self.scrubCaches) == 0:
+            self.scrubCache_label.setText('')
+            return
+        hits = sum(cache.frames.hits for cache in self.scrubCaches.values())
+        misses = sum(cache.frames.misses for cache in self.scrubCaches.values())
+        nbytes = sum(cache.frames.nbytes for cache in self.scrubCaches.values())
+        frames = sum(len(cache.frames) for cache in self.scrubCaches.values())
+        if hits + misses > 0:
+            rate = 100.0 * hits / (hits + misses)
+        else:
+            rate = 0.0
+        self.scrubCache_label.setText('Scrub cache: %d frames, %.0f%% hits, %.0f MB' % (frames, rate, nbytes / (1024.0 * 1024.0)))
+        return
+
+    def copyKeys(self, inRange, *args):
+        logger.debug('Start ' + inspect.stack()[0][3])
+        if self.editMode or not cmds.objExists(self.bs_name) or self.layerFrozen():
+            return
+        currentTime = cmds.currentTime(query=True)
+        if inRange:
+            playBackSlider = mel.eval('$tmpVar=$gPlayBackSlider')
+            if cmds.timeControl(playBackSlider, query=True, rangeVisible=True):
+                start, end = cmds.timeControl(playBackSlider, query=True, rangeArray=True)
+                times = [t for t in self.keyFrames if start <= t < end]
+            else:
+                times = list(self.keyFrames)
+        else:
+            times = [currentTime]
+        copied = clipboard.copyKeys(self.curLayer, times)
+        if len(copied) == 0:
+            cmds.warning('No SAT keys to copy')
+        else:
+            self.statusbar.showMessage('Copied %d key(s) from %s' % (len(copied), self.curLayer), 3000)
+        return
+
+    def pasteKeys(self):
+        logger.debug('Start ' + inspect.stack()[0][3])
+        if self.editMode or len(self.meshes) == 0 or self.curLayer not in self.meshes or self.layerFrozen():
+            return
+        pasted = clipboard.pasteKeys(self.curLayer, cmds.currentTime(query=True))
+        if len(pasted) == 0:
+            cmds.warning('Nothing to paste, copy SAT keys first')
+            return
+        self.getKeytimes()
+        for t in pasted:
+            self.keysChanged(t, 2)
+
+        self.saveData()
+        self.updateFrame(False)
+        cmds.select(self.curMesh)
+        cmds.select(self.bs_name, add=True)
+        return
+
+    def mirror(self, allKeys, *args):
+        logger.debug('Start ' + inspect.stack()[0][3])
+        if self.editMode or not cmds.objExists(self.bs_name) or self.layerFrozen():
+            return
+        currentTime = cmds.currentTime(query=True)
+        if allKeys:
+            times = list(self.keyFrames)
+        elif currentTime in self.keyFrames:
+            times = [currentTime]
+        else:
+            cmds.warning('No SAT key on the current frame to mirror')
+            return
+        if self.actionMirror_Negative.isChecked():
+            mode = '-'
+        elif self.actionMirror_Flip.isChecked():
+            mode = 'flip'
+        else:
+            mode = '+'
+        for t in symmetry.mirrorKeys(self.curLayer, times, 'x', mode):
+            self.keysChanged(t)
+
+        self.updateFrame(False)
+        return
+
+    def retargetLayer(self):
+        logger.debug('Start ' + inspect.stack()[0][3])
+        if self.editMode or not cmds.objExists(self.bs_name) or self.layerFrozen():
+            return
+        sel = [s for s in cmds.ls(sl=True, transforms=True) if s != self.curMesh]
+        if len(sel) == 0:
+            cmds.warning('Select the mesh with the old topology of ' + self.curMesh)
+            return
+        result = retarget.retargetLayer(self.curLayer, sel[0])
+        self.keysChanged()
+        self.updateFrame(False)
+        lines = ['Retargeted %d keys in %.1f s' % (len(result['keys']), result['seconds']), 'Largest distance to old surface: %.4f' % result['surfaceDistance'], '']
+        for key in result['keys']:
+            lines.append('Frame %g: max error %.4f, rms %.4f' % (key['time'], key['maxError'], key['rmsError']))
+
+        QtWidgets.QMessageBox.information(self, 'Retarget Layer', '\n'.join(lines))
+        cmds.select(self.curMesh)
+        return
+
+    def instanceLayer(self):
+        logger.debug('Start ' + inspect.stack()[0][3])
+        if self.editMode or not cmds.objExists(self.bs_name) or self.layerFrozen():
+            return
+        sel = [s for s in cmds.ls(sl=True, transforms=True) if s != self.curMesh]
+        if len(sel) == 0:
+            cmds.warning('Select the duplicates of ' + self.curMesh + ' to instance the layer on')
+            return
+        step, ok = QtWidgets.QInputDialog.getDouble(self, 'Instance Layer', 'Time offset between instances (frames):', 0.0, -10000.0, 10000.0, 2)
+        if not ok:
+            return
+        speed, ok = QtWidgets.QInputDialog.getDouble(self, 'Instance Layer', 'Playback speed:', 1.0, 0.01, 100.0, 3)
+        if not ok:
+            return
+        try:
+            built = instancing.instanceLayer(self.curLayer, sel, step, speed)
+        except ValueError as e:
+            cmds.warning(str(e))
+            return
+        self.statusbar.showMessage('Instanced %s on %d meshes' % (self.curLayer, len(built)), 5000)
+        return
+
+    def refreshInstances(self):
+        logger.debug('Start ' + inspect.stack()[0][3])
+        if self.editMode or not cmds.objExists(self.bs_name) or self.layerFrozen():
+            return
+        instancing.refreshInstances(self.curLayer)
+        return
+
+    def removeInstances(self):
+        logger.debug('Start ' + inspect.stack()[0][3])
+        if not self.curLayer:
+            return
+        instancing.removeInstances(self.curLayer)
+        return
+
+    def checkIntegrity(self, auto, *args):
+        logger.debug('Start ' + inspect.stack()[0][3])
+        if self.editMode:
+            return
+        try:
+            report = integrity.scan(self.meshes)
+        except:
+            logger.warning('SAT integrity scan failed', exc_info=True)
+            return
+        count = integrity.issueCount(report)
+        logger.debug('Integrity scan: %d issues in %.3f s' % (count, report['seconds']))
+        if auto:
+            if count > 0:
+                cmds.warning('SAT found %d scene issues, use Geometry > Check Scene Integrity to repair them' % count)
+                self.statusbar.showMessage('%d SAT scene issues found' % count, 10000)
+            return
+        if count == 0:
+            QtWidgets.QMessageBox.information(self, 'Scene Integrity', 'No issues found (%.2f s)' % report['seconds'])
+            return
+        text = '\n'.join(integrity.summary(report)) + '\n\nRepair the scene?'
+        answer = QtWidgets.QMessageBox.question(self, 'Scene Integrity', text, QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No)
+        if answer != QtWidgets.QMessageBox.Yes:
+            return
+        self.meshes = integrity.repair(report, self.meshes)
+        for layer in report['missingMeshes']:
+            if layer in self.scrubCaches:
+                self.scrubCaches.pop(layer).release()
+
+        if self.curLayer not in self.meshes:
+            try:
+                self.curLayer = self.meshes[-1]
+            except:
+                self.curLayer = ''
+
+        self.keysChanged()
+        self.fillGeoList()
+        self.updateUI()
+        self.saveData()
+        self.updateFrame('')
+        return
+
+    def layerReport(self):
+        logger.debug('Start ' + inspect.stack()[0][3])
+        if self.editMode:
+            return
+        reportWindow = ReportWindow(self)
+
+        def refresh():
+            QtWidgets.QApplication.setOverrideCursor(QtCore.Qt.WaitCursor)
+            try:
+                reportWindow.setRows(report.layerReport(self.meshes))
+            finally:
+                QtWidgets.QApplication.restoreOverrideCursor()
+
+        def export(kind):
+            path = QtWidgets.QFileDialog.getSaveFileName(reportWindow, 'Export Layer Report', 'satLayerReport.' + kind, kind.upper() + ' (*.' + kind + ')')[0]
+            if not path:
+                return
+            if kind == 'csv':
+                report.exportCsv(reportWindow.rows, path)
+            else:
+                report.exportJson(reportWindow.rows, path)
+
+        def selectLayer(item):
+            layer = reportWindow.report_tableWidget.item(item.row(), 0).text()
+            found = self.geo_listWidget.findItems(layer, QtCore.Qt.MatchExactly)
+            if len(found) > 0:
+                self.geo_listWidget.setCurrentItem(found[0])
+
+        reportWindow.refresh_btn.clicked.connect(refresh)
+        reportWindow.exportCsv_btn.clicked.connect(partial(export, 'csv'))
+        reportWindow.exportJson_btn.clicked.connect(partial(export, 'json'))
+        reportWindow.report_tableWidget.itemDoubleClicked.connect(selectLayer)
+        refresh()
+        reportWindow.show()
+        return
+
+    def layerFrozen(self):
+        if freeze.isFrozen(self.curLayer):
+            cmds.warning(self.curLayer + ' is frozen, unfreeze it to edit its keys')
+            return True
+        return False
+
+    def freezeLayer(self):
+        logger.debug('Start ' + inspect.stack()[0][3])
+        if self.editMode or not cmds.objExists(self.bs_name):
+            return
+        fps = freeze.freezeLayer(self.curLayer)
+        if fps is None:
+            return
+        self.keysChanged()
+        self.fillGeoList()
+        self.updateFrame(False)
+        QtWidgets.QMessageBox.information(self, 'Freeze Layer', 'Playback of %s: %.1f fps before, %.1f fps frozen' % (self.curLayer, fps['before'], fps['after']))
+        return
+
+    def unfreezeLayer(self):
+        logger.debug('Start ' + inspect.stack()[0][3])
+        if self.editMode or not freeze.unfreezeLayer(self.curLayer):
+            return
+        self.keysChanged()
+        self.fillGeoList()
+        self.updateFrame(False)
+        return
+
+    def quantizeLayer(self):
+        logger.debug('Start ' + inspect.stack()[0][3])
+        if self.editMode or not cmds.objExists(self.bs_name):
+            return
+        choices = ['Full precision', '16 bit', '8 bit']
+        bits = quantize.quantizedLayers().get(self.bs_name, 0)
+        choice, ok = QtWidgets.QInputDialog.getItem(self, 'Quantized Storage', 'Store the targets of ' + self.curLayer + ' in the scene file with:', choices, {0: 0, 16: 1, 8: 2}[bits], False)
+        if not ok:
+            return
+        stats = quantize.setQuantized(self.curLayer, {0: 0, 1: 16, 2: 8}[choices.index(choice)])
+        if stats is not None and choice != choices[0]:
+            QtWidgets.QMessageBox.information(self, 'Quantized Storage', 'Max reconstruction error: %.6f\nCompression: %.1fx (%.1f MB -> %.1f MB)' % (stats['maxError'], stats['ratio'], stats['floatBytes'] / 1048576.0, stats['quantizedBytes'] / 1048576.0))
+        return
+
+    def mergeLayers(self):
+        logger.debug('Start ' + inspect.stack()[0][3])
+        if self.editMode or not self.curMesh:
+            return
+        checked = [layer for layer in self.checkedLayers() if layers.meshName(layer) == self.curMesh]
+        if len(checked) < 2:
+            cmds.warning('Check at least two layers of ' + self.curMesh + ' to merge')
+            return
+        answer = QtWidgets.QMessageBox.question(self, 'Merge Layers', 'Merge ' + ', '.join(checked) + ' into a new layer and delete them?', QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No)
+        if answer != QtWidgets.QMessageBox.Yes:
+            return
+        # Key times alone only match the stack on those frames
+        bakeStep, ok = QtWidgets.QInputDialog.getDouble(self, 'Merge Layers', 'Also key every N frames in between (0: key times only):', 0.0, 0.0, 1000.0, 2)
+        if not ok:
+            return
+        for layer in checked:
+            instancing.removeInstances(layer)
+            if layer in self.scrubCaches:
+                self.scrubCaches.pop(layer).release()
+
+        newLayer = self.newLayerName(self.curMesh)
+        merge.mergeLayers(checked, newLayer, bakeStep=bakeStep)
+        self.meshes = [layer for layer in self.meshes if layer not in checked] + [newLayer]
+        self.curLayer = newLayer
+        self.keysChanged()
+        self.fillGeoList()
+        self.updateUI()
+        self.saveData()
+        self.updateFrame(False)
+        return
+
+    def splitLayer(self):
+        logger.debug('Start ' + inspect.stack()[0][3])
+        if self.editMode or not cmds.objExists(self.bs_name) or self.layerFrozen():
+            return
+        sources = ['Selected vertex sets', 'Selected components', 'Painted layer weights']
+        source, ok = QtWidgets.QInputDialog.getItem(self, 'Split Layer by Region', 'Regions:', sources, 0, False)
+        if not ok:
+            return
+        count = layers.vertexCount(self.curMesh)
+        if source == sources[0]:
+            sets = cmds.ls(sl=True, type='objectSet') or []
+            regions = split.regionsFromSets(count, sets, self.curMesh)
+        elif source == sources[1]:
+            components = cmds.filterExpand(cmds.ls(sl=True), selectionMask=(31, 32, 34)) or []
+            regions = [('selection', split.setMask(count, layers.componentIndices(components, self.curMesh)))] if components else []
+        else:
+            regions = [('painted', layers.getBaseWeights(self.bs_name, count))]
+        regions = [(name, mask) for name, mask in regions if mask.max() > 0.0]
+        if len(regions) == 0:
+            cmds.warning('Nothing to split ' + self.curLayer + ' by, select vertex sets or components first')
+            return
+        regions = split.normalizeRegions(regions)
+        layer = self.curLayer
+        newLayers = []
+        for name, mask in regions:
+            newLayers.append(self.newLayerName(self.curMesh))
+            self.meshes.append(newLayers[-1])
+
+        self.meshes = [m for m in self.meshes if m not in newLayers]
+        instancing.removeInstances(layer)
+        if layer in self.scrubCaches:
+            self.scrubCaches.pop(layer).release()
+        created = split.splitLayer(layer, regions, newLayers)
+        if len(created) == 0:
+            return
+        self.meshes = [m for m in self.meshes if m != layer] + created
+        self.curLayer = created[0]
+        self.keysChanged()
+        self.fillGeoList()
+        self.updateUI()
+        self.saveData()
+        self.updateFrame(False)
+        self.statusbar.showMessage('Split %s into %s' % (layer, ', '.join(created)), 5000)
+        return
+
+    def paintMask(self):
+        logger.debug('Start ' + inspect.stack()[0][3])
+        if self.editMode or not cmds.objExists(self.bs_name):
+            return
+        masks.paintMask(self.curLayer)
+        self.statusbar.showMessage('Painting the mask of %s, use Apply Layer Mask when done' % self.curLayer, 5000)
+        return
+
+    def applyMask(self):
+        logger.debug('Start ' + inspect.stack()[0][3])
+        if self.editMode or not cmds.objExists(self.bs_name):
+            return
+        active = masks.applyPaintedMask(self.curLayer)
+        self.keysChanged()
+        self.fillGeoList()
+        self.updateFrame(False)
+        self.statusbar.showMessage('%s evaluates %d of %d vertices' % (self.curLayer, active, layers.vertexCount(self.curMesh)), 5000)
+        return
+
+    def clearMask(self):
+        logger.debug('Start ' + inspect.stack()[0][3])
+        if self.editMode or not cmds.objExists(self.bs_name):
+            return
+        masks.clearMask(self.curLayer)
+        self.keysChanged()
+        self.fillGeoList()
+        self.updateFrame(False)
+        return
+
+    def checkedLayers(self):
+        checked = []
+        for index in range(self.geo_listWidget.count()):
+            item = self.geo_listWidget.item(index)
+            if item.checkState() == QtCore.Qt.CheckState.Checked:
+                checked.append(item.text())
+
+        return checked
+
+    def retimeKeys(self):
+        logger.debug('Start ' + inspect.stack()[0][3])
+        if self.editMode:
+            return
+        checked = self.checkedLayers()
+        if len(checked) == 0:
+            cmds.warning('Check the layers to retime')
+            return
+        retimeWindow = RetimeWindow(self)
+        retimeWindow.pivot_spinBox.setValue(cmds.currentTime(query=True))
+        retimeWindow.layers_label.setText('Layers: ' + ', '.join(checked))
+
+        def pickCurve():
+            curves = cmds.ls(sl=True, type='animCurve') or cmds.keyframe(query=True, selected=True, name=True) or []
+            if len(curves) > 0:
+                retimeWindow.curve_lineEdit.setText(curves[0])
+            return
+
+        retimeWindow.curve_btn.clicked.connect(pickCurve)
+        if not retimeWindow.exec_():
+            return
+        curve = retimeWindow.curve_lineEdit.text().strip() or None
+        if curve is not None and not cmds.objExists(curve):
+            cmds.warning("Time curve '%s' does not exist" % curve)
+            return
+        try:
+            result = retime.retimeLayers(checked, retimeWindow.offset_spinBox.value(), retimeWindow.scale_spinBox.value(), retimeWindow.pivot_spinBox.value(), curve)
+        except ValueError as e:
+            cmds.warning(str(e))
+            return
+
+        for layer in result:
+            self.keysChanged(mesh=layers.meshName(layer))
+
+        self.getKeytimes()
+        self.saveData()
+        self.updateFrame(False)
+        return
+
+    def shapeLibrary(self):
+        logger.debug('Start ' + inspect.stack()[0][3])
+        if self.libraryWindow is not None:
+            self.libraryWindow.show()
+            self.libraryWindow.raise_()
+            return
+        self.libraryWindow = LibraryWindow(self, self)
+        self.libraryWindow.shapeApplied.connect(self.libraryShapeApplied)
+        self.libraryWindow.finished.connect(self.libraryClosed)
+        self.libraryWindow.start()
+        return
+
+    def libraryShapeApplied(self, time):
+        logger.debug('Start ' + inspect.stack()[0][3])
+        if self.curLayer not in self.meshes:
+            self.meshes.append(self.curLayer)
+        self.keysChanged(time, 2)
+        self.getKeytimes()
+        self.saveData()
+        self.updateUI()
+        self.updateFrame(False)
+        return
+
+    def libraryClosed(self, *args):
+        logger.debug('Start ' + inspect.stack()[0][3])
+        self.libraryWindow = None
+        return
+
+    def keyRange(self):
+        logger.debug('Start ' + inspect.stack()[0][3])
+        if self.editMode or not self.curLayer or self.layerFrozen():
+            return
+        rangeKeyWindow = RangeKeyWindow(self)
+        start, end = cmds.playbackOptions(query=True, minTime=True), cmds.playbackOptions(query=True, maxTime=True)
+        slider = mel.eval('$tmpVar=$gPlayBackSlider')
+        if cmds.timeControl(slider, query=True, rangeVisible=True):
+            start, end = cmds.timeControl(slider, query=True, rangeArray=True)
+            end -= 1
+        rangeKeyWindow.start_spinBox.setValue(start)
+        rangeKeyWindow.end_spinBox.setValue(end)
+        rangeKeyWindow.layer_label.setText('Layer: ' + self.curLayer)
+        if not rangeKeyWindow.exec_():
+            return
+        start, end = rangeKeyWindow.start_spinBox.value(), rangeKeyWindow.end_spinBox.value()
+        if rangeKeyWindow.every_radioButton.isChecked():
+            times = rangeKey.everyFrames(start, end, rangeKeyWindow.step_spinBox.value())
+        else:
+            nodes = cmds.ls(sl=True, type='transform') or []
+            times = rangeKey.transformKeyTimes(nodes, start, end)
+            if len(times) == 0:
+                cmds.warning('The selected transforms have no keys between %g and %g' % (start, end))
+                return
+        written = rangeKey.keyRange(self.curLayer, times)
+        if self.curLayer not in self.meshes:
+            self.meshes.append(self.curLayer)
+        self.keysChanged()
+        self.getKeytimes()
+        self.saveData()
+        self.updateUI()
+        self.updateFrame(False)
+        self.statusbar.showMessage('%d keys added to %s' % (len(written), self.curLayer), 5000)
+        return
+
     def stepKey(self, direction):
         logger.debug('Start ' + inspect.stack()[0][3])
         currentTime = cmds.currentTime(query=True)
@@ -735,26 +1922,34 @@ class MainWindow(QtWidgets.QMainWindow, mainWindow.Ui_MainWindow):
         self.updateFrame(True)
         return
 
-    def getKeytimes(self):
+    def getKeytimes(self, cached=False):
         logger.debug('Start ' + inspect.stack()[0][3])
+        if cached and self.curLayer in self.keyTimes:
+            self.keyFrames = list(self.keyTimes[self.curLayer])
+            return
         try:
             animCrv = cmds.listConnections(self.bs_name, t='animCurve')[0]
             self.keyFrames = cmds.keyframe(animCrv, query=True, tc=True)
         except:
             self.keyFrames = []
 
+        self.keyTimes[self.curLayer] = list(self.keyFrames)
         return
 
     def saveData(self):
         logger.debug('Start ' + inspect.stack()[0][3])
-        utils.pyToAttr('sat.meshes', self.meshes)
+        storage.setLayers(self.meshes)
         utils.pyToAttr('sat.curMesh', self.curLayer)
         utils.pyToAttr('sat.sculptMode', self.editMode)
         return
 
     def loadData(self):
         logger.debug('Start ' + inspect.stack()[0][3])
-        self.meshes = utils.attrToPy('sat.meshes')
+        self.meshes = storage.listLayers()
+        try:
+            quantize.decodeScene()
+        except:
+            logger.warning('Could not decode quantized SAT layers', exc_info=True)
         self.curLayer = utils.attrToPy('sat.curMesh')
         self.editMode = utils.attrToPy('sat.sculptMode')
         try:
@@ -762,7 +1957,7 @@ class MainWindow(QtWidgets.QMainWindow, mainWindow.Ui_MainWindow):
         except:
             pass
 
-        self.getKeytimes()
+        self.getKeytimes(True)
         return
 
     def removeIntermediateShape(self, transform):
@@ -778,14 +1973,12 @@ class MainWindow(QtWidgets.QMainWindow, mainWindow.Ui_MainWindow):
         logger.debug('Start ' + inspect.stack()[0][3])
         shape = cmds.pickWalk(transformName, d='down')[0]
         cmds.rename(shape, transformName + 'Shape')
+        integrity.tagShapeMesh(transformName)
         return
 
     def returnName(self, obj):
         logger.debug('Start ' + inspect.stack()[0][3])
-        name = obj
-        if ':' in obj:
-            name = obj.split(':')[1]
-        return name
+        return storage.stripNamespace(obj)
 
     def about(self):
         logger.debug('Start ' + inspect.stack()[0][3])
@@ -815,4 +2008,20 @@ class MainWindow(QtWidgets.QMainWindow, mainWindow.Ui_MainWindow):
         logger.debug('Close ')
         if self.editMode:
             self.sculpt(False)
+        self.scrubTimer.stop()
+        for cache in self.scrubCaches.values():
+            cache.release()
+
+        self.scrubCaches = {}
+        self.ghosts.clear()
+        self.heatmap.clear()
+        self.performance.disable()
+        if self.liveLink is not None:
+            self.liveLink.stop()
+        if self.libraryWindow is not None:
+            self.libraryWindow.close()
+        workers.setProgressHandler(None)
+        workers.shutdown()
+        sceneEvents.removeCallbacks()
+        quantize.removeCallbacks()
         return
@@ -161,11 +161,25 @@ class Ui_MainWindow(object):
         self.menuAnimation.setObjectName('menuAnimation')
         self.menuEdit = QtWidgets.QMenu(self.menubar)
         self.menuEdit.setObjectName('menuEdit')
+        self.menuLayer = QtWidgets.QMenu(self.menubar)
+        self.menuLayer.setObjectName('menuLayer')
+        self.menuMirror_Direction = QtWidgets.QMenu(self.menuLayer)
+        self.menuMirror_Direction.setObjectName('menuMirror_Direction')
+        self.menuDisplay = QtWidgets.QMenu(self.menubar)
+        self.menuDisplay.setObjectName('menuDisplay')
         MainWindow.setMenuBar(self.menubar)
         self.statusbar = QtWidgets.QStatusBar(MainWindow)
         self.statusbar.setEnabled(True)
         self.statusbar.setObjectName('statusbar')
         MainWindow.setStatusBar(self.statusbar)
+        self.scrubCache_label = QtWidgets.QLabel(self.statusbar)
+        self.scrubCache_label.setObjectName('scrubCache_label')
+        self.statusbar.addPermanentWidget(self.scrubCache_label)
+        self.progressBar = QtWidgets.QProgressBar(self.statusbar)
+        self.progressBar.setMaximumWidth(160)
+        self.progressBar.setVisible(False)
+        self.progressBar.setObjectName('progressBar')
+        self.statusbar.addPermanentWidget(self.progressBar)
         self.actionAdd = QtGui.QAction(MainWindow)
         self.actionAdd.setEnabled(True)
         self.actionAdd.setVisible(True)
@@ -182,6 +196,15 @@ class Ui_MainWindow(object):
         self.actionRemove_All = QtGui.QAction(MainWindow)
         self.actionRemove_All.setEnabled(True)
         self.actionRemove_All.setObjectName('actionRemove_All')
+        self.actionCheck_Integrity = QtGui.QAction(MainWindow)
+        self.actionCheck_Integrity.setObjectName('actionCheck_Integrity')
+        self.actionLayer_Report = QtGui.QAction(MainWindow)
+        self.actionLayer_Report.setObjectName('actionLayer_Report')
+        self.actionLive_Link = QtGui.QAction(MainWindow)
+        self.actionLive_Link.setCheckable(True)
+        self.actionLive_Link.setObjectName('actionLive_Link')
+        self.actionLive_Link_Status = QtGui.QAction(MainWindow)
+        self.actionLive_Link_Status.setObjectName('actionLive_Link_Status')
         self.actionSet_Key = QtGui.QAction(MainWindow)
         self.actionSet_Key.setObjectName('actionSet_Key')
         self.actionDelete_Key = QtGui.QAction(MainWindow)
@@ -212,6 +235,8 @@ class Ui_MainWindow(object):
         self.actionPrevious_Key.setObjectName('actionPrevious_Key')
         self.actionNext_Key = QtGui.QAction(MainWindow)
         self.actionNext_Key.setObjectName('actionNext_Key')
+        self.actionKey_Range = QtGui.QAction(MainWindow)
+        self.actionKey_Range.setObjectName('actionKey_Range')
         self.actionEdit_Mode_2 = QtGui.QAction(MainWindow)
         self.actionEdit_Mode_2.setObjectName('actionEdit_Mode_2')
         self.actionTutorial = QtGui.QAction(MainWindow)
@@ -224,10 +249,93 @@ class Ui_MainWindow(object):
         self.actionUse_Components.setObjectName('actionUse_Components')
         self.actionReset_Shape_to_Default = QtGui.QAction(MainWindow)
         self.actionReset_Shape_to_Default.setObjectName('actionReset_Shape_to_Default')
+        self.actionTemporal_Falloff = QtGui.QAction(MainWindow)
+        self.actionTemporal_Falloff.setCheckable(True)
+        self.actionTemporal_Falloff.setObjectName('actionTemporal_Falloff')
+        self.actionTemporal_Falloff_Settings = QtGui.QAction(MainWindow)
+        self.actionTemporal_Falloff_Settings.setObjectName('actionTemporal_Falloff_Settings')
+        self.actionScrub_Cache = QtGui.QAction(MainWindow)
+        self.actionScrub_Cache.setCheckable(True)
+        self.actionScrub_Cache.setObjectName('actionScrub_Cache')
+        self.actionScrub_Cache_Memory = QtGui.QAction(MainWindow)
+        self.actionScrub_Cache_Memory.setObjectName('actionScrub_Cache_Memory')
+        self.actionClear_Scrub_Cache = QtGui.QAction(MainWindow)
+        self.actionClear_Scrub_Cache.setObjectName('actionClear_Scrub_Cache')
+        self.actionMirror_Key = QtGui.QAction(MainWindow)
+        self.actionMirror_Key.setObjectName('actionMirror_Key')
+        self.actionMirror_Layer = QtGui.QAction(MainWindow)
+        self.actionMirror_Layer.setObjectName('actionMirror_Layer')
+        self.mirrorDirection_group = QtGui.QActionGroup(MainWindow)
+        self.mirrorDirection_group.setObjectName('mirrorDirection_group')
+        self.actionMirror_Positive = QtGui.QAction(self.mirrorDirection_group)
+        self.actionMirror_Positive.setCheckable(True)
+        self.actionMirror_Positive.setChecked(True)
+        self.actionMirror_Positive.setObjectName('actionMirror_Positive')
+        self.actionMirror_Negative = QtGui.QAction(self.mirrorDirection_group)
+        self.actionMirror_Negative.setCheckable(True)
+        self.actionMirror_Negative.setObjectName('actionMirror_Negative')
+        self.actionMirror_Flip = QtGui.QAction(self.mirrorDirection_group)
+        self.actionMirror_Flip.setCheckable(True)
+        self.actionMirror_Flip.setObjectName('actionMirror_Flip')
+        self.actionRetarget_Layer = QtGui.QAction(MainWindow)
+        self.actionRetarget_Layer.setObjectName('actionRetarget_Layer')
+        self.actionRetime_Keys = QtGui.QAction(MainWindow)
+        self.actionRetime_Keys.setObjectName('actionRetime_Keys')
+        self.actionInstance_Layer = QtGui.QAction(MainWindow)
+        self.actionInstance_Layer.setObjectName('actionInstance_Layer')
+        self.actionRefresh_Instances = QtGui.QAction(MainWindow)
+        self.actionRefresh_Instances.setObjectName('actionRefresh_Instances')
+        self.actionRemove_Instances = QtGui.QAction(MainWindow)
+        self.actionRemove_Instances.setObjectName('actionRemove_Instances')
+        self.actionFreeze_Layer = QtGui.QAction(MainWindow)
+        self.actionFreeze_Layer.setObjectName('actionFreeze_Layer')
+        self.actionUnfreeze_Layer = QtGui.QAction(MainWindow)
+        self.actionUnfreeze_Layer.setObjectName('actionUnfreeze_Layer')
+        self.actionQuantize_Layer = QtGui.QAction(MainWindow)
+        self.actionQuantize_Layer.setObjectName('actionQuantize_Layer')
+        self.actionMerge_Layers = QtGui.QAction(MainWindow)
+        self.actionMerge_Layers.setObjectName('actionMerge_Layers')
+        self.actionSplit_Layer = QtGui.QAction(MainWindow)
+        self.actionSplit_Layer.setObjectName('actionSplit_Layer')
+        self.actionPaint_Mask = QtGui.QAction(MainWindow)
+        self.actionPaint_Mask.setObjectName('actionPaint_Mask')
+        self.actionApply_Mask = QtGui.QAction(MainWindow)
+        self.actionApply_Mask.setObjectName('actionApply_Mask')
+        self.actionClear_Mask = QtGui.QAction(MainWindow)
+        self.actionClear_Mask.setObjectName('actionClear_Mask')
+        self.actionCopy_Key = QtGui.QAction(MainWindow)
+        self.actionCopy_Key.setObjectName('actionCopy_Key')
+        self.actionCopy_Key_Range = QtGui.QAction(MainWindow)
+        self.actionCopy_Key_Range.setObjectName('actionCopy_Key_Range')
+        self.actionPaste_Keys = QtGui.QAction(MainWindow)
+        self.actionPaste_Keys.setObjectName('actionPaste_Keys')
+        self.actionShape_Library = QtGui.QAction(MainWindow)
+        self.actionShape_Library.setObjectName('actionShape_Library')
+        self.actionGhosts = QtGui.QAction(MainWindow)
+        self.actionGhosts.setCheckable(True)
+        self.actionGhosts.setObjectName('actionGhosts')
+        self.actionGhost_Keys = QtGui.QAction(MainWindow)
+        self.actionGhost_Keys.setObjectName('actionGhost_Keys')
+        self.actionHeatmap = QtGui.QAction(MainWindow)
+        self.actionHeatmap.setCheckable(True)
+        self.actionHeatmap.setObjectName('actionHeatmap')
+        self.actionHeatmap_Mode = QtGui.QAction(MainWindow)
+        self.actionHeatmap_Mode.setObjectName('actionHeatmap_Mode')
+        self.actionPerformance_Mode = QtGui.QAction(MainWindow)
+        self.actionPerformance_Mode.setCheckable(True)
+        self.actionPerformance_Mode.setObjectName('actionPerformance_Mode')
+        self.actionCull_Distance = QtGui.QAction(MainWindow)
+        self.actionCull_Distance.setObjectName('actionCull_Distance')
         self.menuAdd.addAction(self.actionAdd)
         self.menuAdd.addAction(self.actionPick)
         self.menuAdd.addAction(self.actionRemove)
         self.menuAdd.addAction(self.actionRemove_All)
+        self.menuAdd.addSeparator()
+        self.menuAdd.addAction(self.actionCheck_Integrity)
+        self.menuAdd.addAction(self.actionLayer_Report)
+        self.menuAdd.addSeparator()
+        self.menuAdd.addAction(self.actionLive_Link)
+        self.menuAdd.addAction(self.actionLive_Link_Status)
         self.menuHelp.addAction(self.actionHome_Page)
         self.menuHelp.addAction(self.actionTutorial)
         self.menuHelp.addSeparator()
@@ -235,6 +343,7 @@ class Ui_MainWindow(object):
         self.menuAnimation.addAction(self.actionSet_Key)
         self.menuAnimation.addAction(self.actionDelete_Key)
         self.menuAnimation.addAction(self.actionDelete_All_Keys)
+        self.menuAnimation.addAction(self.actionKey_Range)
         self.menuAnimation.addSeparator()
         self.menuAnimation.addAction(self.actionPrevious_Key)
         self.menuAnimation.addAction(self.actionNext_Key)
@@ -246,9 +355,54 @@ class Ui_MainWindow(object):
         self.menuEdit.addAction(self.actionUse_Components)
         self.menuEdit.addSeparator()
         self.menuEdit.addAction(self.actionReset_Shape_to_Default)
+        self.menuEdit.addSeparator()
+        self.menuEdit.addAction(self.actionTemporal_Falloff)
+        self.menuEdit.addAction(self.actionTemporal_Falloff_Settings)
         self.menubar.addAction(self.menuAdd.menuAction())
         self.menubar.addAction(self.menuAnimation.menuAction())
+        self.menubar.addAction(self.menuLayer.menuAction())
         self.menubar.addAction(self.menuEdit.menuAction())
+        self.menuMirror_Direction.addAction(self.actionMirror_Positive)
+        self.menuMirror_Direction.addAction(self.actionMirror_Negative)
+        self.menuMirror_Direction.addAction(self.actionMirror_Flip)
+        self.menuLayer.addAction(self.actionCopy_Key)
+        self.menuLayer.addAction(self.actionCopy_Key_Range)
+        self.menuLayer.addAction(self.actionPaste_Keys)
+        self.menuLayer.addAction(self.actionShape_Library)
+        self.menuLayer.addSeparator()
+        self.menuLayer.addAction(self.actionMirror_Key)
+        self.menuLayer.addAction(self.actionMirror_Layer)
+        self.menuLayer.addAction(self.menuMirror_Direction.menuAction())
+        self.menuLayer.addSeparator()
+        self.menuLayer.addAction(self.actionRetarget_Layer)
+        self.menuLayer.addAction(self.actionRetime_Keys)
+        self.menuLayer.addAction(self.actionMerge_Layers)
+        self.menuLayer.addAction(self.actionSplit_Layer)
+        self.menuLayer.addSeparator()
+        self.menuLayer.addAction(self.actionPaint_Mask)
+        self.menuLayer.addAction(self.actionApply_Mask)
+        self.menuLayer.addAction(self.actionClear_Mask)
+        self.menuLayer.addSeparator()
+        self.menuLayer.addAction(self.actionInstance_Layer)
+        self.menuLayer.addAction(self.actionRefresh_Instances)
+        self.menuLayer.addAction(self.actionRemove_Instances)
+        self.menuLayer.addSeparator()
+        self.menuLayer.addAction(self.actionFreeze_Layer)
+        self.menuLayer.addAction(self.actionUnfreeze_Layer)
+        self.menuLayer.addAction(self.actionQuantize_Layer)
+        self.menuDisplay.addAction(self.actionScrub_Cache)
+        self.menuDisplay.addAction(self.actionScrub_Cache_Memory)
+        self.menuDisplay.addAction(self.actionClear_Scrub_Cache)
+        self.menuDisplay.addSeparator()
+        self.menuDisplay.addAction(self.actionGhosts)
+        self.menuDisplay.addAction(self.actionGhost_Keys)
+        self.menuDisplay.addSeparator()
+        self.menuDisplay.addAction(self.actionHeatmap)
+        self.menuDisplay.addAction(self.actionHeatmap_Mode)
+        self.menuDisplay.addSeparator()
+        self.menuDisplay.addAction(self.actionPerformance_Mode)
+        self.menuDisplay.addAction(self.actionCull_Distance)
+        self.menubar.addAction(self.menuDisplay.menuAction())
         self.menubar.addAction(self.menuHelp.menuAction())
         self.retranslateUi(MainWindow)
         QtCore.QMetaObject.connectSlotsByName(MainWindow)
@@ -276,6 +430,9 @@ class Ui_MainWindow(object):
         self.menuHelp.setTitle(QtWidgets.QApplication.translate('MainWindow', 'Help', None))
         self.menuAnimation.setTitle(QtWidgets.QApplication.translate('MainWindow', 'Animation', None))
         self.menuEdit.setTitle(QtWidgets.QApplication.translate('MainWindow', 'Sculpt', None))
+        self.menuLayer.setTitle(QtWidgets.QApplication.translate('MainWindow', 'Layer', None))
+        self.menuMirror_Direction.setTitle(QtWidgets.QApplication.translate('MainWindow', 'Mirror Direction', None))
+        self.menuDisplay.setTitle(QtWidgets.QApplication.translate('MainWindow', 'Display', None))
         self.actionAdd.setText(QtWidgets.QApplication.translate('MainWindow', 'Add', None))
         self.actionAdd.setToolTip(QtWidgets.QApplication.translate('MainWindow', 'Add Character or Prop Geometry', None))
         self.actionAdd_Selected_Geometry.setText(QtWidgets.QApplication.translate('MainWindow', 'Add Selected Geometry', None))
@@ -283,6 +440,13 @@ class Ui_MainWindow(object):
         self.actionAbout.setText(QtWidgets.QApplication.translate('MainWindow', 'About', None))
         self.actionRemove.setText(QtWidgets.QApplication.translate('MainWindow', 'Remove', None))
         self.actionRemove_All.setText(QtWidgets.QApplication.translate('MainWindow', 'Remove All', None))
+        self.actionCheck_Integrity.setText(QtWidgets.QApplication.translate('MainWindow', 'Check Scene Integrity ..', None))
+        self.actionCheck_Integrity.setToolTip(QtWidgets.QApplication.translate('MainWindow', 'Find and repair SAT nodes left behind by failed edits', None))
+        self.actionLayer_Report.setText(QtWidgets.QApplication.translate('MainWindow', 'Layer Cost Report ..', None))
+        self.actionLayer_Report.setToolTip(QtWidgets.QApplication.translate('MainWindow', 'Memory and evaluation cost of every layer', None))
+        self.actionLive_Link.setText(QtWidgets.QApplication.translate('MainWindow', 'Live Link Server', None))
+        self.actionLive_Link.setToolTip(QtWidgets.QApplication.translate('MainWindow', 'Accept sculpt deltas streamed by local tools', None))
+        self.actionLive_Link_Status.setText(QtWidgets.QApplication.translate('MainWindow', 'Live Link Status ..', None))
         self.actionSet_Key.setText(QtWidgets.QApplication.translate('MainWindow', 'Set Key', None))
         self.actionDelete_Key.setText(QtWidgets.QApplication.translate('MainWindow', 'Delete Key', None))
         self.actionDelete_All_Keys.setText(QtWidgets.QApplication.translate('MainWindow', 'Delete All Keys', None))
@@ -297,9 +461,61 @@ class Ui_MainWindow(object):
         self.actionPick.setText(QtWidgets.QApplication.translate('MainWindow', 'Pick Tool', None))
         self.actionPrevious_Key.setText(QtWidgets.QApplication.translate('MainWindow', 'Go To Previous Key', None))
         self.actionNext_Key.setText(QtWidgets.QApplication.translate('MainWindow', 'Go To Next Key', None))
+        self.actionKey_Range.setText(QtWidgets.QApplication.translate('MainWindow', 'Key Range ..', None))
+        self.actionKey_Range.setToolTip(QtWidgets.QApplication.translate('MainWindow', 'Key the current layer every N frames or on the keys of the selected transforms', None))
         self.actionEdit_Mode_2.setText(QtWidgets.QApplication.translate('MainWindow', 'Edit Mode', None))
         self.actionTutorial.setText(QtWidgets.QApplication.translate('MainWindow', 'Tutorial', None))
         self.actionUse_Artisan_Tool.setText(QtWidgets.QApplication.translate('MainWindow', 'Use Artisan Tool', None))
         self.actionUse_ShapesBrush_plugin.setText(QtWidgets.QApplication.translate('MainWindow', 'Use ShapesBrush', None))
         self.actionUse_Components.setText(QtWidgets.QApplication.translate('MainWindow', 'Edit Components', None))
         self.actionReset_Shape_to_Default.setText(QtWidgets.QApplication.translate('MainWindow', 'Reset Shape', None))
+        self.actionTemporal_Falloff.setText(QtWidgets.QApplication.translate('MainWindow', 'Sculpt Neighbouring Keys', None))
+        self.actionTemporal_Falloff.setToolTip(QtWidgets.QApplication.translate('MainWindow', 'Also apply a sculpt edit to the keys around it, fading out over the falloff radius', None))
+        self.actionTemporal_Falloff_Settings.setText(QtWidgets.QApplication.translate('MainWindow', 'Temporal Falloff ..', None))
+        self.actionScrub_Cache.setText(QtWidgets.QApplication.translate('MainWindow', 'Scrub Cache', None))
+        self.actionScrub_Cache.setToolTip(QtWidgets.QApplication.translate('MainWindow', 'Cache evaluated frames of the current layer for timeline scrubbing', None))
+        self.actionScrub_Cache_Memory.setText(QtWidgets.QApplication.translate('MainWindow', 'Scrub Cache Memory ..', None))
+        self.actionClear_Scrub_Cache.setText(QtWidgets.QApplication.translate('MainWindow', 'Clear Scrub Cache', None))
+        self.actionGhosts.setText(QtWidgets.QApplication.translate('MainWindow', 'Onion Skin Ghosts', None))
+        self.actionGhosts.setToolTip(QtWidgets.QApplication.translate('MainWindow', 'Show the neighbouring keys of the current layer as ghosts', None))
+        self.actionGhost_Keys.setText(QtWidgets.QApplication.translate('MainWindow', 'Ghost Keys ..', None))
+        self.actionHeatmap.setText(QtWidgets.QApplication.translate('MainWindow', 'Displacement Heatmap', None))
+        self.actionHeatmap.setToolTip(QtWidgets.QApplication.translate('MainWindow', 'Colour the current key by how far each vertex moves from its neighbouring keys', None))
+        self.actionHeatmap_Mode.setText(QtWidgets.QApplication.translate('MainWindow', 'Heatmap Mode ..', None))
+        self.actionPerformance_Mode.setText(QtWidgets.QApplication.translate('MainWindow', 'Playback Performance Mode', None))
+        self.actionPerformance_Mode.setToolTip(QtWidgets.QApplication.translate('MainWindow', 'Turn off hidden, off-screen and distant layers while playing back', None))
+        self.actionCull_Distance.setText(QtWidgets.QApplication.translate('MainWindow', 'Cull Distance ..', None))
+        self.actionMirror_Key.setText(QtWidgets.QApplication.translate('MainWindow', 'Mirror Key', None))
+        self.actionMirror_Layer.setText(QtWidgets.QApplication.translate('MainWindow', 'Mirror Layer', None))
+        self.actionMirror_Positive.setText(QtWidgets.QApplication.translate('MainWindow', '+X to -X', None))
+        self.actionMirror_Negative.setText(QtWidgets.QApplication.translate('MainWindow', '-X to +X', None))
+        self.actionMirror_Flip.setText(QtWidgets.QApplication.translate('MainWindow', 'Flip X', None))
+        self.actionRetarget_Layer.setText(QtWidgets.QApplication.translate('MainWindow', 'Retarget Layer to New Topology', None))
+        self.actionRetarget_Layer.setToolTip(QtWidgets.QApplication.translate('MainWindow', 'Select the mesh with the old topology, then transfer all keys of the current layer', None))
+        self.actionRetime_Keys.setText(QtWidgets.QApplication.translate('MainWindow', 'Retime Keys ..', None))
+        self.actionRetime_Keys.setToolTip(QtWidgets.QApplication.translate('MainWindow', 'Offset, scale or remap the keys of all checked layers', None))
+        self.actionInstance_Layer.setText(QtWidgets.QApplication.translate('MainWindow', 'Instance Layer on Selected ..', None))
+        self.actionInstance_Layer.setToolTip(QtWidgets.QApplication.translate('MainWindow', 'Drive the selected duplicates of the mesh with the key data of the current layer', None))
+        self.actionRefresh_Instances.setText(QtWidgets.QApplication.translate('MainWindow', 'Refresh Instances', None))
+        self.actionRemove_Instances.setText(QtWidgets.QApplication.translate('MainWindow', 'Remove Instances', None))
+        self.actionFreeze_Layer.setText(QtWidgets.QApplication.translate('MainWindow', 'Freeze Layer', None))
+        self.actionFreeze_Layer.setToolTip(QtWidgets.QApplication.translate('MainWindow', 'Bake the current layer for playback, its keys can not be edited until it is unfrozen', None))
+        self.actionUnfreeze_Layer.setText(QtWidgets.QApplication.translate('MainWindow', 'Unfreeze Layer', None))
+        self.actionQuantize_Layer.setText(QtWidgets.QApplication.translate('MainWindow', 'Quantized Storage ..', None))
+        self.actionMerge_Layers.setText(QtWidgets.QApplication.translate('MainWindow', 'Merge Checked Layers', None))
+        self.actionMerge_Layers.setToolTip(QtWidgets.QApplication.translate('MainWindow', 'Flatten the checked layers of the current mesh into one new layer', None))
+        self.actionSplit_Layer.setText(QtWidgets.QApplication.translate('MainWindow', 'Split Layer by Region ..', None))
+        self.actionSplit_Layer.setToolTip(QtWidgets.QApplication.translate('MainWindow', 'Divide the current layer between vertex sets, selected components or its painted weights', None))
+        self.actionPaint_Mask.setText(QtWidgets.QApplication.translate('MainWindow', 'Paint Layer Mask', None))
+        self.actionPaint_Mask.setToolTip(QtWidgets.QApplication.translate('MainWindow', 'Paint how much of the current layer reaches each vertex', None))
+        self.actionApply_Mask.setText(QtWidgets.QApplication.translate('MainWindow', 'Apply Layer Mask', None))
+        self.actionApply_Mask.setToolTip(QtWidgets.QApplication.translate('MainWindow', 'Store the painted mask and stop evaluating the vertices it hides', None))
+        self.actionClear_Mask.setText(QtWidgets.QApplication.translate('MainWindow', 'Clear Layer Mask', None))
+        self.actionQuantize_Layer.setToolTip(QtWidgets.QApplication.translate('MainWindow', 'Save the targets of the current layer with 16 or 8 bit precision', None))
+        self.actionCopy_Key.setText(QtWidgets.QApplication.translate('MainWindow', 'Copy Key', None))
+        self.actionCopy_Key_Range.setText(QtWidgets.QApplication.translate('MainWindow', 'Copy Keys in Range', None))
+        self.actionCopy_Key_Range.setToolTip(QtWidgets.QApplication.translate('MainWindow', 'Copy the keys in the highlighted time slider range, or all keys', None))
+        self.actionPaste_Keys.setText(QtWidgets.QApplication.translate('MainWindow', 'Paste Keys', None))
+        self.actionPaste_Keys.setToolTip(QtWidgets.QApplication.translate('MainWindow', 'Paste copied keys into the current layer, starting at the current frame', None))
+        self.actionShape_Library.setText(QtWidgets.QApplication.translate('MainWindow', 'Shape Library ..', None))
+        self.actionShape_Library.setToolTip(QtWidgets.QApplication.translate('MainWindow', 'Save key shapes and apply saved shapes to keys', None))
@@ -0,0 +1,155 @@
+# Shape Animation Tool - Updated for Maya 2025 / Python 3
+import maya.cmds as cmds
+import maya.mel as mel
+import numpy as np
+
+from . import layers
+from . import storage
+from . import utils
+
+# Weights closer than 1/255 are the same to a paint stroke
+levels = 255
+
+
+def hasMask(layer):
+    bs = layers.bsName(layer)
+    return cmds.objExists(bs) and cmds.attributeQuery('satMasked', node=bs, exists=True) and cmds.getAttr(bs + '.satMasked')
+
+
+def _setMasked(bs, masked):
+    if not cmds.attributeQuery('satMasked', node=bs, exists=True):
+        cmds.addAttr(bs, longName='satMasked', attributeType='bool')
+    cmds.setAttr(bs + '.satMasked', masked)
+
+
+def writeBaseWeights(bs, weights):
+    """
+    Write only the base weights that differ from the current ones, one
+    setAttr per run of consecutive vertices.  Vertices that were never
+    painted keep no element at all, so an unmasked region costs nothing in
+    the scene file.
+    """
+    current = layers.getBaseWeights(bs, len(weights))
+    changed = np.flatnonzero(np.abs(current - weights) > 0.5 / levels)
+    if len(changed) == 0:
+        return
+    breaks = np.flatnonzero(np.diff(changed) != 1) + 1
+    for run in np.split(changed, breaks):
+        s, e = int(run[0]), int(run[-1])
+        cmds.setAttr('%s.inputTarget[0].baseWeights[%d:%d]' % (bs, s, e), *weights[s:e + 1].tolist())
+
+
+def _tagName(layer):
+    return 'satMask_' + storage.stripNamespace(layer).replace(':', '_')
+
+
+def _tagIndex(shape, tag):
+    """Return the componentTags element of shape named tag, or the next free one and False."""
+    indices = cmds.getAttr(shape + '.componentTags', multiIndices=True) or []
+    for i in indices:
+        if cmds.getAttr('%s.componentTags[%d].componentTagName' % (shape, i)) == tag:
+            return (i, True)
+
+    return ((max(indices) + 1 if len(indices) > 0 else 0), False)
+
+
+def restrictComponents(layer, indices=None):
+    """
+    Limit the vertices the blendShape of a layer evaluates to indices, or
+    give it the whole mesh back when indices is None.
+
+    Deformers of scenes that use component tags get a tag on the orig shape
+    and a matching component tag expression, legacy deformers get their
+    deformer set edited.  Targets are never touched.
+    """
+    mesh = layers.meshName(layer)
+    bs = layers.bsName(layer)
+    sets = cmds.listConnections(bs, type='objectSet') or []
+    if len(sets) > 0:
+        cmds.sets(mesh + '.vtx[*]', remove=sets[0])
+        if indices is None:
+            cmds.sets(mesh + '.vtx[*]', add=sets[0])
+        elif len(indices) > 0:
+            cmds.sets(['%s.%s' % (mesh, c) for c in layers.indicesToComponents(indices)], add=sets[0])
+        return True
+
+    orig = layers.getOrigShape(mesh)
+    if orig is None or not cmds.attributeQuery('componentTagExpression', node=bs, exists=True):
+        return False
+    tag = _tagName(layer)
+    index, exists = _tagIndex(orig, tag)
+    if indices is None:
+        cmds.setAttr(bs + '.input[0].componentTagExpression', '*', type='string')
+        if exists:
+            cmds.removeMultiInstance('%s.componentTags[%d]' % (orig, index), b=True)
+        return True
+    components = layers.indicesToComponents(indices)
+    cmds.setAttr('%s.componentTags[%d].componentTagName' % (orig, index), tag, type='string')
+    cmds.setAttr('%s.componentTags[%d].componentTagContents' % (orig, index), len(components), *components, type='componentList')
+    cmds.setAttr(bs + '.input[0].componentTagExpression', tag, type='string')
+    return True
+
+
+def setMask(layer, weights, restrict=True):
+    """
+    Scale what a layer adds to its mesh per vertex.
+
+    The mask goes to the base weights of the layer's blendShape, which
+    multiply every target of the layer during evaluation, so changing it
+    never touches the sculpted keys.  With restrict the vertices with zero
+    weight are also taken out of the deformer, so they are not evaluated at
+    all.
+
+    Arguments:
+    layer : string : SAT layer name.
+    weights : (n,) array : per-vertex weight, clipped to 0 - 1.
+    restrict : bool : drop zero-weight vertices from evaluation.
+
+    Return : int : number of vertices left in evaluation.
+    """
+    bs = layers.bsName(layer)
+    weights = np.clip(np.asarray(weights, dtype=np.float64), 0.0, 1.0)
+    active = np.flatnonzero(weights > 0.5 / levels)
+    with utils.undoChunk('satMask'):
+        writeBaseWeights(bs, weights)
+        restrictComponents(layer, active if restrict else None)
+        _setMasked(bs, True)
+
+    return len(active)
+
+
+def applyPaintedMask(layer, restrict=True):
+    """Store the painted base weights of a layer as its mask, see setMask()."""
+    count = layers.vertexCount(layers.meshName(layer))
+    return setMask(layer, layers.getBaseWeights(layers.bsName(layer), count), restrict)
+
+
+def clearMask(layer):
+    """Give a layer its full contribution and all of its vertices back."""
+    bs = layers.bsName(layer)
+    count = layers.vertexCount(layers.meshName(layer))
+    with utils.undoChunk('satMask'):
+        writeBaseWeights(bs, np.ones(count))
+        restrictComponents(layer)
+        _setMasked(bs, False)
+
+    return
+
+
+def paintMask(layer):
+    """
+    Open the Maya paint tool on the base weights of a layer.  The deformer
+    gets the whole mesh back first, so vertices dropped by an earlier
+    restriction can be painted again.
+    """
+    mesh = layers.meshName(layer)
+    bs = layers.bsName(layer)
+    if hasMask(layer):
+        restrictComponents(layer)
+    cmds.select(mesh, replace=True)
+    try:
+        mel.eval('artSetToolAndSelectAttr("artAttrCtx", "blendShape.%s.baseWeights")' % bs)
+    except:
+        mel.eval('ArtPaintBlendShapeWeightsToolOptions')
+
+    return
@@ -0,0 +1,88 @@
+# Shape Animation Tool - Updated for Maya 2025 / Python 3
+import maya.cmds as cmds
+import numpy as np
+
+from . import freeze
+from . import layers
+from . import rangeKey
+from . import storage
+from . import utils
+from . import workers
+
+
+def layerKeys(layer):
+    """
+    Return (times, pairs, sparse key deltas) of a layer, in key time order,
+    scaled by its mask.  Frozen layers are read from their snapshot, the
+    original weight curves still drive their id1 targets.
+    """
+    bs = layers.bsName(layer)
+    count = layers.vertexCount(layers.meshName(layer))
+    mask = layers.getBaseWeights(bs, count)
+    if freeze.isFrozen(layer):
+        pairs = storage.layerDataToPy(layer, 'frozen')['pairs']
+        frozen = freeze.frozenKeys(layer)
+        times = sorted(pairs.keys())
+        deltas = [(frozen[t][0], frozen[t][1] * mask[frozen[t][0], None]) for t in times]
+        return (times, [pairs[t] for t in times], deltas)
+    pairs = layers.getKeyTargets(bs)
+    times = sorted(pairs.keys())
+    deltas = [layers.sparsify(layers.getKeyDelta(bs, pairs[t], count) * mask[:, None]) for t in times]
+    return (times, [pairs[t] for t in times], deltas)
+
+
+def mergeLayers(layerList, newLayer, deleteOriginals=True, bakeStep=0):
+    """
+    Flatten several layers of one mesh into newLayer.
+
+    The new layer is keyed on the union of the key times.  At each time its
+    key holds the sum of what every layer adds there, scaled by the layer's
+    mask and envelope, so the merged layer matches the stack on every key
+    time.  The envelope only matters for a partial envelope: a layer that is
+    switched off has envelope 0 and adds nothing.
+
+    Between keys the merged layer interpolates its own keys, while each
+    source layer interpolated with its own weight curves, so the in-between
+    frames can differ from the stack.  bakeStep > 0 also keys every bakeStep
+    frames between the first and last key time, so the result matches the
+    stack on those frames too, at the cost of more keys.
+
+    The sums run in the worker pool and all keys are written in one
+    createKeys() call.  Returns the merged key times.
+    """
+    mesh = layers.meshName(newLayer)
+    count = layers.vertexCount(mesh)
+    sources = []
+    allTimes = set()
+    for layer in layerList:
+        bs = layers.bsName(layer)
+        if not cmds.objExists(bs):
+            continue
+        times, pairs, deltas = layerKeys(layer)
+        if len(times) == 0:
+            continue
+        sources.append((bs, pairs, deltas, cmds.getAttr(bs + '.envelope')))
+        allTimes.update(times)
+
+    if bakeStep > 0 and len(allTimes) > 0:
+        allTimes.update(rangeKey.everyFrames(min(allTimes), max(allTimes), bakeStep))
+    allTimes = sorted(allTimes)
+    weights = [layers.getKeyWeights(bs, pairs, allTimes) * envelope for bs, pairs, deltas, envelope in sources]
+
+    def sumAt(row):
+        total = np.zeros((count, 3))
+        for (bs, pairs, deltas, envelope), w in zip(sources, weights):
+            for k, (indices, values) in enumerate(deltas):
+                if w[row, k] != 0.0:
+                    total[indices] += w[row, k] * values
+
+        return (allTimes[row],) + layers.sparsify(total)
+
+    keys = workers.map(sumAt, range(len(allTimes)), 'Merge')
+    with utils.undoChunk('satMerge'):
+        written = layers.createKeys(newLayer, keys)
+        if deleteOriginals:
+            for layer in layerList:
+                layers.deleteLayerNodes(layer)
+
+    return sorted(written.keys())
@@ -0,0 +1,207 @@
+# Shape Animation Tool - Updated for Maya 2025 / Python 3
+from math import tan
+
+import maya.cmds as cmds
+import maya.api.OpenMaya as om2
+
+from . import layers
+from . import utils
+
+hudName = 'satCulledLayersHUD'
+
+
+def activeCamera():
+    """Return the camera of the focused model panel, or of the first visible one."""
+    panels = [cmds.getPanel(withFocus=True)] + (cmds.getPanel(visiblePanels=True) or [])
+    for panel in panels:
+        if panel and cmds.getPanel(typeOf=panel) == 'modelPanel':
+            return cmds.modelPanel(panel, query=True, camera=True)
+
+    return None
+
+
+def isHidden(mesh):
+    """True when mesh or one of its parents is hidden by visibility or a display override."""
+    sel = om2.MSelectionList()
+    sel.add(mesh)
+    path = sel.getDagPath(0)
+    while path.length() > 0:
+        fn = om2.MFnDagNode(path)
+        if not fn.findPlug('visibility', False).asBool():
+            return True
+        if fn.findPlug('overrideEnabled', False).asBool() and not fn.findPlug('overrideVisibility', False).asBool():
+            return True
+        path.pop()
+
+    return False
+
+
+def worldBoundingBox(mesh):
+    sel = om2.MSelectionList()
+    sel.add(layers.getShape(mesh))
+    path = sel.getDagPath(0)
+    box = om2.MFnDagNode(path).boundingBox
+    box.transformUsing(path.inclusiveMatrix())
+    return box
+
+
+class Frustum(object):
+    """
+    View volume of a camera, used to test world bounding boxes.
+
+    Arguments:
+    camera : string : camera transform or shape.
+    margin : float : fraction the field of view is widened by, so meshes
+            entering the frame during playback are kept.
+    """
+
+    def __init__(self, camera, margin=0.1):
+        sel = om2.MSelectionList()
+        sel.add(camera)
+        path = sel.getDagPath(0)
+        fn = om2.MFnCamera(path)
+        self.position = om2.MPoint(fn.eyePoint(om2.MSpace.kWorld))
+        self.worldToCamera = path.inclusiveMatrixInverse()
+        self.orthographic = fn.isOrtho()
+        self.near = fn.nearClippingPlane
+        self.far = fn.farClippingPlane
+        if self.orthographic:
+            self.halfWidth = 0.5 * fn.orthoWidth * (1.0 + margin)
+            self.halfHeight = self.halfWidth / max(fn.aspectRatio(), 1e-6)
+        else:
+            self.tanX = tan(0.5 * fn.horizontalFieldOfView()) * (1.0 + margin)
+            self.tanY = tan(0.5 * fn.verticalFieldOfView()) * (1.0 + margin)
+
+    def intersects(self, box):
+        """False only when every corner of box lies outside the same frustum plane."""
+        corners = []
+        for x in (box.min.x, box.max.x):
+            for y in (box.min.y, box.max.y):
+                for z in (box.min.z, box.max.z):
+                    corners.append(om2.MPoint(x, y, z) * self.worldToCamera)
+
+        # Maya cameras look down -Z
+        depths = [-p.z for p in corners]
+        if all(d < self.near for d in depths) or all(d > self.far for d in depths):
+            return False
+        if self.orthographic:
+            limitsX = [self.halfWidth] * len(corners)
+            limitsY = [self.halfHeight] * len(corners)
+        else:
+            limitsX = [self.tanX * d for d in depths]
+            limitsY = [self.tanY * d for d in depths]
+        if all(p.x > l for p, l in zip(corners, limitsX)) or all(p.x < -l for p, l in zip(corners, limitsX)):
+            return False
+        if all(p.y > l for p, l in zip(corners, limitsY)) or all(p.y < -l for p, l in zip(corners, limitsY)):
+            return False
+        return True
+
+    def distance(self, box):
+        """Distance from the camera to the closest point of box."""
+        center = box.center
+        radius = 0.5 * (box.max - box.min).length()
+        return max(0.0, self.position.distanceTo(center) - radius)
+
+
+class PerformanceMode(object):
+    """
+    Zero the envelope of SAT layers nobody can see while Maya plays back.
+
+    Culling runs when playback starts and when a viewport changes camera,
+    never per frame.  Only envelopes this class turned off are restored when
+    playback stops, so the layer check boxes of the UI keep their state.
+
+    Arguments:
+    getLayers : callable : returns the SAT layers to consider.
+    maxDistance : float : layers further away from the camera are culled.
+    """
+
+    def __init__(self, getLayers, maxDistance=float('inf')):
+        self.getLayers = getLayers
+        self.maxDistance = maxDistance
+        self.saved = {}
+        self.jobs = []
+        self.total = 0
+
+    def enable(self):
+        if len(self.jobs) > 0:
+            return
+        self.jobs.append(cmds.scriptJob(conditionChange=['playingBack', self.playbackChanged]))
+        self.jobs.append(cmds.scriptJob(event=['modelEditorChanged', self.cameraChanged]))
+        if cmds.headsUpDisplay(hudName, exists=True):
+            cmds.headsUpDisplay(hudName, remove=True)
+        cmds.headsUpDisplay(hudName, section=4, block=cmds.headsUpDisplay(nextFreeBlock=4), label='SAT culled:', labelFontSize='small', command=self.hudText)
+
+    def disable(self):
+        for job in self.jobs:
+            if cmds.scriptJob(exists=job):
+                cmds.scriptJob(kill=job, force=True)
+
+        self.jobs = []
+        self.restore()
+        if cmds.headsUpDisplay(hudName, exists=True):
+            cmds.headsUpDisplay(hudName, remove=True)
+
+    def isCulling(self):
+        return len(self.saved) > 0
+
+    def hudText(self):
+        if self.total == 0:
+            return '-'
+        return '%d / %d layers' % (len(self.saved), self.total)
+
+    def playbackChanged(self):
+        if cmds.play(query=True, state=True):
+            self.cull()
+        else:
+            self.restore()
+
+    def cameraChanged(self):
+        if cmds.play(query=True, state=True):
+            self.cull()
+
+    def isRelevant(self, layer, frustum):
+        mesh = layers.meshName(layer)
+        if isHidden(mesh):
+            return False
+        if frustum is None:
+            return True
+        box = worldBoundingBox(mesh)
+        return frustum.intersects(box) and frustum.distance(box) <= self.maxDistance
+
+    def cull(self):
+        # Envelope toggles made during playback must not fill the undo queue
+        with utils.undoSuspended():
+            self._cull()
+
+        self.refreshHud()
+
+    def _cull(self):
+        camera = activeCamera()
+        frustum = Frustum(camera) if camera else None
+        active = [layer for layer in self.getLayers() if cmds.objExists(layers.bsName(layer))]
+        self.total = len(active)
+        for layer in active:
+            bs = layers.bsName(layer)
+            envelope = bs + '.envelope'
+            if self.isRelevant(layer, frustum):
+                if bs in self.saved:
+                    cmds.setAttr(envelope, self.saved.pop(bs))
+                continue
+            if bs in self.saved or cmds.getAttr(envelope) == 0 or not cmds.getAttr(envelope, settable=True):
+                continue
+            self.saved[bs] = cmds.getAttr(envelope)
+            cmds.setAttr(envelope, 0)
+
+    def restore(self):
+        with utils.undoSuspended():
+            for bs, envelope in self.saved.items():
+                if cmds.objExists(bs):
+                    cmds.setAttr(bs + '.envelope', envelope)
+
+        self.saved = {}
+        self.refreshHud()
+
+    def refreshHud(self):
+        if cmds.headsUpDisplay(hudName, exists=True):
+            cmds.headsUpDisplay(hudName, refresh=True)
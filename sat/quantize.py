@@ -0,0 +1,241 @@
+# Shape Animation Tool - Updated for Maya 2025 / Python 3
+import base64
+import json
+import logging
+import zlib
+
+import maya.cmds as cmds
+import maya.api.OpenMaya as om2
+import maya.utils
+import numpy as np
+
+from . import layers
+from . import storage
+
+logger = logging.getLogger(__name__)
+
+bitsAttr = 'satQuantizeBits'
+payloadAttr = 'satQuantized'
+# Decoder scriptNode of earlier versions, deleted when a scene is decoded
+legacyDecoderNode = 'satQuantizeDecoder'
+
+
+def decodeTarget(target, bits=16):
+    indices = np.frombuffer(zlib.decompress(base64.b64decode(target['indices'])), dtype=np.int32).astype(np.int64)
+    codes = np.frombuffer(zlib.decompress(base64.b64decode(target['values'])), dtype=np.uint16 if bits == 16 else np.uint8)
+    values = np.asarray(target['offset']) + codes.reshape(-1, 3) * np.asarray(target['scale'])
+    return (indices, values)
+
+
+def _plugs(*names):
+    selection = om2.MSelectionList()
+    for name in names:
+        selection.add(name)
+
+    return [selection.getPlug(i) for i in range(len(names))]
+
+
+def writeTarget(bs, index, indices, values):
+    """
+    Write a sparse target with one API call per plug, without per-vertex
+    Python objects or undo entries.
+    """
+    item = layers.targetItem(bs, index)
+    pointsPlug, componentsPlug = _plugs(item + '.inputPointsTarget', item + '.inputComponentsTarget')
+    points = np.ones((len(values), 4))
+    points[:, :3] = values
+    pointsPlug.setMObject(om2.MFnPointArrayData().create(om2.MPointArray(points.tolist())))
+    component = om2.MFnSingleIndexedComponent()
+    componentObj = component.create(om2.MFn.kMeshVertComponent)
+    component.addElements([int(i) for i in indices])
+    componentList = om2.MFnComponentListData()
+    componentListObj = componentList.create()
+    componentList.add(componentObj)
+    componentsPlug.setMObject(componentListObj)
+
+
+def setPayload(bs, payload):
+    _plugs(bs + '.' + payloadAttr)[0].setString(payload)
+
+
+def decodeScene():
+    """Decode every quantized layer saved in the scene back to full precision."""
+    for bs in cmds.ls('*.' + payloadAttr, objectsOnly=True, recursive=True) or []:
+        payload = cmds.getAttr(bs + '.' + payloadAttr)
+        if not payload:
+            continue
+        data = json.loads(payload)
+        for index, target in data['targets'].items():
+            indices, values = decodeTarget(target, data['bits'])
+            writeTarget(bs, int(index), indices, values)
+
+        setPayload(bs, '')
+
+    if cmds.objExists(legacyDecoderNode):
+        cmds.delete(legacyDecoderNode)
+
+
+_stripped = {}
+_callbacks = []
+
+
+def _pack(array):
+    return base64.b64encode(zlib.compress(np.ascontiguousarray(array).tobytes())).decode('ascii')
+
+
+def encodeTarget(indices, values, bits=16):
+    """
+    Quantize a sparse target delta with a per-target, per-axis scale and
+    offset.  The reconstruction error of every coordinate is at most scale/2.
+    """
+    values = np.asarray(values, dtype=np.float64).reshape(-1, 3)
+    levels = (1 << bits) - 1
+    if len(values) > 0:
+        offset = values.min(axis=0)
+        scale = (values.max(axis=0) - offset) / levels
+    else:
+        offset = np.zeros(3)
+        scale = np.zeros(3)
+    safe = np.where(scale > 0, scale, 1.0)
+    codes = np.rint((values - offset) / safe).astype(np.uint16 if bits == 16 else np.uint8)
+    return {'offset': offset.tolist(), 'scale': scale.tolist(), 'indices': _pack(np.asarray(indices, dtype=np.int32)), 'values': _pack(codes)}
+
+
+def encodeTargets(targets, bits=16):
+    """
+    Return (payload string, stats) of a dict of target index -> (indices,
+    values).  The stats are measured on the payload string itself, so a
+    payload that does not decode back within half a step raises ValueError.
+    """
+    data = {'bits': bits, 'targets': dict((str(index), encodeTarget(indices, values, bits)) for index, (indices, values) in targets.items())}
+    payload = json.dumps(data)
+    floatBytes = 0
+    maxError = 0.0
+    for index, target in json.loads(payload)['targets'].items():
+        indices, values = targets[int(index)]
+        decodedIndices, decoded = decodeTarget(target, bits)
+        if not np.array_equal(decodedIndices, np.asarray(indices)) or decoded.shape != np.shape(values):
+            raise ValueError('target %s does not decode to its vertices' % index)
+        if len(values) > 0:
+            error = np.abs(decoded - values).max(axis=0)
+            if not np.all(error <= np.asarray(target['scale']) * 0.5 + 1e-9):
+                raise ValueError('target %s does not decode within half a step' % index)
+            maxError = max(maxError, float(error.max()))
+        floatBytes += len(values) * 32 + len(indices) * 4
+
+    return (payload, {'maxError': maxError, 'floatBytes': floatBytes, 'quantizedBytes': len(payload), 'ratio': floatBytes / float(max(len(payload), 1))})
+
+
+def readTargets(bs):
+    return dict((index, layers.getSparseTarget(bs, index)) for index in cmds.getAttr(bs + '.weight', multiIndices=True) or [])
+
+
+def encodeLayer(bs, bits=16):
+    """Return (payload string, stats) of every target of a blendShape."""
+    return encodeTargets(readTargets(bs), bits)
+
+
+def setQuantized(layer, bits):
+    """
+    Turn quantized scene storage of a layer on (bits 16 or 8) or off (0).
+    Quantization only happens when the scene is saved, the open session keeps
+    full precision.  The setting and its stats are kept with the rest of the
+    layer data.  Returns the error and size stats of the setting.
+    """
+    bs = layers.bsName(layer)
+    if not cmds.objExists(bs):
+        return None
+    if not cmds.attributeQuery(bitsAttr, node=bs, exists=True):
+        cmds.addAttr(bs, longName=bitsAttr, attributeType='long')
+        cmds.addAttr(bs, longName=payloadAttr, dataType='string')
+    cmds.setAttr(bs + '.' + bitsAttr, bits)
+    if bits == 0:
+        storage.pyToLayerData(layer, 'quantize', None)
+        return {'maxError': 0.0, 'ratio': 1.0}
+    stats = encodeLayer(bs, bits)[1]
+    storage.pyToLayerData(layer, 'quantize', dict(stats, bits=bits))
+    return stats
+
+
+def quantizedLayers():
+    """Return a dict of blendShape -> bits of every quantized layer."""
+    result = {}
+    for bs in cmds.ls('*.' + bitsAttr, objectsOnly=True, recursive=True) or []:
+        bits = cmds.getAttr(bs + '.' + bitsAttr)
+        if bits in (8, 16):
+            result[bs] = bits
+
+    return result
+
+
+def beforeSave(*args):
+    """
+    Write the quantized payloads and empty the float targets for the file.
+    A layer is only emptied once its payload is written and decodes back
+    within half a step, every other layer is saved at full precision.  The
+    targets are kept in memory and written back after the save, or on the
+    next idle when the save fails and kAfterSave never comes.
+    """
+    restoreTargets()
+    for bs, bits in quantizedLayers().items():
+        try:
+            saved = readTargets(bs)
+            payload, _ = encodeTargets(saved, bits)
+            setPayload(bs, payload)
+        except Exception:
+            logger.warning('SAT could not quantize %s, it is saved at full precision', bs, exc_info=True)
+            continue
+        _stripped[bs] = saved
+
+    if len(_stripped) == 0:
+        return
+    empty = (np.zeros(0, dtype=np.int64), np.zeros((0, 3)))
+    for bs, saved in _stripped.items():
+        for index in saved.keys():
+            writeTarget(bs, index, *empty)
+
+    if not cmds.about(batch=True):
+        maya.utils.executeDeferred(restoreTargets)
+
+
+def restoreTargets(*args):
+    """Put the full precision targets emptied by beforeSave() back."""
+    while len(_stripped) > 0:
+        bs, saved = _stripped.popitem()
+        if not cmds.objExists(bs):
+            continue
+        for index, (indices, values) in saved.items():
+            writeTarget(bs, index, indices, values)
+
+        setPayload(bs, '')
+
+
+def decodeOpened(*args):
+    decodeScene()
+
+
+def forgetTargets(*args):
+    """A new scene replaces the one the kept targets belong to."""
+    _stripped.clear()
+
+
+def installCallbacks():
+    """
+    Quantize on save and decode on open while SAT runs.  Called from the SAT
+    window and the batch quantize operation, a scene opened without them is
+    decoded when SAT loads it.
+    """
+    if len(_callbacks) > 0:
+        return
+    _callbacks.append(om2.MSceneMessage.addCallback(om2.MSceneMessage.kBeforeSave, beforeSave))
+    _callbacks.append(om2.MSceneMessage.addCallback(om2.MSceneMessage.kAfterSave, restoreTargets))
+    _callbacks.append(om2.MSceneMessage.addCallback(om2.MSceneMessage.kBeforeNew, forgetTargets))
+    _callbacks.append(om2.MSceneMessage.addCallback(om2.MSceneMessage.kBeforeOpen, forgetTargets))
+    _callbacks.append(om2.MSceneMessage.addCallback(om2.MSceneMessage.kAfterOpen, decodeOpened))
+
+
+def removeCallbacks():
+    for callback in _callbacks:
+        om2.MMessage.removeCallback(callback)
+
+    del _callbacks[:]
@@ -0,0 +1,80 @@
+# Shape Animation Tool - Updated for Maya 2025 / Python 3
+import maya.cmds as cmds
+import numpy as np
+
+from . import layers
+from . import utils
+from . import workers
+
+
+def everyFrames(start, end, step):
+    """Return the frames start, start + step, .. up to end."""
+    if step <= 0 or end < start:
+        return []
+    return [float(t) for t in np.arange(start, end + step * 1e-6, step)]
+
+
+def transformKeyTimes(nodes, start=None, end=None):
+    """Return the sorted key times of the animation curves driving nodes, optionally within start - end."""
+    if len(nodes) == 0:
+        return []
+    times = cmds.keyframe(nodes, query=True, timeChange=True) or []
+    if start is not None:
+        times = [t for t in times if t >= start]
+    if end is not None:
+        times = [t for t in times if t <= end]
+    return sorted(set(times))
+
+
+def layerDeltas(layer, times):
+    """
+    Return the sparse delta the layer adds to its mesh at each of times, as
+    (indices, values) pairs: the sum of every key delta times its weight
+    curve, evaluated with the API without changing the current time.
+    """
+    bs = layers.bsName(layer)
+    empty = (np.zeros(0, dtype=np.int64), np.zeros((0, 3)))
+    if not cmds.objExists(bs):
+        return [empty for t in times]
+    pairs = layers.getKeyTargets(bs)
+    if len(pairs) == 0:
+        return [empty for t in times]
+    count = layers.vertexCount(layers.meshName(layer))
+    keyPairs = [pairs[t] for t in sorted(pairs.keys())]
+    deltas = [layers.sparsify(layers.getKeyDelta(bs, pair, count)) for pair in keyPairs]
+    weights = layers.getKeyWeights(bs, keyPairs, times)
+
+    def sumAt(row):
+        total = np.zeros((count, 3))
+        for k, (indices, values) in enumerate(deltas):
+            if weights[row, k] != 0.0:
+                total[indices] += weights[row, k] * values
+
+        return layers.sparsify(total)
+
+    return workers.map(sumAt, range(len(times)), 'Key Range')
+
+
+def keyRange(layer, times):
+    """
+    Key a layer on many frames in one batched pass.
+
+    Every new key holds what the layer already adds to the mesh at its time,
+    so keying does not change the animation on those frames, it only makes
+    them editable.  All deltas are computed up front from the existing keys,
+    then one createKeys() call allocates the target indices, writes the
+    targets and keys the weight curves, in a single undo step.  Frames that
+    already hold a key are left alone and the current time never changes.
+
+    Return : list : the new key times.
+    """
+    bs = layers.bsName(layer)
+    existing = layers.getKeyTargets(bs) if cmds.objExists(bs) else {}
+    times = sorted(set(float(t) for t in times) - set(existing.keys()))
+    if len(times) == 0:
+        return []
+    deltas = layerDeltas(layer, times)
+    with utils.undoChunk('satKeyRange'):
+        written = layers.createKeys(layer, [(t, indices, values) for t, (indices, values) in zip(times, deltas)])
+
+    return sorted(written.keys())
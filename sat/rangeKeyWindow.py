@@ -0,0 +1,68 @@
+# Shape Animation Tool - Updated for Maya 2025 / Python 3
+from .Qt import QtCore, QtWidgets, QtGui
+
+class Ui_Dialog(object):
+
+    def setupUi(self, Dialog):
+        Dialog.setObjectName('Dialog')
+        Dialog.resize(280, 210)
+        self.verticalLayout = QtWidgets.QVBoxLayout(Dialog)
+        self.verticalLayout.setObjectName('verticalLayout')
+        self.every_radioButton = QtWidgets.QRadioButton(Dialog)
+        self.every_radioButton.setChecked(True)
+        self.every_radioButton.setObjectName('every_radioButton')
+        self.verticalLayout.addWidget(self.every_radioButton)
+        self.transforms_radioButton = QtWidgets.QRadioButton(Dialog)
+        self.transforms_radioButton.setObjectName('transforms_radioButton')
+        self.verticalLayout.addWidget(self.transforms_radioButton)
+        self.formLayout = QtWidgets.QFormLayout()
+        self.formLayout.setObjectName('formLayout')
+        self.start_label = QtWidgets.QLabel(Dialog)
+        self.start_label.setObjectName('start_label')
+        self.formLayout.setWidget(0, QtWidgets.QFormLayout.LabelRole, self.start_label)
+        self.start_spinBox = QtWidgets.QDoubleSpinBox(Dialog)
+        self.start_spinBox.setDecimals(2)
+        self.start_spinBox.setRange(-100000.0, 100000.0)
+        self.start_spinBox.setObjectName('start_spinBox')
+        self.formLayout.setWidget(0, QtWidgets.QFormLayout.FieldRole, self.start_spinBox)
+        self.end_label = QtWidgets.QLabel(Dialog)
+        self.end_label.setObjectName('end_label')
+        self.formLayout.setWidget(1, QtWidgets.QFormLayout.LabelRole, self.end_label)
+        self.end_spinBox = QtWidgets.QDoubleSpinBox(Dialog)
+        self.end_spinBox.setDecimals(2)
+        self.end_spinBox.setRange(-100000.0, 100000.0)
+        self.end_spinBox.setObjectName('end_spinBox')
+        self.formLayout.setWidget(1, QtWidgets.QFormLayout.FieldRole, self.end_spinBox)
+        self.step_label = QtWidgets.QLabel(Dialog)
+        self.step_label.setObjectName('step_label')
+        self.formLayout.setWidget(2, QtWidgets.QFormLayout.LabelRole, self.step_label)
+        self.step_spinBox = QtWidgets.QDoubleSpinBox(Dialog)
+        self.step_spinBox.setDecimals(2)
+        self.step_spinBox.setRange(0.01, 10000.0)
+        self.step_spinBox.setValue(4.0)
+        self.step_spinBox.setObjectName('step_spinBox')
+        self.formLayout.setWidget(2, QtWidgets.QFormLayout.FieldRole, self.step_spinBox)
+        self.verticalLayout.addLayout(self.formLayout)
+        self.layer_label = QtWidgets.QLabel(Dialog)
+        self.layer_label.setWordWrap(True)
+        self.layer_label.setObjectName('layer_label')
+        self.verticalLayout.addWidget(self.layer_label)
+        self.buttonBox = QtWidgets.QDialogButtonBox(Dialog)
+        self.buttonBox.setStandardButtons(QtWidgets.QDialogButtonBox.Cancel | QtWidgets.QDialogButtonBox.Ok)
+        self.buttonBox.setObjectName('buttonBox')
+        self.verticalLayout.addWidget(self.buttonBox)
+        self.retranslateUi(Dialog)
+        self.buttonBox.accepted.connect(Dialog.accept)
+        self.buttonBox.rejected.connect(Dialog.reject)
+        self.every_radioButton.toggled.connect(self.step_spinBox.setEnabled)
+        QtCore.QMetaObject.connectSlotsByName(Dialog)
+        return
+
+    def retranslateUi(self, Dialog):
+        Dialog.setWindowTitle(QtWidgets.QApplication.translate('Dialog', 'Key Range', None))
+        self.every_radioButton.setText(QtWidgets.QApplication.translate('Dialog', 'Every N frames', None))
+        self.transforms_radioButton.setText(QtWidgets.QApplication.translate('Dialog', 'On keys of selected transforms', None))
+        self.start_label.setText(QtWidgets.QApplication.translate('Dialog', 'Start', None))
+        self.end_label.setText(QtWidgets.QApplication.translate('Dialog', 'End', None))
+        self.step_label.setText(QtWidgets.QApplication.translate('Dialog', 'Every', None))
+        self.layer_label.setText(QtWidgets.QApplication.translate('Dialog', 'Layer:', None))
@@ -0,0 +1,76 @@
+# Shape Animation Tool - Updated for Maya 2025 / Python 3
+import csv
+import json
+
+import maya.cmds as cmds
+
+from . import freeze
+from . import layers
+from . import storage
+
+columns = [('layer', 'Layer'), ('frozen', 'Frozen'), ('vertices', 'Vertices'), ('targets', 'Targets'), ('targetBytes', 'Target KB'), ('mults', 'Mult Nodes'), ('curveKeys', 'Curve Keys'), ('evalMs', 'Eval ms/frame')]
+
+# Stored target data: four doubles per point plus the vertex id
+targetPointBytes = 36
+
+
+def sampleFrames(bs, count=8):
+    """Return up to count whole frames spread over the key range of a layer."""
+    times = []
+    for curve in layers.getWeightCurves(bs):
+        times.extend(cmds.keyframe(curve, query=True, tc=True) or [])
+
+    if len(times) == 0:
+        return [cmds.currentTime(query=True)]
+    start, end = int(min(times)), int(max(times))
+    step = max(1, (end - start) // max(count - 1, 1))
+    return list(range(start, end + 1, step))[:count]
+
+
+def layerCost(layer, frames=8):
+    """
+    Return the memory and evaluation cost of one SAT layer as a dict with
+    the keys of report.columns.  Evaluation time is the time to pull the
+    blendShape output minus the time to pull its input geometry, so the
+    deformers below the layer are not counted.  Frozen layers are measured
+    in their frozen form, the frozen column tells them apart.
+    """
+    mesh = layers.meshName(layer)
+    bs = layers.bsName(layer)
+    row = {'layer': layer, 'frozen': False, 'vertices': 0, 'targets': 0, 'targetBytes': 0, 'mults': 0, 'curveKeys': 0, 'evalMs': 0.0}
+    if cmds.objExists(mesh):
+        row['vertices'] = layers.vertexCount(mesh)
+    if not cmds.objExists(bs):
+        return row
+    row['frozen'] = bool(freeze.isFrozen(layer))
+    indices = cmds.getAttr(bs + '.weight', multiIndices=True) or []
+    row['targets'] = len(indices)
+    row['targetBytes'] = sum(len(layers.getSparseTarget(bs, i)[0]) for i in indices) * targetPointBytes
+    row['mults'] = len(set(cmds.listConnections(bs, type='multDoubleLinear') or []))
+    curves = layers.getWeightCurves(bs)
+    if len(curves) > 0:
+        row['curveKeys'] = int(cmds.keyframe(curves, query=True, keyframeCount=True) or 0)
+    times = sampleFrames(bs, frames)
+    total = layers.timePlug(bs + '.outputGeometry[0]', times)
+    upstream = layers.timePlug(bs + '.input[0].inputGeometry', times)
+    row['evalMs'] = round(max(0.0, total - upstream) * 1000.0, 3)
+    return row
+
+
+def layerReport(meshes=None, frames=8):
+    """Return one layerCost() row per SAT layer of the scene (or of meshes)."""
+    if meshes is None:
+        meshes = storage.listLayers()
+    return [layerCost(layer, frames) for layer in meshes]
+
+
+def exportCsv(rows, path):
+    with open(path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=[key for key, _ in columns])
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def exportJson(rows, path):
+    with open(path, 'w') as f:
+        json.dump(rows, f, indent=2)
@@ -0,0 +1,46 @@
+# Shape Animation Tool - Updated for Maya 2025 / Python 3
+from .Qt import QtCore, QtWidgets, QtGui
+
+class Ui_Dialog(object):
+
+    def setupUi(self, Dialog):
+        Dialog.setObjectName('Dialog')
+        Dialog.resize(720, 360)
+        self.verticalLayout = QtWidgets.QVBoxLayout(Dialog)
+        self.verticalLayout.setObjectName('verticalLayout')
+        self.report_tableWidget = QtWidgets.QTableWidget(Dialog)
+        self.report_tableWidget.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.report_tableWidget.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        self.report_tableWidget.setSortingEnabled(True)
+        self.report_tableWidget.setObjectName('report_tableWidget')
+        self.report_tableWidget.horizontalHeader().setStretchLastSection(True)
+        self.report_tableWidget.verticalHeader().setVisible(False)
+        self.verticalLayout.addWidget(self.report_tableWidget)
+        self.horizontalLayout = QtWidgets.QHBoxLayout()
+        self.horizontalLayout.setObjectName('horizontalLayout')
+        self.refresh_btn = QtWidgets.QPushButton(Dialog)
+        self.refresh_btn.setObjectName('refresh_btn')
+        self.horizontalLayout.addWidget(self.refresh_btn)
+        self.exportCsv_btn = QtWidgets.QPushButton(Dialog)
+        self.exportCsv_btn.setObjectName('exportCsv_btn')
+        self.horizontalLayout.addWidget(self.exportCsv_btn)
+        self.exportJson_btn = QtWidgets.QPushButton(Dialog)
+        self.exportJson_btn.setObjectName('exportJson_btn')
+        self.horizontalLayout.addWidget(self.exportJson_btn)
+        spacerItem = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout.addItem(spacerItem)
+        self.buttonBox = QtWidgets.QDialogButtonBox(Dialog)
+        self.buttonBox.setStandardButtons(QtWidgets.QDialogButtonBox.Close)
+        self.buttonBox.setObjectName('buttonBox')
+        self.horizontalLayout.addWidget(self.buttonBox)
+        self.verticalLayout.addLayout(self.horizontalLayout)
+        self.retranslateUi(Dialog)
+        self.buttonBox.rejected.connect(Dialog.reject)
+        QtCore.QMetaObject.connectSlotsByName(Dialog)
+        return
+
+    def retranslateUi(self, Dialog):
+        Dialog.setWindowTitle(QtWidgets.QApplication.translate('Dialog', 'Layer Cost Report', None))
+        self.refresh_btn.setText(QtWidgets.QApplication.translate('Dialog', 'Refresh', None))
+        self.exportCsv_btn.setText(QtWidgets.QApplication.translate('Dialog', 'Export CSV ..', None))
+        self.exportJson_btn.setText(QtWidgets.QApplication.translate('Dialog', 'Export JSON ..', None))
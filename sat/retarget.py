@@ -0,0 +1,168 @@
+# Shape Animation Tool - Updated for Maya 2025 / Python 3
+import time
+
+import numpy as np
+
+from . import layers
+from . import utils
+from . import workers
+from .spatial import SpatialGrid
+
+
+def _dot(a, b):
+    return (a * b).sum(axis=1)
+
+
+def _divide(a, b):
+    return np.divide(a, b, out=np.zeros_like(a), where=b != 0)
+
+
+def closestPointBarycentric(p, a, b, c):
+    """
+    Return the barycentric weights (n, 3) of the closest point to p on each
+    triangle (a, b, c).  All arguments are (n, 3) arrays, one triangle per
+    query point.  Follows the region tests of Ericson, Real-Time Collision
+    Detection 5.1.5, evaluated for all points at once.
+    """
+    ab = b - a
+    ac = c - a
+    ap = p - a
+    bp = p - b
+    cp = p - c
+    d1 = _dot(ab, ap)
+    d2 = _dot(ac, ap)
+    d3 = _dot(ab, bp)
+    d4 = _dot(ac, bp)
+    d5 = _dot(ab, cp)
+    d6 = _dot(ac, cp)
+    va = d3 * d6 - d5 * d4
+    vb = d5 * d2 - d1 * d6
+    vc = d1 * d4 - d3 * d2
+    weights = np.zeros((len(p), 3))
+    done = np.zeros(len(p), dtype=bool)
+
+    def assign(mask, wa, wb, wc):
+        mask = mask & ~done
+        weights[mask, 0] = wa[mask] if np.ndim(wa) else wa
+        weights[mask, 1] = wb[mask] if np.ndim(wb) else wb
+        weights[mask, 2] = wc[mask] if np.ndim(wc) else wc
+        done[mask] = True
+
+    assign((d1 <= 0) & (d2 <= 0), 1.0, 0.0, 0.0)
+    assign((d3 >= 0) & (d4 <= d3), 0.0, 1.0, 0.0)
+    assign((d6 >= 0) & (d5 <= d6), 0.0, 0.0, 1.0)
+    t = _divide(d1, d1 - d3)
+    assign((vc <= 0) & (d1 >= 0) & (d3 <= 0), 1.0 - t, t, 0.0)
+    t = _divide(d2, d2 - d6)
+    assign((vb <= 0) & (d2 >= 0) & (d6 <= 0), 1.0 - t, 0.0, t)
+    t = _divide(d4 - d3, (d4 - d3) + (d5 - d6))
+    assign((va <= 0) & (d4 - d3 >= 0) & (d5 - d6 >= 0), 0.0, 1.0 - t, t)
+    denom = va + vb + vc
+    v = _divide(vb, denom)
+    w = _divide(vc, denom)
+    assign(np.ones(len(p), dtype=bool), 1.0 - v - w, v, w)
+    return weights
+
+
+def vertexTriangles(triangles, count):
+    """Return an (count, k) table of the triangles around each vertex, padded with -1."""
+    flat = triangles.ravel()
+    owner = np.repeat(np.arange(len(triangles)), 3)
+    order = np.argsort(flat, kind='stable')
+    valence = np.bincount(flat, minlength=count)
+    starts = np.concatenate(([0], np.cumsum(valence)[:-1]))
+    rank = np.arange(len(flat)) - starts[flat[order]]
+    table = np.full((count, max(int(valence.max()) if count else 0, 1)), -1, dtype=np.int64)
+    table[flat[order], rank] = owner[order]
+    return table
+
+
+def buildCorrespondence(oldPoints, oldTriangles, newPoints):
+    """
+    Map every new vertex to the closest point on the old surface.
+
+    A SpatialGrid over the old vertices finds the nearest old vertex, then
+    the closest point on each triangle around it is computed.  Returns
+    (indices, weights, distances): (m, 3) old vertex ids and barycentric
+    weights per new vertex and the distance to the old surface.
+    """
+    oldPoints = np.asarray(oldPoints, dtype=np.float64)
+    newPoints = np.asarray(newPoints, dtype=np.float64)
+    nearest, _ = SpatialGrid(oldPoints).nearest(newPoints)
+    indices = np.repeat(nearest[:, None], 3, axis=1)
+    weights = np.zeros((len(newPoints), 3))
+    weights[:, 0] = 1.0
+    distances = np.linalg.norm(oldPoints[nearest] - newPoints, axis=1)
+    table = vertexTriangles(oldTriangles, len(oldPoints))
+    for k in range(table.shape[1]):
+        candidates = table[nearest, k]
+        has = np.flatnonzero(candidates >= 0)
+        if len(has) == 0:
+            continue
+        tri = oldTriangles[candidates[has]]
+        p = newPoints[has]
+        w = closestPointBarycentric(p, oldPoints[tri[:, 0]], oldPoints[tri[:, 1]], oldPoints[tri[:, 2]])
+        closest = (oldPoints[tri] * w[:, :, None]).sum(axis=1)
+        dist = np.linalg.norm(closest - p, axis=1)
+        better = dist < distances[has]
+        sub = has[better]
+        indices[sub] = tri[better]
+        weights[sub] = w[better]
+        distances[sub] = dist[better]
+
+    return (indices, weights, distances)
+
+
+def transferDelta(delta, indices, weights):
+    """
+    Resample a per-vertex (n, 3) delta through a correspondence from
+    buildCorrespondence().  Only new vertices that touch a moved old vertex
+    are computed, so sparse sculpt deltas transfer in a fraction of the time.
+    """
+    moved = np.abs(delta).max(axis=1) > 0
+    rows = np.flatnonzero(moved[indices].any(axis=1))
+    if len(rows) > len(indices) // 2:
+        return np.einsum('mk,mkj->mj', weights, delta[indices])
+    result = np.zeros((len(indices), 3))
+    result[rows] = np.einsum('mk,mkj->mj', weights[rows], delta[indices[rows]])
+    return result
+
+
+def retargetLayer(layer, oldMesh):
+    """
+    Rewrite every target of a SAT layer for the current topology of its mesh.
+
+    Arguments:
+    layer : string : SAT layer whose mesh changed its vertex count.
+    oldMesh : string : mesh with the topology and rest shape the layer was
+            sculpted on, for example a copy kept from before the edit.
+
+    Return : dict : 'keys' holds the per-key transfer error, measured by
+            sampling the transferred delta back at the old vertices, and
+            'surfaceDistance' the largest distance from a new vertex to the
+            old surface.
+    """
+    start = time.time()
+    mesh = layers.meshName(layer)
+    bs = layers.bsName(layer)
+    oldRest = layers.getRestPoints(oldMesh)
+    newRest = layers.getRestPoints(mesh)
+    indices, weights, distances = buildCorrespondence(oldRest, layers.getTriangles(oldMesh), newRest)
+    backIndices, _ = SpatialGrid(newRest).nearest(oldRest)
+    pairs = layers.getKeyTargets(bs)
+    targets = sorted(set(layers.weightIndices(bs).values()))
+    oldDeltas = dict(zip(targets, [layers.getTargetDelta(bs, index, len(oldRest)) for index in targets]))
+    newDeltas = workers.map(lambda index: transferDelta(oldDeltas[index], indices, weights), targets, 'Retarget')
+    with utils.undoChunk('satRetarget'):
+        for index, delta in zip(targets, newDeltas):
+            layers.setTargetDelta(bs, index, delta)
+
+    def keyError(item):
+        keyTime, (id0, id1) = item
+        oldDelta = oldDeltas[id1] - oldDeltas[id0]
+        newDelta = transferDelta(oldDelta, indices, weights)
+        error = np.linalg.norm(newDelta[backIndices] - oldDelta, axis=1)
+        return {'time': keyTime, 'maxError': float(error.max()) if len(error) else 0.0, 'rmsError': float(np.sqrt((error ** 2).mean())) if len(error) else 0.0}
+
+    keys = workers.map(keyError, sorted(pairs.items()), 'Transfer error')
+    return {'keys': keys, 'surfaceDistance': float(distances.max()) if len(distances) else 0.0, 'seconds': time.time() - start}
@@ -0,0 +1,67 @@
+# Shape Animation Tool - Updated for Maya 2025 / Python 3
+import maya.cmds as cmds
+
+from . import layers
+from . import utils
+
+
+def timeMap(offset=0.0, scale=1.0, pivot=0.0, curve=None):
+    """
+    Return a function mapping an old key time to its new time.  The optional
+    time curve (an animCurveTT or animCurveTU node) is applied first, then the
+    scale around pivot and finally the offset.
+    """
+    def remap(t):
+        if curve is not None:
+            t = cmds.getAttr(curve + '.output', time=t)
+        return (t - pivot) * scale + pivot + offset
+
+    return remap
+
+
+def retimeLayers(layerList, offset=0.0, scale=1.0, pivot=0.0, curve=None):
+    """
+    Move the SAT keys of several layers in one undo step.
+
+    Every weight curve of a layer is keyed on all of its key times, so new
+    times are computed once per layer and applied to all curves at once.
+    Plain offset and scale go through a single scaleKey/keyframe call per
+    layer, a time curve moves one key time per call.  The cost is linear in
+    the number of keys.
+
+    Return : dict : layer -> {old time: new time}.
+    """
+    if scale <= 0:
+        raise ValueError('Retime scale must be positive')
+    remap = timeMap(offset, scale, pivot, curve)
+    plans = []
+    for layer in layerList:
+        curves = layers.getWeightCurves(layers.bsName(layer))
+        if len(curves) == 0:
+            continue
+        oldTimes = sorted(set(cmds.keyframe(curves, query=True, tc=True) or []))
+        newTimes = [remap(t) for t in oldTimes]
+        for a, b in zip(newTimes, newTimes[1:]):
+            if b <= a:
+                raise ValueError("Retime of layer '%s' would put two keys on frame %g" % (layer, b))
+
+        plans.append((layer, curves, oldTimes, newTimes))
+
+    result = {}
+    with utils.undoChunk('satRetime'):
+        for layer, curves, oldTimes, newTimes in plans:
+            if curve is None:
+                if scale != 1.0:
+                    cmds.scaleKey(curves, timeScale=scale, timePivot=pivot)
+                if offset != 0.0:
+                    cmds.keyframe(curves, edit=True, relative=True, timeChange=offset)
+            else:
+                # Park every key after the new range so keys never cross while moving
+                shift = max(newTimes) - min(oldTimes) + 1.0
+                cmds.keyframe(curves, edit=True, relative=True, timeChange=shift)
+                for old, new in zip(oldTimes, newTimes):
+                    cmds.keyframe(curves, edit=True, time=(old + shift, old + shift), absolute=True, timeChange=new)
+
+            result[layer] = dict(zip(oldTimes, newTimes))
+
+    return result
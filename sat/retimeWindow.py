@@ -0,0 +1,77 @@
+# Shape Animation Tool - Updated for Maya 2025 / Python 3
+from .Qt import QtCore, QtWidgets, QtGui
+
+class Ui_Dialog(object):
+
+    def setupUi(self, Dialog):
+        Dialog.setObjectName('Dialog')
+        Dialog.resize(260, 190)
+        self.verticalLayout = QtWidgets.QVBoxLayout(Dialog)
+        self.verticalLayout.setObjectName('verticalLayout')
+        self.formLayout = QtWidgets.QFormLayout()
+        self.formLayout.setObjectName('formLayout')
+        self.offset_label = QtWidgets.QLabel(Dialog)
+        self.offset_label.setObjectName('offset_label')
+        self.formLayout.setWidget(0, QtWidgets.QFormLayout.LabelRole, self.offset_label)
+        self.offset_spinBox = QtWidgets.QDoubleSpinBox(Dialog)
+        self.offset_spinBox.setDecimals(2)
+        self.offset_spinBox.setRange(-100000.0, 100000.0)
+        self.offset_spinBox.setObjectName('offset_spinBox')
+        self.formLayout.setWidget(0, QtWidgets.QFormLayout.FieldRole, self.offset_spinBox)
+        self.scale_label = QtWidgets.QLabel(Dialog)
+        self.scale_label.setObjectName('scale_label')
+        self.formLayout.setWidget(1, QtWidgets.QFormLayout.LabelRole, self.scale_label)
+        self.scale_spinBox = QtWidgets.QDoubleSpinBox(Dialog)
+        self.scale_spinBox.setDecimals(3)
+        self.scale_spinBox.setRange(0.001, 1000.0)
+        self.scale_spinBox.setSingleStep(0.1)
+        self.scale_spinBox.setValue(1.0)
+        self.scale_spinBox.setObjectName('scale_spinBox')
+        self.formLayout.setWidget(1, QtWidgets.QFormLayout.FieldRole, self.scale_spinBox)
+        self.pivot_label = QtWidgets.QLabel(Dialog)
+        self.pivot_label.setObjectName('pivot_label')
+        self.formLayout.setWidget(2, QtWidgets.QFormLayout.LabelRole, self.pivot_label)
+        self.pivot_spinBox = QtWidgets.QDoubleSpinBox(Dialog)
+        self.pivot_spinBox.setDecimals(2)
+        self.pivot_spinBox.setRange(-100000.0, 100000.0)
+        self.pivot_spinBox.setObjectName('pivot_spinBox')
+        self.formLayout.setWidget(2, QtWidgets.QFormLayout.FieldRole, self.pivot_spinBox)
+        self.curve_label = QtWidgets.QLabel(Dialog)
+        self.curve_label.setObjectName('curve_label')
+        self.formLayout.setWidget(3, QtWidgets.QFormLayout.LabelRole, self.curve_label)
+        self.horizontalLayout = QtWidgets.QHBoxLayout()
+        self.horizontalLayout.setSpacing(2)
+        self.horizontalLayout.setObjectName('horizontalLayout')
+        self.curve_lineEdit = QtWidgets.QLineEdit(Dialog)
+        self.curve_lineEdit.setObjectName('curve_lineEdit')
+        self.horizontalLayout.addWidget(self.curve_lineEdit)
+        self.curve_btn = QtWidgets.QPushButton(Dialog)
+        self.curve_btn.setMaximumSize(QtCore.QSize(30, 16777215))
+        self.curve_btn.setObjectName('curve_btn')
+        self.horizontalLayout.addWidget(self.curve_btn)
+        self.formLayout.setLayout(3, QtWidgets.QFormLayout.FieldRole, self.horizontalLayout)
+        self.verticalLayout.addLayout(self.formLayout)
+        self.layers_label = QtWidgets.QLabel(Dialog)
+        self.layers_label.setWordWrap(True)
+        self.layers_label.setObjectName('layers_label')
+        self.verticalLayout.addWidget(self.layers_label)
+        self.buttonBox = QtWidgets.QDialogButtonBox(Dialog)
+        self.buttonBox.setStandardButtons(QtWidgets.QDialogButtonBox.Cancel | QtWidgets.QDialogButtonBox.Ok)
+        self.buttonBox.setObjectName('buttonBox')
+        self.verticalLayout.addWidget(self.buttonBox)
+        self.retranslateUi(Dialog)
+        self.buttonBox.accepted.connect(Dialog.accept)
+        self.buttonBox.rejected.connect(Dialog.reject)
+        QtCore.QMetaObject.connectSlotsByName(Dialog)
+        return
+
+    def retranslateUi(self, Dialog):
+        Dialog.setWindowTitle(QtWidgets.QApplication.translate('Dialog', 'Retime Keys', None))
+        self.offset_label.setText(QtWidgets.QApplication.translate('Dialog', 'Offset', None))
+        self.scale_label.setText(QtWidgets.QApplication.translate('Dialog', 'Scale', None))
+        self.pivot_label.setText(QtWidgets.QApplication.translate('Dialog', 'Pivot', None))
+        self.curve_label.setText(QtWidgets.QApplication.translate('Dialog', 'Time Curve', None))
+        self.curve_lineEdit.setPlaceholderText(QtWidgets.QApplication.translate('Dialog', 'none', None))
+        self.curve_btn.setText(QtWidgets.QApplication.translate('Dialog', '<<', None))
+        self.curve_btn.setToolTip(QtWidgets.QApplication.translate('Dialog', 'Use the selected animation curve', None))
+        self.layers_label.setText(QtWidgets.QApplication.translate('Dialog', 'Layers:', None))
@@ -0,0 +1,49 @@
+# Shape Animation Tool - Updated for Maya 2025 / Python 3
+import maya.cmds as cmds
+import maya.api.OpenMaya as om2
+import maya.api.OpenMayaAnim as oma
+
+# Scene state is about to go away
+beforeSwitch = ('kBeforeNew', 'kBeforeOpen')
+# A new scene is loaded, or references changed the layers of the current one
+afterSwitch = ('kAfterNew', 'kAfterOpen')
+afterReference = ('kAfterCreateReference', 'kAfterRemoveReference', 'kAfterLoadReference', 'kAfterUnloadReference', 'kAfterImport')
+# Keys may have changed without SAT: undo, redo, graph editor or dope sheet
+# edits, keys deleted by other tools
+keysEdited = ('Undo', 'Redo', 'animCurveEdited')
+
+_callbacks = []
+_jobs = []
+
+
+def isReadingFile():
+    """True while a scene is opening, when reference events are followed by kAfterOpen anyway."""
+    return om2.MFileIO.isOpeningFile() or om2.MFileIO.isNewingFile()
+
+
+def installCallbacks(handler):
+    """
+    Call handler(event) on scene lifecycle events, event being one of the
+    MSceneMessage names in beforeSwitch, afterSwitch or afterReference, and
+    when keys may have changed, event being one of keysEdited.
+    """
+    if len(_callbacks) > 0:
+        return
+    for event in beforeSwitch + afterSwitch + afterReference:
+        _callbacks.append(om2.MSceneMessage.addCallback(getattr(om2.MSceneMessage, event), lambda clientData, event=event: handler(event)))
+
+    _callbacks.append(oma.MAnimMessage.addAnimCurveEditedCallback(lambda curves, clientData: handler('animCurveEdited')))
+    for event in ('Undo', 'Redo'):
+        _jobs.append(cmds.scriptJob(event=[event, lambda event=event: handler(event)]))
+
+
+def removeCallbacks():
+    for callback in _callbacks:
+        om2.MMessage.removeCallback(callback)
+
+    for job in _jobs:
+        if cmds.scriptJob(exists=job):
+            cmds.scriptJob(kill=job, force=True)
+
+    del _callbacks[:]
+    del _jobs[:]
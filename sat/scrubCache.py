@@ -0,0 +1,84 @@
+# Shape Animation Tool - Updated for Maya 2025 / Python 3
+import maya.cmds as cmds
+
+from . import layers
+from . import utils
+from .cache import LRUCache
+
+
+class ScrubCache(object):
+    """
+    Per-layer cache of evaluated mesh points used for timeline scrubbing.
+
+    Frames are stored as MPointArrays in a size-bounded LRU buffer.  When the
+    current frame is cached, a display-only proxy of the mesh is shown with
+    the cached points and the deformed mesh is hidden, so Maya does not need
+    to evaluate the deformer stack for that frame.
+
+    Arguments:
+    layer : string : SAT layer name (<mesh>_LR<n>).
+    maxBytes : int : memory budget of the cache, in bytes.
+    """
+
+    def __init__(self, layer, maxBytes=512 * 1024 * 1024):
+        self.layer = layer
+        self.mesh = layers.meshName(layer)
+        self.proxy = layer + '_satScrub'
+        self.frames = LRUCache(maxBytes, sizeOf=layers.pointArrayBytes)
+        self.showing = False
+
+    def frameKey(self, time):
+        return round(time, 3)
+
+    def lookup(self, time):
+        return self.frames.get(self.frameKey(time))
+
+    def store(self, time, points=None):
+        if points is None:
+            points = layers.getPointArray(self.mesh, time)
+        self.frames.put(self.frameKey(time), points)
+        return points
+
+    def fillNext(self, time, start, end):
+        """
+        Evaluate and store the uncached whole frame in [start, end] closest to
+        time.  Returns the evaluated frame, or None when the range is full.
+        """
+        center = int(round(time))
+        for offset in range(int(end - start) + 1):
+            for frame in (center + offset, center - offset):
+                if start <= frame <= end and self.frameKey(frame) not in self.frames:
+                    self.store(frame)
+                    return frame
+
+        return None
+
+    def invalidate(self, start=float('-inf'), end=float('inf')):
+        """Drop the cached frames inside the open time range (start, end)."""
+        return self.frames.invalidate(lambda frame: start < frame < end)
+
+    def show(self, points):
+        if not cmds.objExists(self.proxy):
+            layers.createDisplayMesh(self.mesh, self.proxy)
+        layers.setPoints(self.proxy, points)
+        if not self.showing:
+            cmds.setAttr(self.proxy + '.visibility', True)
+            utils.hideMesh(self.mesh, self)
+            self.showing = True
+
+    def hide(self):
+        if not self.showing:
+            return
+        if cmds.objExists(self.proxy):
+            cmds.setAttr(self.proxy + '.visibility', False)
+        utils.showMesh(self.mesh, self)
+        self.showing = False
+
+    def release(self):
+        self.hide()
+        if cmds.objExists(self.proxy):
+            cmds.delete(self.proxy)
+        self.frames.clear()
+
+    def stats(self):
+        return {'hitRate': self.frames.hitRate(), 'frames': len(self.frames), 'bytes': self.frames.nbytes, 'maxBytes': self.frames.maxBytes}
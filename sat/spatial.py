@@ -0,0 +1,110 @@
+# Shape Animation Tool - Updated for Maya 2025 / Python 3
+import itertools
+
+import numpy as np
+
+
+class SpatialGrid(object):
+    """
+    Uniform hash grid over a point cloud for vectorised nearest point queries.
+
+    Points are bucketed by integer cell coordinates and sorted by cell key, so
+    a query is a binary search per neighbouring cell instead of a comparison
+    with every point.  Building and querying scale as O(n log n), which keeps
+    million vertex meshes interactive.
+
+    Arguments:
+    points : (n, 3) array : points to index.
+    cellSize : float : edge length of a cell.  Defaults to a size that puts
+            about one vertex of a surface mesh in each occupied cell.
+    """
+
+    def __init__(self, points, cellSize=None):
+        self.points = np.asarray(points, dtype=np.float64)
+        count = max(len(self.points), 1)
+        if len(self.points) > 0:
+            self.origin = self.points.min(axis=0)
+            extent = float(np.ptp(self.points, axis=0).max())
+        else:
+            self.origin = np.zeros(3)
+            extent = 0.0
+        if cellSize is None:
+            cellSize = extent / max(1.0, np.sqrt(count))
+        self.cellSize = max(cellSize, 1e-9)
+        cells = self._cells(self.points)
+        if len(cells) > 0:
+            self.dims = cells.max(axis=0) + 1
+        else:
+            self.dims = np.ones(3, dtype=np.int64)
+        keys = self._encode(cells)
+        self.order = np.argsort(keys, kind='stable')
+        self.cellKeys, self.cellStart, self.cellCount = np.unique(keys[self.order], return_index=True, return_counts=True)
+
+    def _cells(self, points):
+        return np.floor((points - self.origin) / self.cellSize).astype(np.int64)
+
+    def _encode(self, cells):
+        return (cells[:, 0] * self.dims[1] + cells[:, 1]) * self.dims[2] + cells[:, 2]
+
+    def _lookup(self, cells):
+        inside = np.all((cells >= 0) & (cells < self.dims), axis=1)
+        keys = np.where(inside, self._encode(np.clip(cells, 0, self.dims - 1)), -1)
+        if len(self.cellKeys) == 0:
+            return (np.zeros(len(cells), dtype=np.int64), np.zeros(len(cells), dtype=np.int64))
+        pos = np.minimum(np.searchsorted(self.cellKeys, keys), len(self.cellKeys) - 1)
+        found = inside & (self.cellKeys[pos] == keys)
+        start = np.where(found, self.cellStart[pos], 0)
+        count = np.where(found, self.cellCount[pos], 0)
+        return (start, count)
+
+    def _shell(self, ring):
+        if ring == 0:
+            return [np.zeros(3, dtype=np.int64)]
+        steps = range(-ring, ring + 1)
+        return [np.array(o, dtype=np.int64) for o in itertools.product(steps, steps, steps) if max(abs(o[0]), abs(o[1]), abs(o[2])) == ring]
+
+    def nearest(self, queries, maxDistance=np.inf):
+        """
+        Return (indices, distances) of the closest indexed point to every
+        query point.  Queries with nothing within maxDistance get index -1
+        and an infinite distance.
+        """
+        queries = np.asarray(queries, dtype=np.float64)
+        best = np.full(len(queries), -1, dtype=np.int64)
+        bestDist = np.full(len(queries), np.inf)
+        if len(self.points) == 0 or len(queries) == 0:
+            return (best, bestDist)
+        queryCells = self._cells(queries)
+        fraction = (queries - self.origin) / self.cellSize - queryCells
+        if np.isfinite(maxDistance):
+            maxRing = int(np.ceil(maxDistance / self.cellSize))
+        else:
+            maxRing = int(self.dims.max())
+        active = np.arange(len(queries))
+        ring = 0
+        while len(active) > 0 and ring <= maxRing:
+            for offset in self._shell(ring):
+                # Skip queries whose current best is closer than the cell itself
+                gap = np.where(offset > 0, offset - fraction[active], np.where(offset < 0, -offset - 1 + fraction[active], 0.0))
+                gap = np.sqrt((gap * gap).sum(axis=1)) * self.cellSize
+                reach = active[gap < np.minimum(bestDist[active], maxDistance)]
+                if len(reach) == 0:
+                    continue
+                start, count = self._lookup(queryCells[reach] + offset)
+                for j in range(int(count.max())):
+                    has = count > j
+                    sub = reach[has]
+                    candidates = self.order[start[has] + j]
+                    dist = np.linalg.norm(self.points[candidates] - queries[sub], axis=1)
+                    better = dist < bestDist[sub]
+                    bestDist[sub[better]] = dist[better]
+                    best[sub[better]] = candidates[better]
+
+            # Cells outside this ring are at least ring * cellSize away
+            active = active[bestDist[active] > ring * self.cellSize]
+            ring += 1
+
+        outside = bestDist > maxDistance
+        best[outside] = -1
+        bestDist[outside] = np.inf
+        return (best, bestDist)
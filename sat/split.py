@@ -0,0 +1,97 @@
+# Shape Animation Tool - Updated for Maya 2025 / Python 3
+import maya.cmds as cmds
+import numpy as np
+
+from . import layers
+from . import masks
+from . import utils
+from . import workers
+
+
+def setMask(count, indices):
+    mask = np.zeros(count)
+    mask[indices] = 1.0
+    return mask
+
+
+def regionsFromSets(count, sets, mesh=None):
+    """Return (name, mask) regions of vertex (or face) sets, only counting members on mesh."""
+    return [(s, setMask(count, layers.componentIndices(cmds.sets(s, query=True) or [], mesh))) for s in sets]
+
+
+def normalizeRegions(regions):
+    """
+    Make region masks sum to at most one per vertex and add a 'rest' region
+    with what is left, so the split layers always add up to the original.
+    """
+    if len(regions) == 0:
+        return regions
+    stack = np.clip(np.array([mask for _, mask in regions]), 0.0, None)
+    total = stack.sum(axis=0)
+    stack = stack / np.maximum(total, 1.0)
+    rest = 1.0 - stack.sum(axis=0)
+    result = [(name, m) for (name, _), m in zip(regions, stack)]
+    if rest.max() > 1e-6:
+        result.append(('rest', rest))
+    return result
+
+
+def regionKeys(times, deltas, mask):
+    """Return the (time, indices, values) keys of the part of deltas inside a region mask."""
+    region = np.flatnonzero(mask > 0.0)
+    keys = []
+    for t, delta in zip(times, deltas):
+        indices, values = layers.sparsify(delta[region] * mask[region, None])
+        keys.append((t, region[indices], values))
+
+    return keys
+
+
+def splitLayer(layer, regions, newLayers, deleteOriginal=True):
+    """
+    Divide every key of layer between one new layer per region.
+
+    Each new layer gets the key times of the original, a copy of its weight
+    curves, and only the vertices its region moves, so its evaluation and
+    memory scale with the region size, and its deformer only evaluates the
+    vertices of its region.  The painted base weights (and mask) of the
+    original are baked into the pieces, which start unpainted.
+
+    Arguments:
+    layer : string : layer to split.
+    regions : list : (name, mask) pairs, a (n,) array of per-vertex weights
+            per region.  Run them through normalizeRegions() first to keep
+            the sum of the new layers equal to the original.
+    newLayers : list : name of the new layer of each region.
+
+    Return : list : the new layers that got at least one moved vertex.
+    """
+    bs = layers.bsName(layer)
+    pairs = layers.getKeyTargets(bs)
+    times = sorted(pairs.keys())
+    count = layers.vertexCount(layers.meshName(layer))
+    envelope = cmds.getAttr(bs + '.envelope')
+    # The new layers have unpainted weights, so bake the painted ones (and the mask) in
+    weights = layers.getBaseWeights(bs, count)[:, None]
+    deltas = [layers.getKeyDelta(bs, pairs[t], count) * weights for t in times]
+    keysOfRegions = workers.map(lambda mask: regionKeys(times, deltas, mask), [mask for _, mask in regions], 'Split')
+    created = []
+    with utils.undoChunk('satSplit'):
+        for newLayer, keys, (_, mask) in zip(newLayers, keysOfRegions, regions):
+            if all(len(indices) == 0 for _, indices, _ in keys):
+                continue
+            written = layers.createKeys(newLayer, keys)
+            masks.restrictComponents(newLayer, np.flatnonzero(mask > 0.0))
+            newBs = layers.bsName(newLayer)
+            cmds.setAttr(newBs + '.envelope', envelope)
+            for t in times:
+                # Keep the original timing, tangents and in-betweens
+                if cmds.copyKey('%s.w[%d]' % (bs, pairs[t][1])):
+                    cmds.pasteKey('%s.w[%d]' % (newBs, written[t][1]), option='replaceCompletely')
+
+            created.append(newLayer)
+
+        if deleteOriginal and len(created) > 0:
+            layers.deleteLayerNodes(layer)
+
+    return created
@@ -0,0 +1,102 @@
+# Shape Animation Tool - Updated for Maya 2025 / Python 3
+"""
+Stand-in maya modules for running SAT batch workers without Maya.
+
+install() registers empty maya, maya.cmds, maya.api.OpenMaya and friends in
+sys.modules.  Scene queries return empty results, so every batch operation
+runs against an empty scene and the scheduler can be exercised anywhere.
+"""
+import sys
+import types
+
+
+class Stub(object):
+    """Any attribute, call or instantiation of an API class returns a Stub."""
+
+    def __init__(self, *args, **kwargs):
+        return
+
+    def __getattr__(self, name):
+        return Stub()
+
+    def __call__(self, *args, **kwargs):
+        return Stub()
+
+    def __iter__(self):
+        return iter([])
+
+    def __len__(self):
+        return 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+
+class Cmds(types.ModuleType):
+    """maya.cmds stand-in that records the commands it receives."""
+
+    def __init__(self):
+        super(Cmds, self).__init__('maya.cmds')
+        self.calls = []
+        self.sceneName = ''
+
+    def __getattr__(self, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+
+        def command(*args, **kwargs):
+            self.calls.append(name)
+            return None
+
+        return command
+
+    def ls(self, *args, **kwargs):
+        return []
+
+    def objExists(self, name):
+        return False
+
+    def about(self, *args, **kwargs):
+        if kwargs.get('batch') or kwargs.get('b'):
+            return True
+        return '2025'
+
+    def file(self, *args, **kwargs):
+        self.calls.append('file')
+        if kwargs.get('open') or kwargs.get('o'):
+            self.sceneName = args[0]
+        if kwargs.get('query') or kwargs.get('q'):
+            return self.sceneName
+        return self.sceneName
+
+
+def _module(name, **attrs):
+    module = types.ModuleType(name)
+    module.__dict__.update(attrs)
+    module.__getattr__ = lambda attr: Stub()
+    return module
+
+
+def install():
+    """Register the stand-in modules, unless a real Maya is importable already."""
+    if 'maya.cmds' in sys.modules:
+        return sys.modules['maya.cmds']
+    cmds = Cmds()
+    api = _module('maya.api')
+    om2 = _module('maya.api.OpenMaya', MPlug=Stub)
+    oma = _module('maya.api.OpenMayaAnim')
+    api.OpenMaya = om2
+    api.OpenMayaAnim = oma
+    standalone = _module('maya.standalone', initialize=lambda **kwargs: None, uninitialize=lambda: None)
+    maya = _module('maya', cmds=cmds, api=api, standalone=standalone)
+    maya.__path__ = []
+    modules = {'maya': maya, 'maya.cmds': cmds, 'maya.api': api, 'maya.api.OpenMaya': om2, 'maya.api.OpenMayaAnim': oma, 'maya.standalone': standalone, 'maya.mel': _module('maya.mel'), 'maya.utils': _module('maya.utils', executeDeferred=lambda fn, *args: fn(*args)), 'maya.OpenMaya': _module('maya.OpenMaya'), 'maya.OpenMayaUI': _module('maya.OpenMayaUI')}
+    for name, module in modules.items():
+        sys.modules[name] = module
+        if name.count('.') == 1 and name != 'maya.api':
+            setattr(maya, name.split('.')[1], module)
+
+    return cmds
@@ -0,0 +1,179 @@
+# Shape Animation Tool - Updated for Maya 2025 / Python 3
+import re
+
+import maya.cmds as cmds
+
+from . import utils
+
+tagAttr = 'satStorage'
+namespaceAttr = 'satNamespace'
+layersAttr = 'satLayers'
+
+
+def namespaceOf(name):
+    """Return the full namespace of a node name, '' for the root namespace."""
+    return name.rpartition(':')[0]
+
+
+def stripNamespace(name):
+    return name.rpartition(':')[2]
+
+
+def _join(namespace, name):
+    if namespace:
+        return namespace + ':' + name
+    return name
+
+
+def _dataAttr(layer):
+    return 'satLayer_' + re.sub(r'\W', '_', stripNamespace(layer))
+
+
+def storageNodes():
+    """
+    Return a dict of namespace -> SAT storage node of every asset in the
+    scene.  Nodes are found by their satStorage tag, not by name, and their
+    namespace is read from where the node lives now, so an asset referenced
+    twice under different namespaces gets two independent storages.
+    """
+    nodes = {}
+    for node in cmds.ls('*.' + tagAttr, objectsOnly=True, recursive=True) or []:
+        nodes.setdefault(namespaceOf(node), node)
+
+    return nodes
+
+
+def storageNode(namespace, create=False):
+    node = storageNodes().get(namespace)
+    if node is not None or not create:
+        return node
+    node = cmds.createNode('network', n=_join(namespace, 'satStorage'), skipSelect=True)
+    cmds.addAttr(node, longName=tagAttr, attributeType='bool', defaultValue=True)
+    cmds.addAttr(node, longName=namespaceAttr, dataType='string')
+    cmds.addAttr(node, longName=layersAttr, dataType='string')
+    cmds.setAttr(node + '.' + namespaceAttr, namespace, type='string')
+    cmds.setAttr(node + '.' + layersAttr, '', type='string')
+    return node
+
+
+def _readLayers(node):
+    # Layer names are stored without namespace, one per line, so listing the
+    # layers of an asset never unpickles anything
+    text = cmds.getAttr(node + '.' + layersAttr) or ''
+    return [_join(namespaceOf(node), name) for name in text.split('\n') if name]
+
+
+def listLayers():
+    """Return the SAT layers of every asset in the scene, with their namespace."""
+    result = []
+    for namespace, node in sorted(storageNodes().items()):
+        result.extend(_readLayers(node))
+
+    return result
+
+
+def setLayers(meshes):
+    """
+    Store the layer list, one storage node per namespace.  Nodes whose list
+    did not change are left alone, so referenced assets do not collect
+    needless reference edits.
+    """
+    byNamespace = {}
+    for layer in meshes:
+        byNamespace.setdefault(namespaceOf(layer), []).append(stripNamespace(layer))
+
+    nodes = storageNodes()
+    for namespace in set(nodes.keys()) | set(byNamespace.keys()):
+        names = byNamespace.get(namespace, [])
+        node = nodes.get(namespace)
+        if node is None:
+            node = storageNode(namespace, create=True)
+        text = '\n'.join(names)
+        if (cmds.getAttr(node + '.' + layersAttr) or '') != text:
+            cmds.setAttr(node + '.' + layersAttr, text, type='string')
+
+
+def addLayer(layer):
+    """Register one layer, the stored list is left alone when it is known already."""
+    current = listLayers()
+    if layer not in current:
+        setLayers(current + [layer])
+
+
+def layerDataToPy(layer, key, default=None):
+    """
+    Read per-layer Python data previously stored with pyToLayerData().  Only
+    the data of the requested layer is unpickled.
+
+    Arguments:
+    layer : string : SAT layer name.
+    key : string : name of the data entry.
+    default : some Python data : returned when nothing was stored yet.
+    """
+    node = storageNode(namespaceOf(layer))
+    if node is None or not cmds.attributeQuery(_dataAttr(layer), node=node, exists=True):
+        return default
+    try:
+        data = utils.attrToPy(node + '.' + _dataAttr(layer))
+    except Exception:
+        return default
+    return data.get(key, default)
+
+
+def pyToLayerData(layer, key, value):
+    """
+    Store per-layer Python data on the storage node of the layer's asset.
+    Passing None as value removes the entry.
+
+    Arguments:
+    layer : string : SAT layer name.
+    key : string : name of the data entry.
+    value : some Python data : data to pickle, or None.
+    """
+    node = storageNode(namespaceOf(layer), create=value is not None)
+    if node is None:
+        return
+    objAttr = node + '.' + _dataAttr(layer)
+    data = {}
+    if cmds.attributeQuery(_dataAttr(layer), node=node, exists=True):
+        try:
+            data = utils.attrToPy(objAttr)
+        except Exception:
+            data = {}
+    if value is None:
+        data.pop(key, None)
+    else:
+        data[key] = value
+    utils.pyToAttr(objAttr, data)
+
+
+def migrateLegacy():
+    """
+    Move the layer list and layer data of the old global sat node to per-asset
+    storage nodes.  Returns True when something was migrated.
+    """
+    if not cmds.objExists('sat.meshes'):
+        return False
+    try:
+        meshes = utils.attrToPy('sat.meshes') or []
+    except Exception:
+        meshes = []
+    layerData = {}
+    if cmds.objExists('sat.layerData'):
+        try:
+            layerData = utils.attrToPy('sat.layerData')
+        except Exception:
+            layerData = {}
+    current = listLayers()
+    known = set(current)
+    setLayers(current + [m for m in meshes if m not in known])
+    for layer, data in layerData.items():
+        for key, value in data.items():
+            pyToLayerData(layer, key, value)
+
+    for attr in ('meshes', 'layerData'):
+        if cmds.objExists('sat.' + attr):
+            cmds.setAttr('sat.' + attr, edit=True, lock=False)
+            cmds.deleteAttr('sat.' + attr)
+
+    return True
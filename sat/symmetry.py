@@ -0,0 +1,99 @@
+# Shape Animation Tool - Updated for Maya 2025 / Python 3
+import numpy as np
+
+from . import layers
+from . import utils
+from . import workers
+from .cache import LRUCache
+from .spatial import SpatialGrid
+
+axes = {'x': 0, 'y': 1, 'z': 2}
+symmetryMaps = LRUCache(256 * 1024 * 1024)
+
+
+def buildSymmetryMap(rest, axis=0, tolerance=None):
+    """
+    Return an int array mapping every vertex to its mirror vertex across the
+    plane axis = 0, or -1 where no vertex lies within tolerance of the mirrored
+    position.  Matching goes through a SpatialGrid, so the cost grows as
+    O(n log n) instead of comparing every pair of vertices.
+
+    Arguments:
+    rest : (n, 3) array : symmetrical rest points of the mesh.
+    axis : int : 0, 1 or 2 for the X, Y or Z mirror plane.
+    tolerance : float : maximum distance between a mirrored vertex and its
+            partner.  Defaults to 1/1000 of the mesh size.
+    """
+    rest = np.asarray(rest, dtype=np.float64)
+    if tolerance is None:
+        tolerance = 1e-3 * max(float(np.ptp(rest, axis=0).max()), 1e-9)
+    mirrored = rest.copy()
+    mirrored[:, axis] *= -1
+    partners, _ = SpatialGrid(rest, cellSize=max(2.0 * tolerance, 1e-9)).nearest(mirrored, maxDistance=tolerance)
+    return partners
+
+
+def getSymmetryMap(mesh, axis=0, tolerance=None):
+    """
+    Return the symmetry map of mesh, building it only once per mesh topology.
+    Maps are cached by topology hash, so every mesh sharing the same
+    connectivity (duplicates, referenced copies) reuses the same map.
+    """
+    key = (layers.topologyHash(mesh), axis, tolerance)
+    symMap = symmetryMaps.get(key)
+    if symMap is None:
+        symMap = buildSymmetryMap(layers.getRestPoints(mesh), axis, tolerance)
+        symmetryMaps.put(key, symMap)
+    return symMap
+
+
+def mirrorDelta(delta, rest, symMap, axis=0, mode='+'):
+    """
+    Mirror a (n, 3) delta across the axis plane.
+
+    Arguments:
+    delta : (n, 3) array : key delta to mirror.
+    rest : (n, 3) array : rest points, used to tell the two sides apart.
+    symMap : int array : result of buildSymmetryMap().
+    axis : int : mirror axis.
+    mode : string : '+' copies the positive side onto the negative side, '-'
+            the negative side onto the positive one and 'flip' swaps them.
+    """
+    flip = np.ones(3)
+    flip[axis] = -1.0
+    side = rest[:, axis]
+    tolerance = 1e-6 * max(float(np.ptp(rest, axis=0).max()), 1e-9)
+    result = delta.copy()
+    if mode == 'flip':
+        dst = np.flatnonzero(symMap >= 0)
+    elif mode == '+':
+        dst = np.flatnonzero((side < -tolerance) & (symMap >= 0))
+    else:
+        dst = np.flatnonzero((side > tolerance) & (symMap >= 0))
+    result[dst] = delta[symMap[dst]] * flip
+    if mode != 'flip':
+        center = np.flatnonzero(np.abs(side) <= tolerance)
+        result[center, axis] = 0.0
+    return result
+
+
+def mirrorKeys(layer, times, axis='x', mode='+'):
+    """
+    Mirror the SAT keys of a layer at times in a single undo step.  Results
+    are written back to the key's shape target, the same target data setKey
+    and sculpt() produce.  Returns the mirrored key times.
+    """
+    mesh = layers.meshName(layer)
+    bs = layers.bsName(layer)
+    axis = axes.get(axis, axis)
+    pairs = layers.getKeyTargets(bs)
+    rest = layers.getRestPoints(mesh)
+    symMap = getSymmetryMap(mesh, axis)
+    times = [time for time in times if time in pairs]
+    deltas = [layers.getKeyDelta(bs, pairs[time], len(rest)) for time in times]
+    results = workers.map(lambda delta: mirrorDelta(delta, rest, symMap, axis, mode), deltas, 'Mirror')
+    with utils.undoChunk('satMirror'):
+        for time, delta in zip(times, results):
+            layers.setKeyDelta(bs, pairs[time], delta)
+
+    return times
@@ -0,0 +1,67 @@
+# Shape Animation Tool - Updated for Maya 2025 / Python 3
+import numpy as np
+
+from . import layers
+
+falloffs = ('smooth', 'linear', 'constant')
+
+
+def falloffWeights(offsets, radius, curve='smooth'):
+    """
+    Return the weight of an edit at every frame offset: 1 at offset 0 down to
+    0 at radius and beyond.
+
+    Arguments:
+    offsets : array : frame distances to the sculpted key.
+    radius : float : frames the edit reaches.
+    curve : string : 'smooth' (smoothstep), 'linear' or 'constant'.
+    """
+    x = np.abs(np.asarray(offsets, dtype=np.float64)) / max(float(radius), 1e-9)
+    inside = x <= 1.0
+    if curve == 'linear':
+        weights = 1.0 - x
+    elif curve == 'constant':
+        weights = np.ones_like(x)
+    else:
+        weights = 1.0 - x * x * (3.0 - 2.0 * x)
+    return np.where(inside, weights, 0.0)
+
+
+def propagateEdit(layer, keyTime, before, radius, curve='smooth'):
+    """
+    Add the change a sculpt session made to the key at keyTime to the keys
+    within radius frames, scaled by the falloff.  All neighbours are updated
+    in one array pass.  The caller wraps the sculpt commit and this call
+    in one undo chunk, so the edit and its propagation undo together.
+
+    Arguments:
+    layer : string : the sculpted layer.
+    keyTime : float : time of the sculpted key.
+    before : (n, 3) array : key delta when the session started.
+    radius : float : frames the edit reaches.
+    curve : string : one of temporal.falloffs.
+
+    Return : list : the key times that were changed.
+    """
+    bs = layers.bsName(layer)
+    pairs = layers.getKeyTargets(bs)
+    if keyTime not in pairs:
+        return []
+    edit = layers.getKeyDelta(bs, pairs[keyTime], len(before)) - before
+    indices, values = layers.sparsify(edit)
+    if len(indices) == 0:
+        return []
+    times = np.array(sorted(t for t in pairs if t != keyTime), dtype=np.float64)
+    weights = falloffWeights(times - keyTime, radius, curve)
+    times = times[weights > 0.0]
+    weights = weights[weights > 0.0]
+    if len(times) == 0:
+        return []
+    # The edit is added to each neighbour's shape target, id1 - id0 moves by the same amount
+    increments = weights[:, None, None] * values[None]
+    for t, increment in zip(times, increments):
+        target = layers.getTargetDelta(bs, pairs[t][1], len(before))
+        target[indices] += increment
+        layers.setTargetDelta(bs, pairs[t][1], target)
+
+    return times.tolist()
@@ -3,6 +3,7 @@ import maya.cmds as cmds
 import pickle
 import os
 import importlib.util
+from contextlib import contextmanager
 
 
 def pyToAttr(objAttr, data):
@@ -63,3 +64,63 @@ def compileUI():
         compileUi(os.path.join(modulePath, 'mainWindow.ui'), pyfile, False, 4, False)
     with open(os.path.join(modulePath, 'aboutWindow.py'), 'w') as pyfile2:
         compileUi(os.path.join(modulePath, 'aboutWindow.ui'), pyfile2, False, 4, False)
+
+
+@contextmanager
+def undoChunk(name):
+    """
+    Group every command run inside the with block into a single undo step.
+
+    Arguments:
+    name : string : name of the undo chunk shown in the script editor.
+    """
+    cmds.undoInfo(openChunk=True, chunkName=name)
+    try:
+        yield
+    finally:
+        cmds.undoInfo(closeChunk=True)
+
+
+@contextmanager
+def undoSuspended():
+    """
+    Keep the commands run inside the with block out of the undo queue, then
+    put the undo state back the way it was.
+    """
+    state = cmds.undoInfo(query=True, stateWithoutFlush=True)
+    cmds.undoInfo(stateWithoutFlush=False)
+    try:
+        yield
+    finally:
+        cmds.undoInfo(stateWithoutFlush=state)
+
+
+
+# Owners of every mesh hidden with hideMesh()
+_meshHiders = {}
+
+
+def hideMesh(mesh, owner):
+    """
+    Hide mesh on behalf of owner, e.g. behind a proxy that draws it.  The
+    mesh only shows again once every owner that hid it called showMesh(), so
+    features sharing a mesh do not show it under each other.  Hiding twice
+    for the same owner counts once.
+    """
+    owners = _meshHiders.setdefault(mesh, set())
+    if len(owners) == 0:
+        cmds.setAttr(mesh + '.lodVisibility', False)
+    owners.add(owner)
+
+
+def showMesh(mesh, owner):
+    """Drop the hide of owner on mesh, see hideMesh()."""
+    owners = _meshHiders.get(mesh)
+    if owners is None or owner not in owners:
+        return
+    owners.discard(owner)
+    if len(owners) > 0:
+        return
+    del _meshHiders[mesh]
+    if cmds.objExists(mesh):
+        cmds.setAttr(mesh + '.lodVisibility', True)
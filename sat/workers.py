@@ -0,0 +1,62 @@
+# Shape Animation Tool - Updated for Maya 2025 / Python 3
+import os
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+_pool = None
+_progressHandler = None
+
+
+def pool():
+    """Return the shared thread pool, created on first use."""
+    global _pool
+    if _pool is None:
+        _pool = ThreadPoolExecutor(max_workers=max(1, min(8, (os.cpu_count() or 2) - 1)), thread_name_prefix='sat')
+    return _pool
+
+
+def setProgressHandler(handler):
+    """
+    Register handler(done, total, label) to be called on the main thread while
+    map() waits, or None to stop reporting.
+    """
+    global _progressHandler
+    _progressHandler = handler
+
+
+def map(fn, items, label=''):
+    """
+    Run fn on every item in the worker threads and return the results in
+    item order, exactly like [fn(i) for i in items].
+
+    Only pure numpy work may go through here: numpy releases the GIL in its
+    array kernels, so the threads run in parallel, but Maya commands and the
+    Maya API must stay on the main thread.  While waiting, the main thread
+    keeps reporting progress to the registered handler.  The handler must not
+    process events, the caller is in the middle of reading the scene,
+    computing and writing it back, and anything delivered meanwhile could
+    edit the scene under it.
+    """
+    items = list(items)
+    if len(items) == 0:
+        return []
+    if len(items) == 1 and _progressHandler is None:
+        return [fn(items[0])]
+    futures = [pool().submit(fn, item) for item in items]
+    pending = set(futures)
+    try:
+        while len(pending) > 0:
+            done, pending = wait(pending, timeout=0.05, return_when=FIRST_COMPLETED)
+            if _progressHandler is not None:
+                _progressHandler(len(futures) - len(pending), len(futures), label)
+
+    finally:
+        if _progressHandler is not None:
+            _progressHandler(len(futures), len(futures), label)
+    return [f.result() for f in futures]
+
+
+def shutdown():
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False)
+        _pool = None
@@ -0,0 +1,10 @@
+# Shape Animation Tool - Updated for Maya 2025 / Python 3
+# The numpy parts of SAT run without Maya on the stand-in maya modules
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sat import standin
+
+standin.install()
@@ -0,0 +1,45 @@
+# Shape Animation Tool - Updated for Maya 2025 / Python 3
+import os
+import sys
+
+from sat import batch
+
+script = '''
+import json, sys
+for line in sys.stdin:
+    job = json.loads(line)
+    print('Maya banner on stdout')
+    if job['scene'] == 'bad.ma':
+        print(%r + '{not json')
+    else:
+        print(%r + json.dumps({'scene': job['scene'], 'ok': True}))
+    sys.stdout.flush()
+''' % (batch.resultPrefix, batch.resultPrefix)
+
+
+def worker():
+    return batch.Worker([sys.executable, '-c', script], dict(os.environ))
+
+
+def test_workerSkipsNoise():
+    w = worker()
+    try:
+        assert w.run({'scene': 'a.ma'}) == {'scene': 'a.ma', 'ok': True}
+        assert w.run({'scene': 'b.ma'})['ok']
+    finally:
+        w.stop()
+
+
+def test_unreadableResultIsAFailure():
+    w = worker()
+    try:
+        result = w.run({'scene': 'bad.ma'})
+        assert not result['ok'] and 'unreadable' in result['error']
+    finally:
+        w.stop()
+
+
+def test_standinBatch():
+    results = batch.runBatch(['a.ma', 'b.ma', 'c.ma'], 'validate', workers=2, standin=True)
+    assert [r['scene'] for r in results] == ['a.ma', 'b.ma', 'c.ma']
+    assert all(r['ok'] for r in results)
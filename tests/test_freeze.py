@@ -0,0 +1,26 @@
+# Shape Animation Tool - Updated for Maya 2025 / Python 3
+import numpy as np
+
+from sat import freeze
+
+
+def test_packedTargetsRoundTrip():
+    rng = np.random.default_rng(12)
+    targets = {0: (np.array([1, 5, 9]), rng.normal(size=(3, 3))), 7: (np.zeros(0, dtype=np.int64), np.zeros((0, 3))), 3: (np.arange(1000), rng.normal(size=(1000, 3)))}
+    decoded = freeze.decodeTargets(freeze.encodeTargets(targets))
+    assert sorted(decoded.keys()) == [0, 3, 7]
+    for i, (indices, values) in targets.items():
+        np.testing.assert_array_equal(decoded[i][0], indices)
+        np.testing.assert_array_equal(decoded[i][1], values)
+
+
+def test_emptySnapshot():
+    assert freeze.decodeTargets(freeze.encodeTargets({})) == {}
+
+
+def test_snapshotKeys():
+    targets = {0: (np.array([1, 2]), np.array([[1.0, 0.0, 0.0], [0.0, 2.0, 0.0]])), 1: (np.array([2, 4]), np.array([[0.0, 3.0, 0.0], [0.0, 0.0, 4.0]]))}
+    keys = freeze.snapshotKeys({'pairs': {5.0: (0, 1)}, 'packed': freeze.encodeTargets(targets)}, 6)
+    indices, values = keys[5.0]
+    np.testing.assert_array_equal(indices, [1, 2, 4])
+    np.testing.assert_array_equal(values, [[-1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 4.0]])
@@ -0,0 +1,32 @@
+# Shape Animation Tool - Updated for Maya 2025 / Python 3
+import numpy as np
+
+from sat import ingest
+
+
+def test_sparseDetectedByStructure():
+    assert ingest.isSparse((np.array([1, 4]), np.ones((2, 3))))
+    assert ingest.isSparse([[1, 4], [[0.1, 0.2, 0.3], [0.0, 0.0, 1.0]]])
+    assert ingest.isSparse((np.array([3], dtype=np.uint32), [(1.0, 2.0, 3.0)]))
+    assert ingest.isSparse(([], np.zeros((0, 3))))
+
+
+def test_pointsAreNotSparse():
+    assert not ingest.isSparse(np.zeros((2, 3)))
+    assert not ingest.isSparse([[0.0, 1.0, 2.0], [3.0, 4.0, 5.0]])
+    assert not ingest.isSparse([(0, 0, 0), (1, 1, 1)])
+    assert not ingest.isSparse(tuple(np.zeros((5, 3))))
+    assert not ingest.isSparse((np.array([1, 2]), np.ones((3, 3))))
+
+
+def test_flatValuesAreSparse():
+    assert ingest.isSparse((np.array([1, 4]), [0.1, 0.2, 0.3, 0.0, 0.0, 1.0]))
+    assert ingest.isSparse(([2, 5], np.ones(6)))
+    assert not ingest.isSparse(([2, 5], np.ones(5)))
+
+
+def test_singleIndexIsSparse():
+    assert ingest.isSparse((7, (0.1, 0.2, 0.3)))
+    assert ingest.isSparse((np.int64(7), np.ones((1, 3))))
+    assert ingest.isSparse(([7], [0.1, 0.2, 0.3]))
+    assert not ingest.isSparse((7.0, (0.1, 0.2, 0.3)))
@@ -0,0 +1,49 @@
+# Shape Animation Tool - Updated for Maya 2025 / Python 3
+import os
+import time
+
+import numpy as np
+
+from sat import library
+
+
+def makeLibrary(root):
+    shapes = library.Library(str(root))
+    rest = np.random.default_rng(11).normal(size=(30, 3))
+    triangles = np.array([[0, 1, 2], [2, 3, 4]])
+    entry = shapes.addShape('smile', np.array([1, 4]), np.ones((2, 3)), 'topo', rest, triangles)
+    return (shapes, entry['id'])
+
+
+def wait(queue):
+    for _ in range(200):
+        if len(queue.futures) == 0 or all(f.done() for f in queue.futures.values()):
+            return queue.ready()
+        time.sleep(0.01)
+
+    return queue.ready()
+
+
+def test_rerenderDoesNotCountTwice(tmp_path):
+    shapes, shapeId = makeLibrary(tmp_path)
+    shapes.makeThumbnail(shapeId)
+    shapes.makeThumbnail(shapeId)
+    assert shapes.thumbnailUsage == os.path.getsize(shapes.thumbnailPath(shapeId))
+
+
+def test_failedThumbnailIsNotRequestedAgain(tmp_path):
+    shapes, shapeId = makeLibrary(tmp_path)
+    os.remove(os.path.join(str(tmp_path), 'shapes', shapeId + '.npz'))
+    queue = library.ThumbnailQueue(shapes)
+    queue.request([shapeId, 'missing'])
+    assert sorted(wait(queue)) == sorted([(shapeId, None), ('missing', None)])
+    queue.request([shapeId, 'missing'])
+    assert len(queue.futures) == 0
+
+
+def test_queueRendersThumbnail(tmp_path):
+    shapes, shapeId = makeLibrary(tmp_path)
+    queue = library.ThumbnailQueue(shapes)
+    queue.request([shapeId])
+    assert wait(queue) == [(shapeId, shapes.thumbnailPath(shapeId))]
+    assert shapes.cachedThumbnail(shapeId) == shapes.thumbnailPath(shapeId)
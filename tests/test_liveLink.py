@@ -0,0 +1,102 @@
+# Shape Animation Tool - Updated for Maya 2025 / Python 3
+import numpy as np
+import pytest
+
+from sat import liveLink
+from sat import liveLinkProtocol as protocol
+
+
+def stream():
+    return [protocol.encode('body_LR1', 10.0, [3, 1], [(1.0, 2.0, 3.0), (4.0, 5.0, 6.0)], sent=1.5), protocol.encode('ns:face_LR2', 12.5, [0], [0.25, 0.5, 0.75], add=True, double=True), protocol.encode('body_LR1', 11.0, [], [])]
+
+
+def test_readerSplitsAnyChunking():
+    data = b''.join(stream())
+    for chunk in (1, 7, len(data)):
+        reader = protocol.FrameReader()
+        messages = []
+        for start in range(0, len(data), chunk):
+            messages.extend(reader.feed(data[start:start + chunk]))
+
+        assert [(m.layer, m.time, m.add) for m in messages] == [('body_LR1', 10.0, False), ('ns:face_LR2', 12.5, True), ('body_LR1', 11.0, False)]
+        assert list(messages[0].indices) == [3, 1]
+        assert list(messages[0].values) == [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
+        assert messages[0].sent == 1.5
+        assert messages[1].values.typecode == 'd'
+        assert sum(m.size for m in messages) == len(data)
+        assert len(reader.buffer) == 0
+
+
+def test_readerRejectsOtherStreams():
+    with pytest.raises(protocol.ProtocolError):
+        protocol.FrameReader().feed(b'GET / HTTP/1.1\r\n' + b'\0' * protocol.header.size)
+
+
+def test_encodeChecksValueCount():
+    with pytest.raises(protocol.ProtocolError):
+        protocol.encode('body_LR1', 1.0, [0, 1], [(1.0, 2.0, 3.0)])
+
+
+def message(data):
+    return protocol.FrameReader().feed(data)[0]
+
+
+def test_coalescerSumsAddsAfterReplace():
+    coalescer = liveLink.Coalescer()
+    coalescer.add(message(protocol.encode('body_LR1', 1.0, [0, 2], [(1.0, 1.0, 1.0), (2.0, 2.0, 2.0)], sent=1.0)))
+    coalescer.add(message(protocol.encode('body_LR1', 1.0, [2, 5], [(0.5, 0.5, 0.5), (1.0, 0.0, 0.0)], add=True, sent=2.0)))
+    coalescer.add(message(protocol.encode('body_LR1', 2.0, [4], [(3.0, 3.0, 3.0)], add=True, sent=3.0)))
+    assert len(coalescer) == 2
+    updates = coalescer.take()
+    assert len(coalescer) == 0
+    add, indices, values, stamps = updates[('body_LR1', 1.0)]
+    assert add is False
+    np.testing.assert_array_equal(indices, [0, 2, 5])
+    np.testing.assert_allclose(values, [[1.0, 1.0, 1.0], [2.5, 2.5, 2.5], [1.0, 0.0, 0.0]])
+    assert stamps == [1.0, 2.0]
+    add, indices, values, _ = updates[('body_LR1', 2.0)]
+    assert add is True
+    assert indices.dtype == np.int64 and values.dtype == np.float64
+
+
+def test_coalescerReplaceDropsEarlierMessages():
+    coalescer = liveLink.Coalescer()
+    coalescer.add(message(protocol.encode('body_LR1', 1.0, [0], [(1.0, 1.0, 1.0)], sent=1.0)))
+    coalescer.add(message(protocol.encode('body_LR1', 1.0, [1], [(2.0, 0.0, 0.0)], add=True, sent=2.0)))
+    coalescer.add(message(protocol.encode('body_LR1', 1.0, [7], [(0.0, 0.0, 9.0)], sent=3.0)))
+    add, indices, values, stamps = coalescer.take()[('body_LR1', 1.0)]
+    assert add is False
+    np.testing.assert_array_equal(indices, [7])
+    np.testing.assert_allclose(values, [[0.0, 0.0, 9.0]])
+    assert stamps == [1.0, 2.0, 3.0]
+
+
+def test_heldLayerWaitsForRelease():
+    flushed = []
+    server = liveLink.Server(port=0, apply=lambda updates: (dict((layer, [t]) for layer, t in updates), []), schedule=lambda fn: flushed.append(fn()))
+    server.receive(protocol.FrameReader().feed(protocol.encode('body_LR1', 1.0, [0], [(1.0, 0.0, 0.0)])))
+    assert flushed == [{'body_LR1': [1.0]}]
+    server.hold('body_LR1')
+    server.receive(protocol.FrameReader().feed(protocol.encode('body_LR1', 2.0, [0], [(1.0, 0.0, 0.0)]) + protocol.encode('face_LR1', 2.0, [0], [(1.0, 0.0, 0.0)])))
+    assert flushed[-1] == {'face_LR1': [2.0]}
+    server.receive(protocol.FrameReader().feed(protocol.encode('body_LR1', 2.0, [1], [(0.0, 1.0, 0.0)], add=True)))
+    assert len(flushed) == 2
+    server.release('body_LR1')
+    assert flushed[-1] == {'body_LR1': [2.0]}
+
+
+def test_releaseKeepsOrderOfHeldAndNewMessages():
+    coalescer = liveLink.Coalescer()
+    coalescer.add(message(protocol.encode('body_LR1', 1.0, [0], [(1.0, 0.0, 0.0)])))
+    newer = liveLink.Coalescer()
+    newer.add(message(protocol.encode('body_LR1', 1.0, [0, 3], [(1.0, 0.0, 0.0), (0.0, 0.0, 2.0)], add=True)))
+    newer.add(message(protocol.encode('face_LR1', 1.0, [2], [(0.0, 1.0, 0.0)])))
+    held = coalescer.split('body_LR1')
+    assert len(coalescer) == 0
+    held.extend(newer)
+    updates = held.take()
+    add, indices, values, _ = updates[('body_LR1', 1.0)]
+    assert add is False
+    np.testing.assert_array_equal(indices, [0, 3])
+    np.testing.assert_allclose(values, [[2.0, 0.0, 0.0], [0.0, 0.0, 2.0]])
+    assert ('face_LR1', 1.0) in updates
@@ -0,0 +1,45 @@
+# Shape Animation Tool - Updated for Maya 2025 / Python 3
+import json
+
+import numpy as np
+import pytest
+
+from sat import quantize
+
+
+def randomTargets(rng):
+    return {0: (np.arange(0, 40, 2), rng.normal(size=(20, 3))), 3: (np.array([5, 7, 9]), rng.normal(size=(3, 3)) * 1e-3), 4: (np.zeros(0, dtype=np.int64), np.zeros((0, 3)))}
+
+
+@pytest.mark.parametrize('bits', [16, 8])
+def test_roundTripWithinHalfStep(bits):
+    rng = np.random.default_rng(1)
+    values = rng.normal(size=(500, 3)) * [1.0, 10.0, 0.01]
+    indices = np.sort(rng.choice(10000, 500, replace=False))
+    target = quantize.encodeTarget(indices, values, bits)
+    decodedIndices, decoded = quantize.decodeTarget(json.loads(json.dumps(target)), bits)
+    np.testing.assert_array_equal(decodedIndices, indices)
+    assert np.all(np.abs(decoded - values) <= np.asarray(target['scale']) * 0.5 + 1e-12)
+
+
+def test_constantAxisIsExact():
+    values = np.array([[1.0, 2.0, 3.0], [1.0, 5.0, 3.0]])
+    target = quantize.encodeTarget([0, 1], values, 8)
+    np.testing.assert_allclose(quantize.decodeTarget(target, 8)[1], values, atol=(5.0 - 2.0) / 255 / 2)
+    assert quantize.decodeTarget(target, 8)[1][:, 0].tolist() == [1.0, 1.0]
+
+
+def test_encodeTargetsStats():
+    targets = randomTargets(np.random.default_rng(2))
+    payload16, stats16 = quantize.encodeTargets(targets, 16)
+    payload8, stats8 = quantize.encodeTargets(targets, 8)
+    assert sorted(json.loads(payload16)['targets'].keys()) == ['0', '3', '4']
+    assert stats8['maxError'] > stats16['maxError'] > 0.0
+    assert stats8['quantizedBytes'] < stats16['quantizedBytes']
+    assert stats16['floatBytes'] == 23 * 32 + 23 * 4
+
+
+@pytest.mark.filterwarnings('ignore::RuntimeWarning')
+def test_badTargetRaises():
+    with pytest.raises(ValueError):
+        quantize.encodeTargets({0: (np.array([0, 1]), np.array([[0.0, 0.0, np.nan], [1.0, 1.0, 1.0]]))}, 16)
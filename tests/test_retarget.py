@@ -0,0 +1,62 @@
+# Shape Animation Tool - Updated for Maya 2025 / Python 3
+import numpy as np
+
+from sat import retarget
+
+
+def grid(size=8):
+    """Return the points and triangles of a flat size x size grid in the XY plane."""
+    x, y = np.meshgrid(np.arange(size, dtype=np.float64), np.arange(size, dtype=np.float64))
+    points = np.stack([x.ravel(), y.ravel(), np.zeros(size * size)], axis=1)
+    triangles = []
+    for row in range(size - 1):
+        for col in range(size - 1):
+            a = row * size + col
+            triangles.append((a, a + 1, a + size))
+            triangles.append((a + 1, a + size + 1, a + size))
+
+    return (points, np.array(triangles, dtype=np.int64))
+
+
+def test_sameMeshMapsToItself():
+    points, triangles = grid()
+    indices, weights, distances = retarget.buildCorrespondence(points, triangles, points)
+    np.testing.assert_allclose(distances, 0.0, atol=1e-12)
+    np.testing.assert_allclose((points[indices] * weights[:, :, None]).sum(axis=1), points, atol=1e-12)
+
+
+def test_closestPointOnSurface():
+    points, triangles = grid()
+    rng = np.random.default_rng(8)
+    inside = rng.uniform(0.0, 7.0, size=(300, 3))
+    inside[:, 2] = rng.normal(size=300)
+    indices, weights, distances = retarget.buildCorrespondence(points, triangles, inside)
+    np.testing.assert_allclose(weights.sum(axis=1), 1.0)
+    assert np.all(weights >= -1e-12)
+    np.testing.assert_allclose(distances, np.abs(inside[:, 2]), atol=1e-9)
+    closest = (points[indices] * weights[:, :, None]).sum(axis=1)
+    np.testing.assert_allclose(closest[:, :2], inside[:, :2], atol=1e-9)
+
+
+def test_transferLinearDeltaIsExact():
+    points, triangles = grid()
+    rng = np.random.default_rng(9)
+    newPoints = rng.uniform(0.0, 7.0, size=(200, 3))
+    newPoints[:, 2] = 0.0
+    indices, weights, _ = retarget.buildCorrespondence(points, triangles, newPoints)
+    field = np.array([[0.5, -1.0, 2.0], [0.25, 0.0, -0.5], [0.0, 0.0, 0.0]])
+    delta = points.dot(field) + [1.0, 2.0, 3.0]
+    np.testing.assert_allclose(retarget.transferDelta(delta, indices, weights), newPoints.dot(field) + [1.0, 2.0, 3.0], atol=1e-9)
+
+
+def test_sparseTransferMatchesDense():
+    points, triangles = grid()
+    rng = np.random.default_rng(10)
+    newPoints = rng.uniform(0.0, 7.0, size=(200, 3))
+    indices, weights, _ = retarget.buildCorrespondence(points, triangles, newPoints)
+    delta = np.zeros_like(points)
+    delta[[9, 10]] = rng.normal(size=(2, 3))
+    result = retarget.transferDelta(delta, indices, weights)
+    dense = np.einsum('mk,mkj->mj', weights, delta[indices])
+    np.testing.assert_allclose(result, dense)
+    assert np.count_nonzero(np.abs(result).max(axis=1)) < len(newPoints) // 2
@@ -0,0 +1,38 @@
+# Shape Animation Tool - Updated for Maya 2025 / Python 3
+import numpy as np
+
+from sat import split
+
+
+def densify(keys, count):
+    result = {}
+    for t, indices, values in keys:
+        delta = np.zeros((count, 3))
+        delta[indices] = values
+        result[t] = delta
+
+    return result
+
+
+def test_normalizeRegionsAddsRest():
+    regions = split.normalizeRegions([('a', np.array([1.0, 0.5, 0.0, 0.0])), ('b', np.array([1.0, 0.0, 0.25, 0.0]))])
+    names = [name for name, _ in regions]
+    assert names == ['a', 'b', 'rest']
+    total = np.sum([mask for _, mask in regions], axis=0)
+    np.testing.assert_allclose(total, 1.0)
+
+
+def test_piecesAddUpToBakedLayer():
+    rng = np.random.default_rng(3)
+    count = 50
+    times = [1.0, 10.0, 20.0]
+    painted = rng.random(count)
+    deltas = [rng.normal(size=(count, 3)) * painted[:, None] for t in times]
+    regions = split.normalizeRegions([('painted', painted)])
+    pieces = [densify(split.regionKeys(times, deltas, mask), count) for _, mask in regions]
+    for t, delta in zip(times, deltas):
+        np.testing.assert_allclose(sum(piece[t] for piece in pieces), delta, atol=1e-4)
+
+
+def test_setMask():
+    np.testing.assert_array_equal(split.setMask(5, [1, 3]), [0, 1, 0, 1, 0])
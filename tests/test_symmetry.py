@@ -0,0 +1,60 @@
+# Shape Animation Tool - Updated for Maya 2025 / Python 3
+import numpy as np
+
+from sat import symmetry
+
+
+def symmetricPoints(rng, half=200):
+    side = rng.normal(size=(half, 3))
+    side[:, 0] = np.abs(side[:, 0]) + 0.1
+    mirrored = side * [-1.0, 1.0, 1.0]
+    center = rng.normal(size=(10, 3))
+    center[:, 0] = 0.0
+    points = np.concatenate([side, mirrored, center])
+    order = rng.permutation(len(points))
+    return points[order]
+
+
+def test_mapPairsMirrorVertices():
+    rest = symmetricPoints(np.random.default_rng(4))
+    symMap = symmetry.buildSymmetryMap(rest)
+    assert np.all(symMap >= 0)
+    np.testing.assert_array_equal(symMap[symMap], np.arange(len(rest)))
+    np.testing.assert_allclose(rest[symMap] * [-1.0, 1.0, 1.0], rest)
+    center = np.flatnonzero(rest[:, 0] == 0.0)
+    np.testing.assert_array_equal(symMap[center], center)
+
+
+def test_unmatchedVertexIsMinusOne():
+    rest = symmetricPoints(np.random.default_rng(5))
+    rest = np.concatenate([rest, [[5.0, 5.0, 5.0]]])
+    symMap = symmetry.buildSymmetryMap(rest)
+    assert symMap[-1] == -1
+    assert np.all(symMap[:-1] >= 0)
+
+
+def test_otherAxis():
+    rest = symmetricPoints(np.random.default_rng(6))[:, [1, 0, 2]]
+    symMap = symmetry.buildSymmetryMap(rest, axis=1)
+    np.testing.assert_allclose(rest[symMap] * [1.0, -1.0, 1.0], rest)
+
+
+def test_mirrorDeltaModes():
+    rng = np.random.default_rng(7)
+    rest = symmetricPoints(rng)
+    symMap = symmetry.buildSymmetryMap(rest)
+    delta = rng.normal(size=rest.shape)
+    flip = np.array([-1.0, 1.0, 1.0])
+    positive = rest[:, 0] > 0
+    negative = rest[:, 0] < 0
+    center = rest[:, 0] == 0
+    plus = symmetry.mirrorDelta(delta, rest, symMap, mode='+')
+    np.testing.assert_array_equal(plus[positive], delta[positive])
+    np.testing.assert_allclose(plus[negative], delta[symMap[negative]] * flip)
+    assert np.all(plus[center, 0] == 0.0)
+    np.testing.assert_allclose(plus[symMap] * flip, plus)
+    minus = symmetry.mirrorDelta(delta, rest, symMap, mode='-')
+    np.testing.assert_array_equal(minus[negative], delta[negative])
+    np.testing.assert_allclose(minus[positive], delta[symMap[positive]] * flip)
+    swapped = symmetry.mirrorDelta(delta, rest, symMap, mode='flip')
+    np.testing.assert_allclose(symmetry.mirrorDelta(swapped, rest, symMap, mode='flip'), delta)
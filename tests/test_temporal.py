@@ -0,0 +1,33 @@
+# Shape Animation Tool - Updated for Maya 2025 / Python 3
+import numpy as np
+import pytest
+
+from sat import temporal
+
+
+@pytest.mark.parametrize('curve', temporal.falloffs)
+def test_fullAtKeyAndNoneBeyondRadius(curve):
+    weights = temporal.falloffWeights([0.0, 4.0, -4.0, 4.5, -20.0], 4.0, curve)
+    assert weights[0] == 1.0
+    assert weights[3] == 0.0 and weights[4] == 0.0
+    assert weights[1] == weights[2]
+
+
+@pytest.mark.parametrize('curve', ['smooth', 'linear'])
+def test_fallsOffMonotonically(curve):
+    offsets = np.linspace(0.0, 6.0, 61)
+    weights = temporal.falloffWeights(offsets, 6.0, curve)
+    assert np.all(np.diff(weights) <= 0.0)
+    assert weights[-1] == 0.0
+    np.testing.assert_allclose(temporal.falloffWeights(-offsets, 6.0, curve), weights)
+
+
+def test_curveShapes():
+    np.testing.assert_allclose(temporal.falloffWeights([2.0], 8.0, 'linear'), [0.75])
+    np.testing.assert_allclose(temporal.falloffWeights([4.0], 8.0, 'smooth'), [0.5])
+    np.testing.assert_allclose(temporal.falloffWeights([2.0], 8.0, 'smooth'), [1.0 - 0.25 * 0.25 * 2.5])
+    np.testing.assert_allclose(temporal.falloffWeights([7.9], 8.0, 'constant'), [1.0])
+
+
+def test_zeroRadiusOnlyKeepsKey():
+    np.testing.assert_allclose(temporal.falloffWeights([0.0, 1.0], 0.0), [1.0, 0.0])
@@ -0,0 +1,18 @@
+# Shape Animation Tool - Updated for Maya 2025 / Python 3
+import maya.cmds as cmds
+
+from sat import utils
+
+
+def test_meshShowsOnceEveryOwnerShowedIt(monkeypatch):
+    calls = []
+    monkeypatch.setattr(cmds, 'setAttr', lambda attr, value: calls.append((attr, value)), raising=False)
+    monkeypatch.setattr(cmds, 'objExists', lambda name: True)
+    utils.hideMesh('body', 'heatmap')
+    utils.hideMesh('body', 'heatmap')
+    utils.hideMesh('body', 'sculpt')
+    utils.showMesh('body', 'heatmap')
+    assert calls == [('body.lodVisibility', False)]
+    utils.showMesh('body', 'scrub')
+    utils.showMesh('body', 'sculpt')
+    assert calls == [('body.lodVisibility', False), ('body.lodVisibility', True)]